@@ -23,10 +23,10 @@ class MiniSATWrapper(SatWrapper):
             A command call list to execute the target algorithm.
         '''
         solver_binary = os.path.join(os.path.dirname(__file__), "minisat")
-        cmd = "%s -rnd-seed=%d" %(solver_binary, runargs["seed"])       
+        cmd = [solver_binary, "-rnd-seed=%d" %(runargs["seed"])]
         for name, value in config.items():
-            cmd += " %s=%s" %(name,  value)
-        cmd += " %s" %(runargs["instance"])        
+            cmd.append("%s=%s" %(name,  value))
+        cmd.append(runargs["instance"])
     
         return cmd
     
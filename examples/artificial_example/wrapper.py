@@ -16,6 +16,7 @@ import math
 import logging
 
 from genericWrapper4AC.generic_wrapper import AbstractWrapper
+from genericWrapper4AC.parsing.output_parser import QualityOutputParser
 
 class ArtWrapper(AbstractWrapper):
     '''
@@ -49,6 +50,12 @@ class ArtWrapper(AbstractWrapper):
         
         return cmd 
     
+    def get_output_parser(self):
+        '''
+        Each printed number is an (intermediate) quality of the target algorithm
+        '''
+        return QualityOutputParser()
+
     def process_results(self, filepointer, exit_code):
         '''
         Parse a results file to extract the run's status (SUCCESS/CRASHED/etc) and other optional results.
@@ -67,22 +74,17 @@ class ArtWrapper(AbstractWrapper):
             ATTENTION: The return values will overwrite the measured results of the runsolver (if runsolver was used). 
         '''
         
-        self.logger.debug("reading solver results from %s" % (filepointer.name))
+        output = self.parse_output(filepointer)
 
         # If solver result file is empty, we also assume a crash
         resultMap = {'status': 'CRASHED',
                      'quality': 1  # assumption minimization
                      }
-        for line in filepointer:
-            try:
-                out_ = str(line.decode('UTF-8')).replace("\n","")
-                return_value = float(out_)
-                resultMap = {'status' : 'SUCCESS',
-                 'quality' : return_value
-                 }
-                return resultMap
-            except ValueError:
-                pass
+        if output.trajectory:
+            # the last printed quality is the final result
+            resultMap = {'status' : 'SUCCESS',
+                         'quality' : output.trajectory[-1][1]
+                         }
 
         return resultMap
 
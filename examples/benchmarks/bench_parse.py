@@ -0,0 +1,75 @@
+'''
+benchmark of the command line parsing of a single wrapper call:
+fast_parse_known_args (single pass) vs. argparse
+on the old (ParamILS) and the new (AClib2) call format
+
+Usage:
+    python examples/benchmarks/bench_parse.py [--number <calls>] [--repeat <repetitions>]
+
+@author:     Marius Lindauer
+@copyright:  2018 ML4AAD. All rights reserved.
+@license:    BSD
+'''
+
+import timeit
+import argparse
+from unittest import mock
+from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter
+
+from genericWrapper4AC.argparser import parse as parse_module
+from genericWrapper4AC.argparser.parse import get_parser, get_extended_parser, \
+    fast_parse_known_args, parse
+
+CALLS = {
+    "ParamILS": ["wrapper.py", "inst.cnf", "SAT", "10.5", "0", "42",
+                 "-rnd-freq", "0", "-var-decay", "'0.5'",
+                 "--mem-limit", "100", "--runsolver-path", "/bin/runsolver"],
+    "AClib2": ["wrapper.py", "--instance", "inst.cnf", "--cutoff", "10.5", "--seed", "42",
+               "--mem-limit", "100", "--runsolver-path", "/bin/runsolver",
+               "--config", "-rnd-freq", "0", "-var-decay", "'0.5'"],
+}
+
+
+def argparse_parse_known_args(parser, arg_strings, new_format):
+    '''
+        what parse() does without the fast path
+    '''
+    if new_format:
+        parser = get_extended_parser(parser=ArgumentParser(
+            parents=[parser], formatter_class=ArgumentDefaultsHelpFormatter,
+            allow_abbrev=False, add_help=False))
+    return parser.parse_known_args(arg_strings)
+
+
+def measure(func, number: int, repeat: int):
+    '''
+        best time per call in microseconds
+    '''
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def main():
+    cmd_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    cmd_parser.add_argument("--number", default=1000, type=int, help="calls per repetition")
+    cmd_parser.add_argument("--repeat", default=5, type=int, help="repetitions (the best one is reported)")
+    args = cmd_parser.parse_args()
+
+    parser = get_parser()
+    print("%-10s %-22s %12s %12s %8s" % ("format", "function", "argparse", "fast path", "speedup"))
+    for name, call in CALLS.items():
+        new_format = "--config" in call
+        slow = measure(lambda: argparse_parse_known_args(parser, call[1:], new_format),
+                       args.number, args.repeat)
+        fast = measure(lambda: fast_parse_known_args(parser, call[1:], new_format=new_format),
+                       args.number, args.repeat)
+        print("%-10s %-22s %10.1fus %10.1fus %7.1fx" % (name, "parse_known_args", slow, fast, slow / fast))
+
+        # complete parse() into Data (as in AbstractWrapper.main)
+        with mock.patch.object(parse_module, "fast_parse_known_args", return_value=None):
+            slow = measure(lambda: parse(cmd_arguments=call, parser=parser), args.number, args.repeat)
+        fast = measure(lambda: parse(cmd_arguments=call, parser=parser), args.number, args.repeat)
+        print("%-10s %-22s %10.1fus %10.1fus %7.1fx" % (name, "parse", slow, fast, slow / fast))
+
+
+if __name__ == "__main__":
+    main()
@@ -30,7 +30,7 @@ class DummyWrapper(AbstractWrapper):
         '''
         '''
         runargs.update(config)
-        return "echo '" + json.dumps(runargs) + "'"
+        return ["echo", json.dumps(runargs)]
     
     def process_results(self, filepointer, exit_code):
         '''
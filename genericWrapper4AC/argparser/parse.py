@@ -6,12 +6,17 @@
 
 
 import os
+import re
 import typing
 import genericWrapper4AC
 
-from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter, SUPPRESS
+from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter, ArgumentTypeError, SUPPRESS, Namespace
+from argparse import _StoreAction, _StoreTrueAction, _StoreFalseAction, _StoreConstAction, _AppendAction, \
+    _HelpAction, _VersionAction
 
 from genericWrapper4AC.data.data import Data
+from genericWrapper4AC.data.request import RunRequest
+from genericWrapper4AC.data.result import RESULT_FORMATS
 
 
 def get_parser():
@@ -28,6 +33,9 @@ def get_parser():
                         0], "binaries", "runsolver"), help="path to runsolver binary (if None, the runsolver is deactivated)")
     parser.add_argument("--temp-file-dir", dest="tmp_dir", default=None,
                         help="directory for temporary files of runsolver (relative to -exec-dir in SMAC scenario)")
+    parser.add_argument("--runsolver-var-file", dest="runsolver_var_file", default=False, action="store_true",
+                        help="let the runsolver write its variable file (-v) and read times, memory "
+                             "and limit violations from it instead of from the human-readable watcher file")
     parser.add_argument("--mem-limit", dest="mem_limit",
                         default=3072, type=int, help="memory limit in MB")
     parser.add_argument("--max_quality", dest="max_quality", default=None,
@@ -35,6 +43,79 @@ def get_parser():
     parser.add_argument("--overwrite_cost_runtime", dest="overwrite_cost_runtime", default=False,
                         action="store_true",
                         help="overwrite cost field with runtime field")
+    parser.add_argument("--result-file", dest="result_file", default=None,
+                        help="additionally write the result (AClib format) to this file")
+    parser.add_argument("--result-fd", dest="result_fd", default=None, type=int,
+                        help="additionally write the result (AClib format) to this (inherited) file descriptor")
+    parser.add_argument("--result-format", dest="result_format", default="json", choices=RESULT_FORMATS,
+                        help="encoding of --result-file and --result-fd; "
+                             "msgpack requires the package msgpack")
+    parser.add_argument("--daemon-socket", dest="daemon_socket", default=None,
+                        help="serve runs on this unix socket instead of executing a single run; "
+                             "use genericWrapper4AC.daemon.client as call string of the configurator")
+    parser.add_argument("--batch-file", dest="batch_file", default=None,
+                        help="file with one run per line as JSON object "
+                             "(keys: instance, seed, cutoff, config and optionally specifics, runlength); "
+                             "the runs are executed in parallel and their results are printed as JSON lines")
+    parser.add_argument("--batch-workers", dest="batch_workers", default=None, type=int,
+                        help="number of parallel runs in batch mode "
+                             "(default: limited by the number of cores and by the memory limit)")
+    parser.add_argument("--limit-backend", dest="limit_backend", default="runsolver",
+                        choices=["runsolver", "cgroup"],
+                        help="enforce the cutoff and the memory limit with runsolver or with a cgroup v2 "
+                             "(limits the resident instead of the virtual memory; "
+                             "falls back to runsolver if no cgroup is delegated to the wrapper)")
+    parser.add_argument("--reap-orphans", dest="reap_orphans", default=False, action="store_true",
+                        help="make the wrapper the subreaper of the target algorithm (Linux only) "
+                             "such that processes which escaped its process group are killed, too")
+    parser.add_argument("--fork-server", dest="fork_server", default=False, action="store_true",
+                        help="(daemon and batch mode) call the prepare() hook of the wrapper once in a template process "
+                             "and execute each run in a fork of it (without runsolver; the limits of the process tree "
+                             "are enforced by sampling /proc)")
+    parser.add_argument("--cores-per-run", dest="cores_per_run", default=None, type=int,
+                        help="bind each run to this many cores; the cores are allocated such that "
+                             "concurrent runs on the same machine get disjoint cores (default: no binding)")
+    parser.add_argument("--core-lock-dir", dest="core_lock_dir", default=None,
+                        help="directory of the lock files used to allocate cores; "
+                             "has to be the same for all wrappers on a machine (default: <tmp>/gw4ac-cores-<uid>)")
+    parser.add_argument("--core-wait-timeout", dest="core_wait_timeout", default=600, type=float,
+                        help="maximal waiting time in seconds for free cores (see --cores-per-run); "
+                             "afterwards, the run is reported as ABORT")
+    parser.add_argument("--tail-solver-output", dest="tail_output", default=False, action="store_true",
+                        help="parse the solver output while the target algorithm is running "
+                             "(only for wrappers using parse_output() in process_results())")
+    parser.add_argument("--stop-if-worse-than", dest="stop_bounds", default=None,
+                        type=parse_stop_bound, action="append", metavar="<cost>@<time>",
+                        help="terminate the run if the best quality reported so far is worse than <cost> "
+                             "after <time> wallclock seconds (implies --tail-solver-output; can be given several times)")
+    parser.add_argument("--log-capture", dest="log_capture", default="disk", choices=["disk", "bounded", "shm"],
+                        help="disk: write the logs of runsolver and target algorithm to --temp-file-dir; "
+                             "bounded: read the target algorithm output from a FIFO in --temp-file-dir "
+                             "into a bounded buffer; shm: as bounded, but in /dev/shm "
+                             "(bounded logs are written to the working directory only for ABORT/CRASHED runs)")
+    parser.add_argument("--log-buffer-size", dest="log_buffer_size", default=4, type=int,
+                        help="(--log-capture bounded/shm) keep only the last MB of the target algorithm output "
+                             "(plus --log-head-size MB and the lines matching the patterns of the output parser)")
+    parser.add_argument("--log-head-size", dest="log_head_size", default=1, type=int,
+                        help="(--log-capture bounded/shm) keep the first MB of the target algorithm output")
+    parser.add_argument("--log-compression", dest="log_compression", default="none",
+                        choices=["none", "gzip", "zstd"],
+                        help="compress preserved logs of ABORT/CRASHED runs; zstd requires the package zstandard")
+    parser.add_argument("--report-timings", dest="report_timings", default=False, action="store_true",
+                        help="report the durations of the phases of the wrapper "
+                             "(start-up, argument parsing, ..., cleanup) in the AClib2 result as 'timings'")
+    parser.add_argument("--timing-histogram", dest="timing_histogram", default=None,
+                        help="add the durations of the phases of each run to this histogram file (JSON); "
+                             "can be shared by concurrent wrappers")
+    parser.add_argument("--run-cache-dir", dest="run_cache_dir", default=None,
+                        help="cache results of runs in this directory and answer repeated runs from the cache "
+                             "(requires --deterministic)")
+    parser.add_argument("--deterministic", dest="deterministic", default=False, action="store_true",
+                        help="the target algorithm is deterministic for a given seed, "
+                             "i.e., its results can be cached (see --run-cache-dir)")
+    parser.add_argument("--seed-independent", dest="seed_independent", default=False, action="store_true",
+                        help="(--run-cache-dir) the target algorithm ignores the seed, "
+                             "i.e., cached results are shared across seeds")
     # deactivate -h such that 'h' can be a parameter of the target algorithm
     parser.add_argument('--help', action='help', default=SUPPRESS,
                         help='Show this help message and exit.')
@@ -42,6 +123,21 @@ def get_parser():
     return parser
 
 
+def parse_stop_bound(bound: str):
+    '''
+        parses a bound "<cost>@<time>" of --stop-if-worse-than
+
+        Returns
+        -------
+        (cost: float, time: float)
+    '''
+    try:
+        cost, time = bound.split("@")
+        return float(cost), float(time)
+    except ValueError:
+        raise ArgumentTypeError("bound has to be of the form <cost>@<time>: %s" % (bound))
+
+
 def get_extended_parser(parser:ArgumentParser):
     '''
         Extends the parser created in get_parser by optional arguments supported 
@@ -78,27 +174,201 @@ def parse(cmd_arguments: typing.List[str], parser:ArgumentParser):
             required for backward compatibility
     '''
 
-    new_format = False
-    if "--config" in cmd_arguments:
-        new_format = True
-        parser = get_extended_parser(parser=parser)
+    new_format = "--config" in cmd_arguments
 
-    main_args, target_args = parser.parse_known_args(cmd_arguments[1:])
+    parsed = fast_parse_known_args(parser=parser, arg_strings=cmd_arguments[1:],
+                                   new_format=new_format)
+    if parsed is not None:
+        main_args, target_args = parsed
+    else:
+        # --help, errors and unusual options are handled by argparse
+        if new_format:
+            # extend a copy such that <parser> can be reused for further calls
+            parser = get_extended_parser(parser=ArgumentParser(
+                parents=[parser], formatter_class=ArgumentDefaultsHelpFormatter,
+                allow_abbrev=False, add_help=False))
+        main_args, target_args = parser.parse_known_args(cmd_arguments[1:])
 
     if new_format:
         d = parse_config_new(main_args=main_args, target_args=target_args)
     else:
         d = parse_config_old(main_args=main_args, target_args=target_args)
 
+    set_call_arguments(d=d, main_args=main_args)
+
+    d.new_format = new_format
+
+    return d, main_args
+
+
+# argparse actions supported by fast_parse_known_args
+# (--help and --version are passed to argparse)
+FAST_ACTIONS = (_StoreAction, _StoreTrueAction, _StoreFalseAction, _StoreConstAction, _AppendAction,
+                _HelpAction, _VersionAction)
+
+# arguments of get_extended_parser (see _get_fast_actions)
+_EXTENDED_ACTIONS = None
+
+NEGATIVE_NUMBER = re.compile(r"^-\d+$|^-\d*\.\d+$")
+
+
+def _get_fast_actions(parser: ArgumentParser, new_format: bool):
+    '''
+        returns a dictionary option string -> argparse action
+        of all options of <parser> (and of get_extended_parser if <new_format>)
+        or None if <parser> has arguments not supported by fast_parse_known_args;
+        cached in the parser until arguments are added
+    '''
+    global _EXTENDED_ACTIONS
+
+    cache = getattr(parser, "_gw4ac_fast_actions", None)
+    if cache is not None and cache[0] == len(parser._actions):
+        return cache[1][new_format]
+
+    if _EXTENDED_ACTIONS is None:
+        _EXTENDED_ACTIONS = get_extended_parser(ArgumentParser(add_help=False))._actions
+
+    tables = {}
+    for extended in [False, True]:
+        table = {}
+        actions = parser._actions + (_EXTENDED_ACTIONS if extended else [])
+        for action in actions:
+            if not action.option_strings or action.required or \
+                    type(action) not in FAST_ACTIONS or \
+                    (type(action) in (_StoreAction, _AppendAction) and action.nargs is not None):
+                table = None
+                break
+            for option_string in action.option_strings:
+                table[option_string] = action
+        tables[extended] = table
+    parser._gw4ac_fast_actions = (len(parser._actions), tables)
+    return tables[new_format]
+
+
+def fast_parse_known_args(parser: ArgumentParser, arg_strings: typing.List[str], new_format: bool):
+    '''
+        single-pass replacement of parser.parse_known_args(arg_strings)
+        for the options of get_parser() (and of get_extended_parser() if <new_format>);
+        returns None if argparse has to be used instead,
+        e.g., for --help, --opt=value, missing values or invalid values
+
+        Arguments
+        ---------
+        parser: ArgumentParser
+            parser (from get_*parser()); its actions are introspected
+        arg_strings: typing.List[str]
+            command line arguments (without the name of the script)
+        new_format: bool
+            new AClib2 call format
+
+        Returns
+        -------
+        (main_args: Namespace, target_args: typing.List[str]) or None
+    '''
+    actions = _get_fast_actions(parser=parser, new_format=new_format)
+    if actions is None or not parser.prefix_chars == "-":
+        return None
+
+    values = {}
+    target_args = []
+    n_args = len(arg_strings)
+    i = 0
+    while i < n_args:
+        arg = arg_strings[i]
+        i += 1
+        action = actions.get(arg)
+        if action is None:
+            if arg == "--" or (arg[:1] == "-" and "=" in arg and arg.split("=", 1)[0] in actions):
+                return None
+            if parser.allow_abbrev and arg[:2] == "--" and \
+                    any(option.startswith(arg) for option in actions):
+                return None
+            target_args.append(arg)
+            continue
+
+        action_type = type(action)
+        if action_type in (_HelpAction, _VersionAction):
+            return None
+        elif action_type is _StoreTrueAction:
+            values[action.dest] = True
+        elif action_type is _StoreFalseAction:
+            values[action.dest] = False
+        elif action_type is _StoreConstAction:
+            values[action.dest] = action.const
+        else:  # _StoreAction, _AppendAction
+            if i == n_args or _is_option(arg_strings[i]):
+                return None
+            value = arg_strings[i]
+            i += 1
+            try:
+                if action.type is not None:
+                    value = action.type(value)
+            except (TypeError, ValueError, ArgumentTypeError):
+                return None
+            if action.choices is not None and value not in action.choices:
+                return None
+            if action_type is _AppendAction:
+                values.setdefault(action.dest, list(getattr(action, "default", None) or [])).append(value)
+            else:
+                values[action.dest] = value
+
+    main_args = Namespace()
+    for action in dict.fromkeys(actions.values()):
+        if action.dest in values:
+            setattr(main_args, action.dest, values[action.dest])
+        elif action.default is not SUPPRESS:
+            default = action.default
+            # as argparse: string defaults are converted
+            if isinstance(default, str) and action.type is not None:
+                default = action.type(default)
+            setattr(main_args, action.dest, default)
+    for dest, default in parser._defaults.items():
+        if not hasattr(main_args, dest):
+            setattr(main_args, dest, default)
+
+    return main_args, target_args
+
+
+def _is_option(arg: str):
+    '''
+        True if argparse would not accept <arg> as value of an option
+    '''
+    return arg[:1] == "-" and len(arg) > 1 and not NEGATIVE_NUMBER.match(arg) and " " not in arg
+
+
+def set_call_arguments(d: Data, main_args):
+    '''
+        copies the general arguments (see get_parser) into a Data object
+
+        Arguments
+        --------
+        d: ~genericWrapper4AC.data.data.Data
+        main_args: Namespace
+            arguments parsed by argparse
+    '''
+
     d.runsolver = main_args.runsolver
+    d.runsolver_var_file = main_args.runsolver_var_file
     d.tmp_dir = main_args.tmp_dir
     d.mem_limit = main_args.mem_limit
     if main_args.max_quality is not None:
         d.max_quality = main_args.max_quality
-
-    d.new_format = new_format
-
-    return d, main_args
+    d.cores_per_run = main_args.cores_per_run
+    d.core_lock_dir = main_args.core_lock_dir
+    d.core_wait_timeout = main_args.core_wait_timeout
+    d.tail_output = main_args.tail_output
+    d.stop_bounds = main_args.stop_bounds or []
+    d.run_cache_dir = main_args.run_cache_dir
+    d.deterministic = main_args.deterministic
+    d.seed_independent = main_args.seed_independent
+    d.limit_backend = main_args.limit_backend
+    d.reap_orphans = main_args.reap_orphans
+    d.log_capture = main_args.log_capture
+    d.log_buffer_size = main_args.log_buffer_size
+    d.log_head_size = main_args.log_head_size
+    d.log_compression = main_args.log_compression
+    d.report_timings = main_args.report_timings
+    d.timing_histogram = main_args.timing_histogram
 
 
 def parse_config_old(main_args, target_args: typing.List[str]):
@@ -123,14 +393,11 @@ def parse_config_old(main_args, target_args: typing.List[str]):
     d.instance = target_args[0]
     d.specifics = target_args[1]
     # runsolver only rounds down to integer
-    d.cutoff = int(float(target_args[2]) + 1 - 1e-10)
-    d.cutoff = min(d.cutoff, 2**31 - 1)  # at most 32bit integer supported
+    d.cutoff = round_cutoff(target_args[2])
     d.time = d.cutoff
     d.runlength = int(target_args[3])
     d.seed = int(target_args[4])
-    d.config = target_args[5:]
-    d.config = dict((name, value.strip("'"))
-                    for name, value in zip(d.config[::2], d.config[1::2]))
+    d.config = parse_config_args(target_args[5:])
 
     return d
 
@@ -157,13 +424,88 @@ def parse_config_new(main_args, target_args: typing.List[str]):
     d.instance = main_args.instance
     # runsolver only rounds down to integer
     if main_args.cutoff is not None:
-        d.cutoff = int(main_args.cutoff + 1 - 1e-10)
-        d.cutoff = min(d.cutoff, 2**31 - 1)  # at most 32bit integer supported
+        d.cutoff = round_cutoff(main_args.cutoff)
         d.time = d.cutoff
     d.seed = main_args.seed
 
-    d.config = target_args[target_args.index("--config") + 1:]
-    d.config = dict((name, value.strip("'"))
-                    for name, value in zip(d.config[::2], d.config[1::2]))
+    d.config = parse_config_args(target_args[target_args.index("--config") + 1:])
+
+    return d
+
+
+def round_cutoff(cutoff):
+    '''
+        rounds the cutoff up to an integer (since runsolver only supports integers)
+        and limits it to a 32bit integer
+    '''
+    return min(int(float(cutoff) + 1 - 1e-10), 2**31 - 1)
+
+
+def parse_config_args(config_args: typing.List[str]):
+    '''
+        converts a list of parameter names and values
+        (e.g., ["-a", "1", "-b", "'x'"]) into a dictionary
+    '''
+    return dict((name, value.strip("'"))
+                for name, value in zip(config_args[::2], config_args[1::2]))
+
+
+def parse_run_dict(run: dict, main_args=None, template: Data = None):
+    '''
+        creates Data() object from a dictionary describing a single run,
+        e.g., a line of a batch file, and the global arguments parsed by argparse
+
+        Arguments
+        --------
+        run: dict
+            keys: instance, seed, cutoff, config (dict),
+            specifics and runlength (optional)
+        main_args: Namespace
+            arguments parsed by argparse
+        template: ~genericWrapper4AC.data.data.Data
+            alternative to <main_args>: Data object with the call arguments
+            (see get_run_template); faster for many runs
+
+        Returns
+        -------
+        d: ~genericWrapper4AC.data.data.Data
+    '''
+
+    if template is None:
+        template = get_run_template(main_args)
+
+    cutoff = run.get("cutoff")
+    seed = run.get("seed")
+    request = RunRequest(
+        instance=run.get("instance"),
+        specifics=run.get("specifics", "0"),
+        # runsolver only rounds down to integer
+        cutoff=None if cutoff is None else round_cutoff(cutoff),
+        runlength=int(run.get("runlength", 0)),
+        seed=None if seed is None else int(seed),
+        config=[(name, str(value).strip("'")) for name, value in run.get("config", {}).items()])
+
+    return template.copy(request=request)
+
+
+def get_run_template(main_args):
+    '''
+        creates a Data() object holding only the global arguments parsed by argparse;
+        copies of it (see Data.copy) describe single runs (see parse_run_dict)
+
+        Arguments
+        --------
+        main_args: Namespace
+            arguments parsed by argparse
+
+        Returns
+        -------
+        d: ~genericWrapper4AC.data.data.Data
+    '''
+    d = Data()
+    set_call_arguments(d=d, main_args=main_args)
+
+    # results are reported in the AClib2 format
+    d.new_format = True
 
     return d
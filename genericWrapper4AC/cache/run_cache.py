@@ -0,0 +1,151 @@
+'''
+cache of run results for deterministic target algorithms
+
+A run is identified by the wrapper, instance (+ specifics), configuration,
+seed (unless the target algorithm ignores it), runlength, memory limit,
+limit backend (runsolver limits the virtual memory, cgroups the resident memory)
+and the wrapper-specific options changing the result (e.g., the verification of the output).
+The cutoff is not part of the key; instead:
+  * a SUCCESS with a runtime of at most the requested cutoff answers the request
+    (e.g., a SUCCESS under a smaller cutoff answers a larger cutoff)
+  * a TIMEOUT at a cutoff of at least the requested cutoff answers the request
+    (e.g., a TIMEOUT at a larger cutoff answers a smaller cutoff)
+    with the requested cutoff as runtime
+  * a memory out (reported as TIMEOUT) with a runtime below the requested cutoff
+    answers the request with its own runtime
+All other results (CRASHED, ABORT, ...) are never cached.
+If the database cannot be read or written, the run is executed (or reported) without the cache.
+
+@author:     Marius Lindauer
+@copyright:  2018 ML4AAD. All rights reserved.
+@license:    BSD
+'''
+
+import os
+import json
+import hashlib
+import logging
+import sqlite3
+from contextlib import closing
+
+from genericWrapper4AC.data.data import Data
+
+
+class RunCache(object):
+    '''
+        run results stored in an sqlite database
+    '''
+
+    def __init__(self, cache_dir: str, seed_independent: bool = False,
+                 namespace: str = "", options: dict = None):
+        '''
+            Arguments
+            ---------
+            cache_dir: str
+                directory of the database (created if missing)
+            seed_independent: bool
+                if True, the seed is ignored, i.e., results are shared across seeds
+            namespace: str
+                separates the results of different target algorithms (e.g., name of the wrapper)
+            options: dict
+                options changing the result of a run (see AbstractWrapper.get_cache_options)
+
+            Raises
+            ------
+            sqlite3.Error or OSError if the database cannot be created
+        '''
+        self.logger = logging.getLogger("RunCache")
+        os.makedirs(cache_dir, exist_ok=True)
+        self.db_file = os.path.join(cache_dir, "runs.sqlite")
+        self.seed_independent = seed_independent
+        self.namespace = namespace
+        self.options = {} if options is None else options
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS runs "
+                         "(key TEXT, cutoff REAL, status TEXT, cost REAL, "
+                         "time REAL, additional TEXT, exit_code INTEGER, memout INTEGER)")
+            conn.execute("CREATE INDEX IF NOT EXISTS runs_key ON runs (key)")
+            # databases of older versions
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(runs)")]
+            if "memout" not in columns:
+                conn.execute("ALTER TABLE runs ADD COLUMN memout INTEGER DEFAULT 0")
+
+    def _connect(self):
+        '''
+            new connection to the database;
+            used as "with closing(self._connect()) as conn, conn:"
+            (the connection itself only commits or rolls back the transaction)
+        '''
+        return sqlite3.connect(self.db_file, timeout=60)
+
+    def get_key(self, data: Data):
+        '''
+            key of the run described by <data> (without cutoff)
+        '''
+        key = {"namespace": self.namespace,
+               "instance": data.instance,
+               "specifics": data.specifics,
+               "config": sorted((str(name), str(value)) for name, value in dict(data.config).items()),
+               "seed": None if self.seed_independent else data.seed,
+               "runlength": data.runlength,
+               "mem_limit": data.mem_limit,
+               "limit_backend": data.limit_backend,
+               "options": sorted((str(name), str(value)) for name, value in self.options.items())}
+        return hashlib.sha1(json.dumps(key, sort_keys=True).encode("utf8")).hexdigest()
+
+    def lookup(self, data: Data):
+        '''
+            looks for a result answering the run described by <data>
+            and writes it into <data>
+
+            Returns
+            -------
+            True if a result was found (False if the database cannot be read)
+        '''
+        cutoff = float("inf") if data.cutoff is None else data.cutoff
+        try:
+            with closing(self._connect()) as conn, conn:
+                row = conn.execute(
+                    "SELECT status, cost, time, additional, exit_code, memout FROM runs WHERE key = ? AND "
+                    "((status = 'SUCCESS' AND time <= ?) OR (status = 'TIMEOUT' AND "
+                    "(cutoff >= ? OR (memout AND time < ?)))) "
+                    "ORDER BY status = 'SUCCESS' DESC, rowid DESC LIMIT 1",
+                    (self.get_key(data), cutoff, cutoff, cutoff)).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            self.logger.warning("Cannot read the run cache %s: %s" % (self.db_file, e))
+            return False
+        if row is None:
+            return False
+
+        data.status, data.cost, data.time, data.additional, data.exit_code, memout = row
+        # a memory out before the requested cutoff happens again
+        data.memout = bool(memout) and data.time < cutoff
+        if memout and not data.memout:
+            # ... but not before a smaller cutoff
+            data.additional = data.additional.replace(" memory limit was exceeded", "")
+        if data.status == "TIMEOUT" and not data.memout and data.cutoff is not None:
+            # the runtime is capped by the (smaller) requested cutoff
+            if data.cost == data.time:
+                data.cost = data.cutoff
+            data.time = data.cutoff
+        data.additional += "; result from run cache"
+        self.logger.debug("Found result in run cache: %s" % (data.status))
+        return True
+
+    def store(self, data: Data):
+        '''
+            stores the result of the run described by <data> (only SUCCESS and TIMEOUT);
+            the result is not stored if the database cannot be written
+        '''
+        if data.status not in ["SUCCESS", "TIMEOUT"]:
+            return
+        cutoff = float("inf") if data.cutoff is None else data.cutoff
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                             (self.get_key(data), cutoff, data.status, float(data.cost),
+                              float(data.time), data.additional, data.exit_code,
+                              int(data.status == "TIMEOUT" and data.memout)))
+        except (sqlite3.Error, OSError) as e:
+            self.logger.warning("Cannot write the run cache %s: %s" % (self.db_file, e))
@@ -0,0 +1,174 @@
+'''
+bounded in-memory buffers for the output of the target algorithm
+
+@author:     Marius Lindauer
+@copyright:  2018 ML4AAD. All rights reserved.
+@license:    BSD
+'''
+
+import re
+import typing
+
+# replaces the dropped part of the output
+DROP_MARKER = b"[... %d bytes of output dropped ...]\n"
+
+
+class RingBuffer(object):
+    '''
+        keeps the last <size> bytes written to it
+    '''
+
+    def __init__(self, size: int, on_drop: typing.Callable = None):
+        '''
+            Arguments
+            ---------
+            size: int
+                number of bytes kept
+            on_drop: typing.Callable
+                called with the bytes which are dropped (in the order of writing)
+        '''
+        self.size = size
+        self.on_drop = on_drop
+        # number of bytes written but not kept
+        self.dropped = 0
+        self._data = bytearray()
+
+    def write(self, data: bytes):
+        self._data += data
+        # trimming only if twice the size is exceeded
+        # such that the costs of trimming are amortized
+        if len(self._data) > 2 * self.size:
+            self._trim()
+
+    def _trim(self):
+        excess = len(self._data) - self.size
+        if excess > 0:
+            if self.on_drop is not None:
+                self.on_drop(bytes(self._data[:excess]))
+            del self._data[:excess]
+            self.dropped += excess
+
+    def getvalue(self):
+        '''
+            Returns
+            -------
+            data: bytes
+                the last <size> bytes
+        '''
+        self._trim()
+        return bytes(self._data)
+
+
+def combine_patterns(patterns: typing.Iterable):
+    '''
+        combines regular expressions (searched in single lines of text,
+        see ~genericWrapper4AC.parsing.output_parser.OutputParser)
+        into one expression which finds them in bytes with many lines
+
+        Arguments
+        ---------
+        patterns: typing.Iterable
+            strings or compiled regular expressions;
+            expressions which are not valid on bytes are ignored
+
+        Returns
+        -------
+        regex: compiled regular expression or None if there is no pattern
+    '''
+    flag_names = [(re.IGNORECASE, "i"), (re.DOTALL, "s"), (re.VERBOSE, "x")]
+    parts = []
+    for pattern in patterns:
+        if isinstance(pattern, (str, bytes)):
+            pattern = re.compile(pattern)
+        source = pattern.pattern
+        if isinstance(source, str):
+            source = source.encode("utf8")
+        flags = "".join(name for flag, name in flag_names if pattern.flags & flag)
+        part = b"(?%s:%s)" % (flags.encode(), source) if flags else b"(?:%s)" % (source)
+        try:
+            re.compile(part)
+        except re.error:
+            continue
+        parts.append(part)
+    if not parts:
+        return None
+    return re.compile(b"|".join(parts), re.MULTILINE)
+
+
+class HeadTailBuffer(object):
+    '''
+        keeps the first <head> and the last <tail> bytes written to it
+        and the lines in between which match one of <patterns> (at most <tail> bytes of them);
+        the rest is dropped and replaced by DROP_MARKER
+    '''
+
+    def __init__(self, head: int, tail: int, patterns: typing.Iterable = ()):
+        '''
+            Arguments
+            ---------
+            head: int
+                number of bytes kept from the beginning
+            tail: int
+                number of bytes kept from the end
+            patterns: typing.Iterable
+                regular expressions of lines which are kept (see combine_patterns)
+        '''
+        self.head = head
+        self._head = bytearray()
+        self._tail = RingBuffer(size=tail, on_drop=self._scan)
+        self._regex = combine_patterns(patterns)
+        self._max_matches = tail
+        self._matches = bytearray()
+        # incomplete last line of the part dropped by the ring buffer
+        self._rest = b""
+        self._dropped = 0
+
+    def write(self, data: bytes):
+        missing = self.head - len(self._head)
+        if missing > 0:
+            self._head += data[:missing]
+            data = data[missing:]
+        if data:
+            self._tail.write(data)
+
+    def _scan(self, data: bytes):
+        '''
+            keeps the matching lines of the part dropped by the ring buffer
+        '''
+        data = self._rest + data
+        end = data.rfind(b"\n") + 1
+        self._rest = data[end:]
+        kept = 0
+        if self._regex is not None:
+            pos = 0
+            for match in self._regex.finditer(data, 0, end):
+                # whole lines of the match (a line is only kept once)
+                start = max(data.rfind(b"\n", 0, match.start()) + 1, pos)
+                stop = data.find(b"\n", max(match.end() - 1, match.start())) + 1
+                if stop <= pos:
+                    continue
+                pos = stop
+                if len(self._matches) + stop - start <= self._max_matches:
+                    self._matches += data[start:stop]
+                    kept += stop - start
+        self._dropped += end - kept
+
+    @property
+    def dropped(self):
+        '''
+            number of bytes written but not kept
+        '''
+        self._tail._trim()
+        return self._dropped + len(self._rest)
+
+    def getvalue(self):
+        '''
+            Returns
+            -------
+            data: bytes
+                the kept output; DROP_MARKER after the head if output was dropped
+        '''
+        tail = self._tail.getvalue()
+        if not self.dropped:
+            return bytes(self._head) + bytes(self._matches) + tail
+        return bytes(self._head) + DROP_MARKER % (self.dropped) + bytes(self._matches) + tail
@@ -0,0 +1,44 @@
+'''
+compression of preserved log files (see --log-compression)
+
+@author:     Marius Lindauer
+@copyright:  2018 ML4AAD. All rights reserved.
+@license:    BSD
+'''
+
+import shutil
+
+# compression -> suffix of the file name
+COMPRESSIONS = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+
+def open_compressed(path: str, compression: str = "none"):
+    '''
+        opens <path> for writing bytes
+
+        Arguments
+        ---------
+        path: str
+            file name (including the suffix of the compression)
+        compression: str
+            "none", "gzip" or "zstd" (requires the optional package zstandard)
+
+        Returns
+        -------
+        fp: file object
+    '''
+    if compression == "gzip":
+        import gzip
+        return gzip.open(path, "wb")
+    if compression == "zstd":
+        import zstandard
+        return zstandard.ZstdCompressor().stream_writer(open(path, "wb"), closefd=True)
+    return open(path, "wb")
+
+
+def copy_compressed(src: str, dst: str, compression: str = "none"):
+    '''
+        copies the file <src> to <dst> (see open_compressed)
+    '''
+    with open(src, "rb") as fin, open_compressed(dst, compression=compression) as fout:
+        shutil.copyfileobj(fin, fout)
@@ -0,0 +1,263 @@
+'''
+bounded capture of the solver output (see --log-capture bounded and shm):
+the target algorithm (or the runsolver) writes into a FIFO
+which is read by a thread (or in the asyncio event loop) into a bounded buffer
+(see ~genericWrapper4AC.capture.buffer.HeadTailBuffer);
+after the run, the FIFO is replaced by a regular file with the kept output
+such that the output can be opened by its name (e.g., by an external checker)
+
+@author:     Marius Lindauer
+@copyright:  2018 ML4AAD. All rights reserved.
+@license:    BSD
+'''
+
+import io
+import os
+import random
+import select
+import threading
+
+SHM_DIR = "/dev/shm"
+
+
+def shm_dir(fallback: str):
+    '''
+        returns /dev/shm (a tmpfs) if it is a writable directory, otherwise <fallback>
+    '''
+    if os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK | os.X_OK):
+        return SHM_DIR
+    return fallback
+
+
+class FifoLog(object):
+    '''
+        replaces the solver file of a run; provides the parts of the file interface
+        used by the wrapper: name (path of the FIFO, e.g., for runsolver -o)
+        and fileno() (a write end, e.g., for in-process targets) while the run is executed,
+        and read(), readline(), iteration and seek() on the captured output after finish();
+        afterwards, name is the path of a regular file with the captured output.
+        start() and finish() (and their asyncio versions start_async() and finish_async())
+        are the interface of ~genericWrapper4AC.parsing.tail.LogTailer.
+    '''
+
+    def __init__(self, dir: str, prefix: str, buffer, poll_interval: float = 0.05):
+        '''
+            creates the FIFO
+
+            Arguments
+            ---------
+            dir: str
+                directory of the FIFO (see shm_dir)
+            prefix: str
+                prefix of the file name
+            buffer: ~genericWrapper4AC.capture.buffer.HeadTailBuffer
+                buffer for the output (or any object with write, getvalue and dropped)
+            poll_interval: float
+                maximal time in seconds between two calls of the tailer
+        '''
+        self.buffer = buffer
+        self.poll_interval = poll_interval
+        # LogTailer fed with the output (see AbstractWrapper._get_tailer)
+        self.tailer = None
+        self.closed = False
+
+        while True:
+            self.name = os.path.join(dir, "%s%d.log" % (prefix, random.randint(0, 1000000)))
+            try:
+                os.mkfifo(self.name, 0o600)
+                break
+            except FileExistsError:
+                pass
+
+        # the read end is opened first such that opening the write end does not block;
+        # the own write end prevents EOFs before any writer opened the FIFO
+        # and is closed by finish()
+        self._read_fd = os.open(self.name, os.O_RDONLY | os.O_NONBLOCK)
+        self._write_fd = os.open(self.name, os.O_WRONLY)
+        # self-pipe to stop the thread if writers keep the FIFO open (see finish)
+        self._stop_r, self._stop_w = os.pipe()
+        self._thread = None
+        # event loop which reads the FIFO (see start_async)
+        self._loop = None
+        self._eof = None
+        self._timer = None
+        self._file = None
+
+    @property
+    def parser(self):
+        '''
+            parser of the tailer (None without tailer)
+        '''
+        return None if self.tailer is None else self.tailer.parser
+
+    def fileno(self):
+        return self._write_fd
+
+    def start(self):
+        '''
+            starts reading the output in a thread
+        '''
+        self._thread = threading.Thread(target=self._read, daemon=True)
+        self._thread.start()
+
+    def _read_chunk(self):
+        '''
+            reads the available output into the buffer
+
+            Returns
+            -------
+            chunk: bytes
+                empty if no output is available; None at EOF (all writers closed the FIFO)
+        '''
+        try:
+            chunk = os.read(self._read_fd, 1024 * 1024)
+        except BlockingIOError:
+            return b""
+        except OSError:
+            return None
+        if not chunk:
+            return None
+        self.buffer.write(chunk)
+        return chunk
+
+    def _read(self):
+        while True:
+            ready, _, _ = select.select([self._read_fd, self._stop_r], [], [], self.poll_interval)
+            chunk = b""
+            if self._read_fd in ready:
+                chunk = self._read_chunk()
+                if chunk is None:
+                    break
+            if self.tailer is not None:
+                self.tailer.feed(chunk, check=self._write_fd is not None)
+            # output which is already in the FIFO is read before stopping
+            if self._stop_r in ready and not chunk:
+                break
+        if self.tailer is not None:
+            self.tailer.feed_rest()
+
+    def start_async(self):
+        '''
+            asyncio version of start(): reads the output in the running event loop
+            (loop.add_reader, no thread); see finish_async()
+        '''
+        import asyncio
+        self._loop = asyncio.get_running_loop()
+        self._eof = self._loop.create_future()
+        self._loop.add_reader(self._read_fd, self._on_readable)
+        if self.tailer is not None:
+            # the check of the tailer is also called without new output
+            self._timer = self._loop.call_later(self.poll_interval, self._on_timer)
+
+    def _on_readable(self):
+        chunk = self._read_chunk()
+        if chunk is None:
+            self._stop_async()
+        elif chunk and self.tailer is not None:
+            self.tailer.feed(chunk, check=self._write_fd is not None)
+
+    def _on_timer(self):
+        self.tailer.feed(b"", check=self._write_fd is not None)
+        self._timer = self._loop.call_later(self.poll_interval, self._on_timer)
+
+    def _stop_async(self):
+        '''
+            stops reading in the event loop; reads the output which is already in the FIFO
+        '''
+        if self._eof.done():
+            return
+        self._loop.remove_reader(self._read_fd)
+        if self._timer is not None:
+            self._timer.cancel()
+        while True:
+            chunk = self._read_chunk()
+            if not chunk:
+                break
+            if self.tailer is not None:
+                self.tailer.feed(chunk, check=False)
+        if self.tailer is not None:
+            self.tailer.feed_rest()
+        self._eof.set_result(None)
+
+    async def finish_async(self, timeout: float = 5):
+        '''
+            asyncio version of finish() (after start_async())
+        '''
+        import asyncio
+        if self._file is not None:
+            return
+        if self._write_fd is not None:
+            os.close(self._write_fd)
+            self._write_fd = None
+        try:
+            await asyncio.wait_for(asyncio.shield(self._eof), timeout)
+        except asyncio.TimeoutError:
+            # the FIFO is still open in another process
+            self._stop_async()
+        self.finish()
+
+    def finish(self, timeout: float = 5):
+        '''
+            signals that the target algorithm has terminated;
+            reads the remaining output, waits for the thread
+            and replaces the FIFO by a regular file with the captured output
+
+            Arguments
+            ---------
+            timeout: float
+                maximal waiting time in seconds for processes which still
+                have the FIFO open (e.g., orphans of the target algorithm)
+        '''
+        if self._file is not None:
+            return
+        if self._write_fd is not None:
+            os.close(self._write_fd)
+            self._write_fd = None
+        if self._loop is not None:
+            # e.g., the run was cancelled before finish_async()
+            self._stop_async()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                # the FIFO is still open in another process;
+                # the fds are only closed after the thread stopped using them
+                os.write(self._stop_w, b"x")
+                self._thread.join()
+        for fd in (self._read_fd, self._stop_r, self._stop_w):
+            os.close(fd)
+        data = self.buffer.getvalue()
+        tmp_name = self.name + ".tmp"
+        with open(tmp_name, "wb") as fp:
+            fp.write(data)
+        os.replace(tmp_name, self.name)
+        self._file = io.BytesIO(data)
+
+    @property
+    def dropped(self):
+        '''
+            number of bytes of the output which were not kept
+        '''
+        return self.buffer.dropped
+
+    def read(self, size: int = -1):
+        self.finish()
+        return self._file.read(size)
+
+    def readline(self, size: int = -1):
+        self.finish()
+        return self._file.readline(size)
+
+    def __iter__(self):
+        self.finish()
+        return iter(self._file)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET):
+        self.finish()
+        return self._file.seek(offset, whence)
+
+    def close(self):
+        '''
+            stops the capture; does not remove the file
+        '''
+        self.finish()
+        self.closed = True
@@ -0,0 +1,120 @@
+'''
+client shim of the wrapper daemon:
+forwards the command line arguments of the configurator
+to a running wrapper daemon (see AbstractWrapper.serve)
+and prints the returned result string.
+
+This module is deliberately kept free of imports of the generic wrapper
+such that its start-up is as cheap as possible.
+
+Usage (as call string of the configurator):
+    python -m genericWrapper4AC.daemon.client --daemon-socket <socket> <usual wrapper arguments>
+
+Instead of --daemon-socket, the environment variable GW4AC_DAEMON_SOCKET can be used.
+
+@author:     Marius Lindauer
+@copyright:  2018 ML4AAD. All rights reserved.
+@license:    BSD
+'''
+
+import os
+import sys
+import json
+import signal
+import socket
+import typing
+
+SOCKET_ENV = "GW4AC_DAEMON_SOCKET"
+
+
+def _get_result_fd(argv: typing.List[str]):
+    '''
+        value of --result-fd in <argv> (as --result-fd <fd> or --result-fd=<fd>)
+    '''
+    for idx, arg in enumerate(argv):
+        if arg == "--result-fd":
+            return int(argv[idx + 1])
+        if arg.startswith("--result-fd="):
+            return int(arg.split("=", 1)[1])
+    raise ValueError("wrapper daemon sent a result without --result-fd")
+
+
+def request_run(socket_path: str, argv: typing.List[str], cwd: str = None):
+    '''
+        sends a run request to the daemon listening on <socket_path>
+        and waits for the result;
+        writes the result to the file descriptor of --result-fd (if given in <argv>)
+
+        Arguments
+        ---------
+        socket_path: str
+            path of the unix socket of the daemon
+        argv: typing.List[str]
+            command line arguments (incl. the name of the script)
+        cwd: str
+            working directory used to resolve relative paths (default: os.getcwd())
+
+        Returns
+        -------
+        output: str
+            result string(s) printed by the wrapper
+        exit_code: int
+            exit code of the wrapper
+    '''
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(socket_path)
+    with sock, sock.makefile("rwb") as fp:
+        fp.write((json.dumps({"argv": argv, "cwd": cwd or os.getcwd()}) + "\n").encode("utf8"))
+        fp.flush()
+
+        pid = json.loads(fp.readline().decode("utf8"))["pid"]
+
+        def forward_signal(signum, frame):
+            # the daemon cleans up the run and still sends a result
+            os.kill(pid, signal.SIGTERM)
+
+        signal.signal(signal.SIGTERM, forward_signal)
+        signal.signal(signal.SIGINT, forward_signal)
+
+        line = fp.readline()
+        if not line:
+            raise ConnectionError("wrapper daemon closed the connection without a result")
+        response = json.loads(line.decode("utf8"))
+        if "error" in response:
+            sys.stderr.write("wrapper daemon failed: %s\n" % (response["error"]))
+
+    if "result" in response:
+        import base64
+        with os.fdopen(_get_result_fd(argv), "wb", closefd=False) as fp:
+            fp.write(base64.b64decode(response["result"]))
+
+    return response["output"], response["exit_code"]
+
+
+def main():
+    argv = list(sys.argv)
+    socket_path = os.environ.get(SOCKET_ENV)
+    if "--daemon-socket" in argv:
+        idx = argv.index("--daemon-socket")
+        socket_path = argv[idx + 1]
+        del argv[idx:idx + 2]
+
+    if socket_path is None:
+        sys.stderr.write("Neither --daemon-socket nor $%s was set\n" % (SOCKET_ENV))
+        sys.exit(1)
+
+    try:
+        output, exit_code = request_run(socket_path=socket_path, argv=argv)
+    except (OSError, ValueError) as e:
+        sys.stdout.write("Result for ParamILS: ABORT, 0, 0, 0, 0, wrapper daemon at %s failed: %s\n" % (
+            socket_path, str(e).replace(",", ";")))
+        sys.exit(1)
+
+    sys.stdout.write(output)
+    sys.stdout.flush()
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
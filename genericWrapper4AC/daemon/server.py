@@ -0,0 +1,99 @@
+'''
+server side of the wrapper daemon:
+a long-lived process that keeps the wrapper (and all its imports) in memory
+and executes run requests received on a unix socket
+
+Protocol (one connection per run, one JSON object per line):
+    client -> server: {"argv": [...], "cwd": <working directory of the client>}
+    server -> client: {"pid": <pid of the process handling the run>}
+    server -> client: {"output": <result string(s)>, "exit_code": <int>[, "result": <base64>][, "error": <str>]}
+"result" is the encoded result (see AbstractWrapper.get_result_payload) for --result-fd,
+which is a file descriptor of the client; --result-file is written by the server
+
+@author:     Marius Lindauer
+@copyright:  2018 ML4AAD. All rights reserved.
+@license:    BSD
+'''
+
+import io
+import os
+import json
+import base64
+import signal
+import socketserver
+
+from contextlib import redirect_stdout
+
+
+class RunRequestHandler(socketserver.StreamRequestHandler):
+    '''
+        handles a single run request;
+        since the server forks for each request,
+        each run is isolated in its own process
+    '''
+
+    def handle(self):
+        # import here to avoid circular imports
+        from genericWrapper4AC.generic_wrapper import signalHandler
+
+        signal.signal(signal.SIGTERM, signalHandler)
+        signal.signal(signal.SIGINT, signalHandler)
+
+        request = json.loads(self.rfile.readline().decode("utf8"))
+        # the client can forward signals to this process
+        self._send({"pid": os.getpid()})
+
+        os.chdir(request.get("cwd", "."))
+
+        wrapper = self.server.wrapper
+        output = io.StringIO()
+        try:
+            wrapper.run(cmd_arguments=request["argv"])
+        except Exception as e:
+            wrapper.logger.exception(e)
+            self._send({"output": "", "exit_code": 1, "error": repr(e)})
+            return
+        with redirect_stdout(output):
+            wrapper.print_result_string()
+        response = {"output": output.getvalue(),
+                    "exit_code": wrapper.data.exit_code or 0}
+
+        # as in main(); the client writes the result to its --result-fd
+        result_fd, wrapper.args.result_fd = wrapper.args.result_fd, None
+        wrapper.write_result()
+        if result_fd is not None:
+            response["result"] = base64.b64encode(wrapper.get_result_payload()).decode("ascii")
+
+        self._send(response)
+
+    def _send(self, msg: dict):
+        self.wfile.write((json.dumps(msg) + "\n").encode("utf8"))
+        self.wfile.flush()
+
+
+class WrapperServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    '''
+        unix socket server which executes each run request
+        in a fork of the (already initialized) daemon process
+    '''
+
+    def __init__(self, socket_path: str, wrapper):
+        '''
+            Arguments
+            ---------
+            socket_path: str
+                path of the unix socket
+            wrapper: ~genericWrapper4AC.generic_wrapper.AbstractWrapper
+                wrapper used to execute the runs
+        '''
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        self.socket_path = socket_path
+        self.wrapper = wrapper
+        socketserver.UnixStreamServer.__init__(
+            self, socket_path, RunRequestHandler)
+
+    def server_close(self):
+        socketserver.UnixStreamServer.server_close(self)
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
@@ -4,28 +4,197 @@
 @license:    BSD
 '''
 
+import copy
+
+from genericWrapper4AC.data.request import RunRequest
+from genericWrapper4AC.data.result import Result
+
+
 class Data(object):
 
-    def __init__(self):
+    def __init__(self, request: RunRequest = None):
+        '''
+            Arguments
+            ---------
+            request: ~genericWrapper4AC.data.request.RunRequest
+                instance, seed, cutoff and configuration of the run
+        '''
 
-        self.instance = None
-        self.specifics = None
-        self.cutoff = None
-        self.runlength = None
-        self.seed = None
-        self.config = []
+        # instance, seed, cutoff, ... (see the properties below);
+        # immutable, i.e., replaced on each change
+        self.request = RunRequest() if request is None else request
 
-        # return values
-        self.status = "CRASHED"
-        self.cost = 2**32 - 1
-        self.time = 0
-        self.additional = ""
-        self.exit_code = 0
+        # return values (see the properties below)
+        self.result = Result()
 
         # call arguments
         self.runsolver = None
+        self.runsolver_var_file = False
         self.tmp_dir = None
         self.mem_limit = None
         self.max_quality = 2**32 - 1
+        self.cores_per_run = None
+        self.core_lock_dir = None
+        # seconds
+        self.core_wait_timeout = 600
+        self.tail_output = False
+        # list of (cost, time) bounds of --stop-if-worse-than
+        self.stop_bounds = []
+        self.run_cache_dir = None
+        self.deterministic = False
+        self.seed_independent = False
+        self.limit_backend = "runsolver"
+        self.reap_orphans = False
+        self.log_capture = "disk"
+        # MB
+        self.log_buffer_size = 4
+        self.log_head_size = 1
+        self.log_compression = "none"
+        self.report_timings = False
+        self.timing_histogram = None
 
         self.new_format = False
+
+    def copy(self, request: RunRequest = None):
+        '''
+            cheap copy sharing the request and the call arguments
+            (but not the return values)
+
+            Arguments
+            ---------
+            request: ~genericWrapper4AC.data.request.RunRequest
+                request of the copy (default: the request of this object)
+
+            Returns
+            -------
+            data: Data
+        '''
+        data = copy.copy(self)
+        if request is not None:
+            data.request = request
+        data.result = Result(time=data.request.cutoff or 0)
+        return data
+
+    # the request is stored in self.request
+
+    @property
+    def instance(self):
+        return self.request.instance
+
+    @instance.setter
+    def instance(self, instance):
+        self.request = self.request.replace(instance=instance)
+
+    @property
+    def specifics(self):
+        return self.request.specifics
+
+    @specifics.setter
+    def specifics(self, specifics):
+        self.request = self.request.replace(specifics=specifics)
+
+    @property
+    def cutoff(self):
+        return self.request.cutoff
+
+    @cutoff.setter
+    def cutoff(self, cutoff):
+        self.request = self.request.replace(cutoff=cutoff)
+
+    @property
+    def runlength(self):
+        return self.request.runlength
+
+    @runlength.setter
+    def runlength(self, runlength):
+        self.request = self.request.replace(runlength=runlength)
+
+    @property
+    def seed(self):
+        return self.request.seed
+
+    @seed.setter
+    def seed(self, seed):
+        self.request = self.request.replace(seed=seed)
+
+    @property
+    def config(self):
+        return self.request.config
+
+    @config.setter
+    def config(self, config):
+        self.request = self.request.replace(config=config)
+
+    # the return values are stored in self.result
+
+    @property
+    def status(self):
+        return self.result.status
+
+    @status.setter
+    def status(self, status):
+        self.result.status = status
+
+    @property
+    def cost(self):
+        return self.result.cost
+
+    @cost.setter
+    def cost(self, cost):
+        self.result.cost = cost
+
+    @property
+    def time(self):
+        return self.result.time
+
+    @time.setter
+    def time(self, time):
+        self.result.time = time
+
+    @property
+    def additional(self):
+        return self.result.additional
+
+    @additional.setter
+    def additional(self, additional):
+        self.result.additional = additional
+
+    @property
+    def exit_code(self):
+        return self.result.exit_code
+
+    @exit_code.setter
+    def exit_code(self, exit_code):
+        self.result.exit_code = exit_code
+
+    @property
+    def trajectory(self):
+        return self.result.trajectory
+
+    @trajectory.setter
+    def trajectory(self, trajectory):
+        self.result.trajectory = trajectory
+
+    @property
+    def resources(self):
+        return self.result.resources
+
+    @resources.setter
+    def resources(self, resources):
+        self.result.resources = resources
+
+    @property
+    def memout(self):
+        return self.result.memout
+
+    @memout.setter
+    def memout(self, memout):
+        self.result.memout = memout
+
+    @property
+    def timings(self):
+        return self.result.timings
+
+    @timings.setter
+    def timings(self, timings):
+        self.result.timings = timings
@@ -0,0 +1,103 @@
+'''
+immutable description of a single target algorithm run
+
+@author:     Marius Lindauer
+@copyright:  2018 ML4AAD. All rights reserved.
+@license:    BSD
+'''
+
+import types
+import typing
+
+REQUEST_FIELDS = ["instance", "specifics", "cutoff", "runlength", "seed", "config"]
+
+
+class RunRequest(object):
+    '''
+        instance, seed, cutoff and configuration of a run;
+        immutable and hashable (e.g., usable as key of a cache).
+        Two requests are equal if their configurations contain the same
+        parameter values (independent of the order of the parameters).
+    '''
+
+    __slots__ = ["instance", "specifics", "cutoff", "runlength", "seed", "_config", "_config_view", "_hash"]
+
+    def __init__(self, instance: str = None, specifics: str = None, cutoff: int = None,
+                 runlength: int = None, seed: int = None,
+                 config: typing.Union[dict, typing.Iterable[typing.Tuple[str, str]]] = ()):
+        '''
+            Arguments
+            ---------
+            instance: str
+                problem instance
+            specifics: str
+                instance specifics
+            cutoff: int
+                runtime cutoff
+            runlength: int
+                runlength
+            seed: int
+                random seed
+            config: typing.Union[dict, typing.Iterable[typing.Tuple[str, str]]]
+                parameter name (with prefix) -> value
+        '''
+        init = object.__setattr__
+        init(self, "instance", instance)
+        init(self, "specifics", specifics)
+        init(self, "cutoff", cutoff)
+        init(self, "runlength", runlength)
+        init(self, "seed", seed)
+        init(self, "_config", dict(config))
+        init(self, "_config_view", types.MappingProxyType(self._config))
+        init(self, "_hash", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("RunRequest is immutable; use replace()")
+
+    def __delattr__(self, name):
+        raise AttributeError("RunRequest is immutable")
+
+    @property
+    def config(self):
+        '''
+            configuration as a read-only view (in the order of the parameters);
+            use replace(config=...) (or the setter of Data.config) to change it
+        '''
+        return self._config_view
+
+    @property
+    def config_items(self):
+        '''
+            configuration as a tuple of (name, value)
+        '''
+        return tuple(self._config.items())
+
+    def replace(self, **changes):
+        '''
+            returns a new request with the fields <changes> replaced
+        '''
+        fields = dict((name, getattr(self, name)) for name in REQUEST_FIELDS[:-1])
+        fields["config"] = self._config
+        fields.update(changes)
+        return RunRequest(**fields)
+
+    def __reduce__(self):
+        # for pickle and copy (the slots cannot be set after __init__)
+        return (RunRequest, (self.instance, self.specifics, self.cutoff,
+                             self.runlength, self.seed, self._config))
+
+    def _key(self):
+        return (self.instance, self.specifics, self.cutoff, self.runlength, self.seed,
+                frozenset(self._config.items()))
+
+    def __eq__(self, other):
+        return isinstance(other, RunRequest) and self._key() == other._key()
+
+    def __hash__(self):
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash(self._key()))
+        return self._hash
+
+    def __repr__(self):
+        return "RunRequest(instance=%r, specifics=%r, cutoff=%r, runlength=%r, seed=%r, config=%r)" % (
+            self.instance, self.specifics, self.cutoff, self.runlength, self.seed, self._config)
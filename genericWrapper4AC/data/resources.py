@@ -0,0 +1,90 @@
+'''
+resource usage of a target algorithm run, reported as numeric fields of the result
+(see AbstractWrapper.get_result_dict);
+collected from the runsolver, from getrusage (wait4) or from cgroup statistics
+
+@author:     Marius Lindauer
+@copyright:  2018 ML4AAD. All rights reserved.
+@license:    BSD
+'''
+
+# name -> description; only known values are reported
+RESOURCE_FIELDS = {
+    "wall_time": "wallclock time in seconds",
+    "user_time": "CPU time in user mode in seconds",
+    "system_time": "CPU time in system mode in seconds",
+    "peak_rss_mb": "peak resident memory in MB (same unit as --mem-limit)",
+    "peak_vsize_mb": "peak virtual memory in MB (same unit as --mem-limit)",
+    # memory.peak also counts the page cache and kernel memory of the cgroup,
+    # i.e., it is not comparable to the resident memory
+    "peak_memory_mb": "peak memory usage of the cgroup in MB, including the page cache "
+                      "(same unit as --mem-limit; only --limit-backend cgroup)",
+    "voluntary_context_switches": "number of voluntary context switches",
+    "involuntary_context_switches": "number of involuntary context switches",
+    "read_bytes": "bytes read from the block devices",
+    "write_bytes": "bytes written to the block devices",
+}
+
+# getrusage reports block operations in units of 512 bytes
+BLOCK_SIZE = 512
+
+
+def from_rusage(rusage, wall_time: float = None):
+    '''
+        resource usage of a process and its waited-for descendants
+
+        Arguments
+        ---------
+        rusage: resource.struct_rusage
+            e.g., from os.wait4
+        wall_time: float
+            wallclock time in seconds (not part of the rusage)
+
+        Returns
+        -------
+        resources: typing.Dict[str, float]
+    '''
+    resources = {"user_time": rusage.ru_utime,
+                 "system_time": rusage.ru_stime,
+                 # KiB on Linux
+                 "peak_rss_mb": rusage.ru_maxrss / 1024,
+                 "voluntary_context_switches": rusage.ru_nvcsw,
+                 "involuntary_context_switches": rusage.ru_nivcsw,
+                 "read_bytes": rusage.ru_inblock * BLOCK_SIZE,
+                 "write_bytes": rusage.ru_oublock * BLOCK_SIZE}
+    if wall_time is not None:
+        resources["wall_time"] = wall_time
+    return resources
+
+
+def from_runsolver(report):
+    '''
+        resource usage of the process tree of a run measured by the runsolver
+
+        Arguments
+        ---------
+        report: ~genericWrapper4AC.parsing.runsolver.RunsolverReport
+
+        Returns
+        -------
+        resources: typing.Dict[str, float]
+    '''
+    resources = {}
+    for name, value in [("wall_time", report.wall_time),
+                        ("user_time", report.user_time),
+                        ("system_time", report.system_time),
+                        ("voluntary_context_switches", report.voluntary_context_switches),
+                        ("involuntary_context_switches", report.involuntary_context_switches)]:
+        if value is not None:
+            resources[name] = value
+    if report.max_rss is not None:
+        resources["peak_rss_mb"] = report.max_rss / 1024
+    # the virtual memory is only known if the process tree was sampled
+    # (the runsolver reports 0 otherwise)
+    if report.max_vm:
+        resources["peak_vsize_mb"] = report.max_vm / 1024
+    if report.block_input is not None:
+        resources["read_bytes"] = report.block_input * BLOCK_SIZE
+    if report.block_output is not None:
+        resources["write_bytes"] = report.block_output * BLOCK_SIZE
+    return resources
@@ -0,0 +1,88 @@
+'''
+result of a single target algorithm run
+and its machine-readable encodings (see --result-file)
+
+@author:     Marius Lindauer
+@copyright:  2018 ML4AAD. All rights reserved.
+@license:    BSD
+'''
+
+import typing
+
+RESULT_FORMATS = ["json", "msgpack"]
+
+
+class Result(object):
+    '''
+        outcome of a target algorithm run
+    '''
+
+    __slots__ = ["status", "cost", "time", "additional", "exit_code", "trajectory", "resources",
+                 "timings", "memout"]
+
+    def __init__(self, status: str = "CRASHED", cost: float = 2**32 - 1, time: float = 0,
+                 additional: str = "", exit_code: int = 0,
+                 trajectory: typing.List[typing.Tuple[float, float]] = None,
+                 resources: typing.Dict[str, float] = None,
+                 timings: typing.Dict[str, float] = None, memout: bool = False):
+        '''
+            Arguments
+            ---------
+            status: str
+                SUCCESS, TIMEOUT, CRASHED or ABORT
+            cost: float
+                cost (e.g., solution quality) of the run
+            time: float
+                runtime
+            additional: str
+                additional information
+            exit_code: int
+                exit code of the target algorithm
+            trajectory: typing.List[typing.Tuple[float, float]]
+                anytime trajectory: list of (elapsed wallclock time, quality)
+            resources: typing.Dict[str, float]
+                resource usage of the run (see ~genericWrapper4AC.data.resources)
+            timings: typing.Dict[str, float]
+                durations of the phases of the run (see ~genericWrapper4AC.timing.phases)
+            memout: bool
+                the run exceeded the memory limit (reported as TIMEOUT)
+        '''
+        self.status = status
+        self.cost = cost
+        self.time = time
+        self.additional = additional
+        self.exit_code = exit_code
+        self.trajectory = [] if trajectory is None else trajectory
+        self.resources = {} if resources is None else resources
+        self.timings = {} if timings is None else timings
+        self.memout = memout
+
+    def __eq__(self, other):
+        return isinstance(other, Result) and \
+            all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return "Result(%s)" % (", ".join("%s=%r" % (name, getattr(self, name))
+                                         for name in self.__slots__))
+
+
+def encode_result(result: dict, result_format: str = "json"):
+    '''
+        encodes a result dictionary (see AbstractWrapper.get_result_dict)
+
+        Arguments
+        ---------
+        result: dict
+            result in the AClib format
+        result_format: str
+            "json" (one line) or "msgpack" (requires the optional package msgpack)
+
+        Returns
+        -------
+        payload: bytes
+    '''
+    if result_format == "msgpack":
+        import msgpack
+        return msgpack.packb(result, use_bin_type=True)
+    import json
+    return (json.dumps(result) + "\n").encode("utf8")
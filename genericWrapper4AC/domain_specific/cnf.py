@@ -0,0 +1,136 @@
+'''
+reading of DIMACS CNF instances and in-process verification of models
+
+@author:     Marius Lindauer
+@copyright:  2018 ML4AAD. All rights reserved.
+@license:    BSD
+'''
+
+import typing
+
+from array import array
+
+# magic bytes of the supported compression formats
+_MAGIC = [(b"\x1f\x8b", "gzip"),
+          (b"BZh", "bz2"),
+          (b"\xfd7zXZ\x00", "lzma")]
+
+
+def open_instance(path: str):
+    '''
+        opens a (possibly gzip, bz2 or xz compressed) file in binary mode;
+        the compression is detected by the magic bytes of the file
+    '''
+    with open(path, "rb") as fp:
+        head = fp.read(6)
+    for magic, module in _MAGIC:
+        if head.startswith(magic):
+            if module == "gzip":
+                import gzip
+                return gzip.open(path, "rb")
+            elif module == "bz2":
+                import bz2
+                return bz2.open(path, "rb")
+            else:
+                import lzma
+                return lzma.open(path, "rb")
+    return open(path, "rb")
+
+
+class CNF(object):
+    '''
+        clause database of a CNF instance;
+        all clauses are stored in one flat integer array
+        in which each clause is terminated by 0
+    '''
+
+    def __init__(self, n_vars: int, n_clauses: int, literals: array):
+        '''
+            Arguments
+            ---------
+            n_vars: int
+                number of variables (has to be at least the largest variable of <literals>)
+            n_clauses: int
+                number of clauses (p line)
+            literals: array
+                literals of all clauses, each clause terminated by 0
+                (any sequence of int is supported)
+        '''
+        self.n_vars = n_vars
+        self.n_clauses = n_clauses
+        self.literals = literals
+
+    @classmethod
+    def read(cls, path: str):
+        '''
+            reads a DIMACS CNF file (plain, gzip, bz2 or xz)
+
+            Arguments
+            ---------
+            path: str
+                path to the instance
+
+            Returns
+            -------
+            CNF
+        '''
+        n_vars, n_clauses = 0, 0
+        literals = array("i")
+        with open_instance(path) as fp:
+            for line in fp:
+                first = line[:1]
+                if first == b"c":
+                    continue
+                elif first == b"p":
+                    fields = line.split()
+                    if len(fields) != 4 or fields[1] != b"cnf":
+                        raise ValueError("Invalid header in %s: %s" % (path, line))
+                    n_vars, n_clauses = int(fields[2]), int(fields[3])
+                elif first == b"%":
+                    # end marker of some (SATLIB) instances
+                    break
+                else:
+                    literals.extend(map(int, line.split()))
+        if literals:
+            if literals[-1] != 0:
+                literals.append(0)
+            # be robust against wrong p lines
+            n_vars = max(n_vars, max(literals), -min(literals))
+        return cls(n_vars=n_vars, n_clauses=n_clauses, literals=literals)
+
+    def verify(self, model: typing.Iterable[int]):
+        '''
+            checks whether <model> satisfies all clauses
+
+            Arguments
+            ---------
+            model: typing.Iterable[int]
+                literals assigned to true (as printed in the "v " lines)
+
+            Returns
+            -------
+            satisfied: bool
+            msg: str
+                reason if the model is not satisfying
+        '''
+        n_vars = self.n_vars
+        # true_lit[lit + n_vars] == 1 iff literal lit is true
+        true_lit = bytearray(2 * n_vars + 1)
+        for lit in model:
+            if abs(lit) > n_vars:
+                continue
+            if true_lit[-lit + n_vars]:
+                return False, "model assigns both %d and %d" % (lit, -lit)
+            true_lit[lit + n_vars] = 1
+
+        satisfied = False
+        clause_idx = 0
+        for lit in self.literals:
+            if lit == 0:
+                if not satisfied:
+                    return False, "clause %d is not satisfied" % (clause_idx + 1)
+                satisfied = False
+                clause_idx += 1
+            elif not satisfied:
+                satisfied = true_lit[lit + n_vars]
+        return True, ""
@@ -0,0 +1,145 @@
+'''
+node-local cache of parsed CNF instances
+
+Each instance is stored as a binary file (header + int32 literals)
+which is memory-mapped when loaded, i.e., it is neither parsed again
+nor copied into the memory of the wrapper.
+The key of an entry is derived from the path, size and modification time
+of the instance; the cache is bounded in size and evicts
+the least recently used entries. Entries are written atomically,
+such that the cache can be shared by concurrent wrappers.
+
+@author:     Marius Lindauer
+@copyright:  2018 ML4AAD. All rights reserved.
+@license:    BSD
+'''
+
+import os
+import sys
+import mmap
+import fcntl
+import struct
+import hashlib
+import logging
+import tempfile
+
+from genericWrapper4AC.domain_specific.cnf import CNF
+
+# magic, byte order, n_vars, n_clauses, n_literals
+HEADER = struct.Struct("<8s8sQQQ")
+MAGIC = b"GW4ACCNF"
+SUFFIX = ".cnfbin"
+
+
+class CNFCache(object):
+    '''
+        size-bounded LRU cache of parsed CNF instances
+    '''
+
+    def __init__(self, cache_dir: str, max_size: int = 1024):
+        '''
+            Arguments
+            ---------
+            cache_dir: str
+                cache directory (created if missing)
+            max_size: int
+                maximal size of the cache in MB
+        '''
+        self.logger = logging.getLogger("CNFCache")
+        os.makedirs(cache_dir, exist_ok=True)
+        self.cache_dir = cache_dir
+        self.max_size = max_size * 1024 ** 2
+
+    def get_entry(self, path: str):
+        '''
+            path of the cache entry of instance <path>
+        '''
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        key = "%s:%d:%d" % (path, stat.st_size, stat.st_mtime_ns)
+        return os.path.join(self.cache_dir,
+                            hashlib.sha1(key.encode("utf8")).hexdigest() + SUFFIX)
+
+    def load(self, path: str):
+        '''
+            returns the parsed instance <path>;
+            reads it from the cache if possible, otherwise parses and caches it
+
+            Arguments
+            ---------
+            path: str
+                path to the instance
+
+            Returns
+            -------
+            ~genericWrapper4AC.domain_specific.cnf.CNF
+        '''
+        entry = self.get_entry(path)
+        try:
+            cnf = self._read_entry(entry)
+            # mark as recently used
+            os.utime(entry)
+            self.logger.debug("Loaded %s from cache" % (path))
+            return cnf
+        except (OSError, ValueError):
+            pass
+
+        cnf = CNF.read(path)
+        try:
+            self._write_entry(entry, cnf)
+            self._evict()
+        except OSError as e:
+            self.logger.warning("Could not cache %s: %s" % (path, e))
+        return cnf
+
+    def _read_entry(self, entry: str):
+        with open(entry, "rb") as fp:
+            mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(mm) < HEADER.size:
+            raise ValueError("Truncated cache entry %s" % (entry))
+        magic, byteorder, n_vars, n_clauses, n_literals = HEADER.unpack_from(mm)
+        if magic != MAGIC or byteorder.rstrip(b"\x00") != sys.byteorder.encode("ascii") \
+                or len(mm) != HEADER.size + 4 * n_literals:
+            raise ValueError("Invalid cache entry %s" % (entry))
+        # the memoryview keeps the mapping alive
+        literals = memoryview(mm)[HEADER.size:].cast("i")
+        return CNF(n_vars=n_vars, n_clauses=n_clauses, literals=literals)
+
+    def _write_entry(self, entry: str, cnf: CNF):
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                fp.write(HEADER.pack(MAGIC, sys.byteorder.encode("ascii"),
+                                     cnf.n_vars, cnf.n_clauses, len(cnf.literals)))
+                cnf.literals.tofile(fp)
+            os.replace(tmp_name, entry)
+        finally:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+
+    def _evict(self):
+        '''
+            removes the least recently used entries until the cache fits into max_size
+        '''
+        with open(os.path.join(self.cache_dir, ".lock"), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith(SUFFIX):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(self.cache_dir, name))
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, name))
+
+            size = sum(entry[1] for entry in entries)
+            for _, entry_size, name in sorted(entries):
+                if size <= self.max_size:
+                    break
+                try:
+                    # processes which mapped the entry can still use it
+                    os.remove(os.path.join(self.cache_dir, name))
+                except FileNotFoundError:
+                    pass
+                size -= entry_size
@@ -11,13 +11,85 @@ SATCSSCWrapper -- target algorithm wrapper for SAT solvers
 '''
 
 import sys
-import re
 import os
-import imp
 import logging
 from subprocess import Popen, PIPE
 
 from genericWrapper4AC.generic_wrapper import AbstractWrapper
+from genericWrapper4AC.parsing.output_parser import OutputParser
+
+
+class SatOutputParser(OutputParser):
+    '''
+        parser for the output of SAT solvers;
+        stops as soon as UNSATISFIABLE or SATISFIABLE plus a complete model was found
+    '''
+
+    def __init__(self):
+        OutputParser.__init__(self)
+
+        self.unsat = False
+        self.sat = False
+        self.unknown = False
+        self.indeterminate = False
+        # list of literals of the "v " lines; None if no model was printed
+        self.model = None
+        self.model_complete = False
+        # description of a malformed "v " line; the model is invalid if not None
+        self.model_error = None
+
+        self.register("^v ", self._read_model)
+        self.register("UNSATISFIABLE", self._read_unsat)
+        self.register("SATISFIABLE", self._read_sat)
+        self.register("s UNKNOWN", self._read_unknown)
+        self.register("INDETERMINATE", self._read_indeterminate)
+
+    @property
+    def status(self):
+        '''
+            reported status with the priority UNSAT > SAT > UNKNOWN > INDETERMINATE;
+            None if nothing was reported
+        '''
+        if self.unsat:
+            return "UNSAT"
+        elif self.sat:
+            return "SAT"
+        elif self.unknown:
+            return "UNKNOWN"
+        elif self.indeterminate:
+            return "INDETERMINATE"
+        return None
+
+    def _read_model(self, match, line):
+        if self.model_complete or self.model_error is not None:
+            return
+        if self.model is None:
+            self.model = []
+        for lit in line.split()[1:]:
+            try:
+                lit = int(lit)
+            except ValueError:
+                self.model_error = "malformed literal %r in the model" % (lit)
+                return
+            if lit == 0:
+                self.model_complete = True
+                break
+            self.model.append(lit)
+        self.done = self.sat and self.model_complete
+
+    def _read_unsat(self, match, line):
+        self.unsat = True
+        self.done = True
+
+    def _read_sat(self, match, line):
+        self.sat = True
+        self.done = self.model_complete
+
+    def _read_unknown(self, match, line):
+        self.unknown = True
+
+    def _read_indeterminate(self, match, line):
+        self.indeterminate = True
 
 class SatWrapper(AbstractWrapper):
     '''
@@ -33,12 +105,30 @@ class SatWrapper(AbstractWrapper):
         
         self.parser.add_argument("--sol-file", dest="solubility_file", default=None, help="File with \"<instance> {SATISFIABLE|UNSATISFIABLE|UNKNOWN}\" ")
         self.parser.add_argument("--sat-checker", dest="sat_checker", default=None, help="binary of SAT checker")
-
-        self._instance = ""
-        self._instance = ""
+        self.parser.add_argument("--native-sat-checker", dest="native_sat_checker", default=False, action="store_true",
+                                 help="verify models in-process (plain, gzip, bz2 and xz instances); "
+                                      "--sat-checker is only used if the instance cannot be read")
+        self.parser.add_argument("--cnf-cache-dir", dest="cnf_cache_dir", default=None,
+                                 help="node-local directory to cache parsed instances for --native-sat-checker")
+        self.parser.add_argument("--cnf-cache-size", dest="cnf_cache_size", default=1024, type=int,
+                                 help="maximal size of the cache of parsed instances in MB")
         
         self.inst_specific = None
         
+    def get_output_parser(self):
+        '''
+            Returns a new SatOutputParser
+        '''
+        return SatOutputParser()
+
+    def get_cache_options(self):
+        '''
+            Returns the options of the verification of the output
+        '''
+        return {"solubility_file": self.args.solubility_file,
+                "sat_checker": self.args.sat_checker,
+                "native_sat_checker": self.args.native_sat_checker}
+
     def process_results(self, filepointer, exit_code):
         '''
         Parse a results file to extract the run's status (SUCCESS/CRASHED/etc) and other optional results.
@@ -56,18 +146,26 @@ class SatWrapper(AbstractWrapper):
             }
             ATTENTION: The return values will overwrite the measured results of the runsolver (if runsolver was used). 
         '''
-        self.logger.debug("reading solver results from %s" % (filepointer.name))
-        data = filepointer.read()
-        try:
-            data = str(data.decode("utf8"))
-        except AttributeError:
-            pass    
-        
+        output = self.parse_output(filepointer)
+
+        with self.phase("verification"):
+            return self._check_output(output, filepointer)
+
+    def _check_output(self, output, filepointer):
+        '''
+            checks the status and the model reported by the solver
+            against the instance specifics, the solubility file and the SAT checker
+            Args:
+                output: parser of the solver output (see get_output_parser)
+                filepointer: a pointer to the file containing the solver execution standard out.
+            Returns:
+                A map containing the standard AClib run results (see process_results)
+        '''
         resultMap = {}
         
         resultMap['misc'] = ""
         
-        if re.search('UNSATISFIABLE', data):
+        if output.status == "UNSAT":
             resultMap['status'] = 'UNSAT'
             
             # verify UNSAT via external knowledge
@@ -82,15 +180,10 @@ class SatWrapper(AbstractWrapper):
                 resultMap['status'] = 'CRASHED'
                 resultMap['misc'] += "; according to solubility file, instance is SAT but UNSAT was reported"
                 
-        elif re.search('SATISFIABLE', data):
+        elif output.status == "SAT":
             resultMap['status'] = 'SAT'
                
-            # look for model
-            model = None
-            for line in data.split("\n"):
-                if line.startswith("v "):
-                    model = map(int, line.split(" ")[1:-1])
-                    break
+            model = output.model
 
             # verify SAT
             if self.data.specifics in ["UNSAT", "20", "UNSATISFIABLE"] :
@@ -105,27 +198,34 @@ class SatWrapper(AbstractWrapper):
                 resultMap['misc'] += "; according to solubility file, instance is UNSAT but SAT was reported"
                 
                 
-            if not self.args.sat_checker:
+            if output.model_error is not None:
+                resultMap['status'] = 'CRASHED'
+                resultMap['misc'] += "; " + output.model_error
+            elif not self.args.sat_checker and not self.args.native_sat_checker:
                 resultMap['misc'] += "; SAT checker was not given; could not verify SAT"
-            elif not os.path.isfile(self.args.sat_checker):
+            elif not self.args.native_sat_checker and not os.path.isfile(self.args.sat_checker):
                 resultMap['misc'] += "; have not found %s; could not verify SAT" % (self.args.sat_checker)
             elif model is None:
                 resultMap['misc'] += "; print of solution was probably incomplete because of runsolver SIGTERM/SIGKILL"
                 resultMap['status'] = 'TIMEOUT'
-            elif not self._verify_SAT(model, filepointer):
-                # fix: race condition between SIGTERM of runsolver and print of solution
-                if self.data.status == "TIMEOUT":
-                    resultMap['status'] = 'TIMEOUT'
-                    resultMap['misc'] = 'print of solution was probably incomplete because of runsolver SIGTERM/SIGKILL'
-                else:
-                    resultMap['status'] = 'CRASHED'
-                    resultMap['misc'] = "SOLVER BUG: solver returned a wrong model"
-                    # save command line call
+            else:
+                verified = self._verify_SAT(model, filepointer)
+                if verified is None:
+                    resultMap['misc'] += "; could not read instance; could not verify SAT"
+                elif not verified:
+                    # fix: race condition between SIGTERM of runsolver and print of solution
+                    if self.data.status == "TIMEOUT":
+                        resultMap['status'] = 'TIMEOUT'
+                        resultMap['misc'] = 'print of solution was probably incomplete because of runsolver SIGTERM/SIGKILL'
+                    else:
+                        resultMap['status'] = 'CRASHED'
+                        resultMap['misc'] = "SOLVER BUG: solver returned a wrong model"
+                        # save command line call
          
-        elif re.search('s UNKNOWN', data):
+        elif output.status == "UNKNOWN":
             resultMap['status'] = 'TIMEOUT'
             resultMap['misc'] = "Found s UNKNOWN line - interpreting as TIMEOUT"
-        elif re.search('INDETERMINATE', data):
+        elif output.status == "INDETERMINATE":
             resultMap['status'] = 'TIMEOUT'
             resultMap['misc'] = "Found INDETERMINATE line - interpreting as TIMEOUT"
         
@@ -133,15 +233,28 @@ class SatWrapper(AbstractWrapper):
     
     def _verify_SAT(self, model, solver_output):
         '''
-            verifies the model for self._instance 
+            verifies the model for self.data.instance
+            (in-process with --native-sat-checker, otherwise with the external --sat-checker)
             Args:
                 model : list with literals
                 solver_output: filepointer to solver output
             Returns:
                 True if model was correct
                 False if model was not correct
+                None if the instance could not be read (and there is no external checker)
         '''
-        cmd = [self.args.sat_checker, self._instance, solver_output.name]
+        if self.args.native_sat_checker:
+            # errors of corrupt gzip (zlib.error) and xz (lzma.LZMAError) instances
+            import zlib
+            import lzma
+            try:
+                return self._verify_SAT_native(model)
+            except (OSError, ValueError, EOFError, zlib.error, lzma.LZMAError) as e:
+                self.logger.warning("Could not read %s (%s)" % (self.data.instance, e))
+                if not self.args.sat_checker or not os.path.isfile(self.args.sat_checker):
+                    return None
+        
+        cmd = [self.args.sat_checker, self.data.instance, solver_output.name]
         io = Popen(cmd, stdout=PIPE, universal_newlines=True)
         out_, err_ = io.communicate()
         for line in out_.split("\n"):
@@ -152,9 +265,33 @@ class SatWrapper(AbstractWrapper):
                 return False
         return True  # should never happen
 
+    def _verify_SAT_native(self, model):
+        '''
+            verifies the model for self.data.instance in-process
+            Args:
+                model : list with literals
+            Returns:
+                True if model was correct
+                False if model was not correct
+        '''
+        if self.args.cnf_cache_dir:
+            from genericWrapper4AC.domain_specific.cnf_cache import CNFCache
+            cnf = CNFCache(cache_dir=self.args.cnf_cache_dir,
+                           max_size=self.args.cnf_cache_size).load(self.data.instance)
+        else:
+            from genericWrapper4AC.domain_specific.cnf import CNF
+            cnf = CNF.read(self.data.instance)
+        satisfied, msg = cnf.verify(model)
+        if satisfied:
+            self.logger.debug("Solution verified")
+        else:
+            self.logger.debug("Wrong solution: %s" % (msg))
+        return satisfied
+
     def _verify_via_solubility_file(self, sol):
         '''
             looks in <self.args.solubility_file> whether it is already known that the instance is UNSAT
+            (via an index of the file, see SolubilityIndex; the instance name has to match exactly)
             
             Args:
                 sol: ["SAT", "UNSAT"]
@@ -164,21 +301,19 @@ class SatWrapper(AbstractWrapper):
                 False if the instance is known as SAT
                 True otherwise
         '''
-        
-        with open(self.args.solubility_file) as fp:
-            for line in fp:
-                if line.startswith(self.data.instance):
-                    line = line.strip("\n")
-                    status = line.split(" ")[1]
-                    if status in ["SAT", "SATISFIABLE"] and sol=="UNSAT":
-                        return False
-                    elif status in ["UNSAT", "UNSATISFIABLE"] and sol=="SAT":
-                        return False
-                    else:
-                        self.logger.debug("Verified by solubility file")
-                        return True
-        self.logger.debug("Could not find instance in solubility file")      
-        return True
+        # sqlite3 is only imported if a solubility file is used
+        from genericWrapper4AC.domain_specific.solubility import SolubilityIndex
+        status = SolubilityIndex(sol_file=self.args.solubility_file).lookup(self.data.instance)
+        if status is None:
+            self.logger.debug("Could not find instance in solubility file")
+            return True
+        if status in ["SAT", "SATISFIABLE"] and sol=="UNSAT":
+            return False
+        elif status in ["UNSAT", "UNSATISFIABLE"] and sol=="SAT":
+            return False
+        else:
+            self.logger.debug("Verified by solubility file")
+            return True
         
 
 if __name__ == "__main__":
@@ -0,0 +1,126 @@
+'''
+index for solubility files ("<instance> {SATISFIABLE|UNSATISFIABLE|UNKNOWN}" per line)
+
+The index is a small sqlite database next to the solubility file
+(<sol-file>.idx); it is built once and rebuilt automatically
+if the size or modification time of the solubility file changes.
+Lookups are exact matches of the instance name.
+
+@author:     Marius Lindauer
+@copyright:  2018 ML4AAD. All rights reserved.
+@license:    BSD
+'''
+
+import os
+import logging
+import pathlib
+import sqlite3
+import tempfile
+
+
+class SolubilityIndex(object):
+    '''
+        O(1) lookup of the solubility status of an instance
+    '''
+
+    def __init__(self, sol_file: str, index_file: str = None):
+        '''
+            Arguments
+            ---------
+            sol_file: str
+                solubility file
+            index_file: str
+                index file (default: <sol_file>.idx)
+        '''
+        self.logger = logging.getLogger("SolubilityIndex")
+        self.sol_file = sol_file
+        self.index_file = index_file or sol_file + ".idx"
+        # fallback if the index cannot be written
+        self._table = None
+
+    def lookup(self, instance: str):
+        '''
+            Arguments
+            ---------
+            instance: str
+                instance name as given in the solubility file
+
+            Returns
+            -------
+            status: str
+                status of the solubility file or None if the instance is not listed
+        '''
+        if self._table is not None:
+            return self._table.get(instance)
+
+        conn = self._open_index()
+        if conn is None:
+            self._table = dict(self._read_sol_file())
+            return self._table.get(instance)
+
+        with conn:
+            row = conn.execute("SELECT status FROM solubility WHERE instance = ?",
+                               (instance,)).fetchone()
+        conn.close()
+        return row[0] if row else None
+
+    def _source_stamp(self):
+        stat = os.stat(self.sol_file)
+        return "%d:%d" % (stat.st_size, stat.st_mtime_ns)
+
+    def _open_index(self):
+        '''
+            opens the index and (re-)builds it if it is missing or outdated;
+            returns None if the index cannot be built
+        '''
+        stamp = self._source_stamp()
+        try:
+            conn = self._connect_read_only()
+            row = conn.execute("SELECT value FROM meta WHERE key = 'source'").fetchone()
+            if row and row[0] == stamp:
+                return conn
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+        try:
+            self._build_index(stamp)
+            return self._connect_read_only()
+        except (OSError, sqlite3.Error) as e:
+            self.logger.warning("Could not build index %s of solubility file: %s" % (
+                self.index_file, e))
+            return None
+
+    def _connect_read_only(self):
+        # as_uri() escapes characters with a meaning in URIs (e.g., "?", "#" and "%")
+        uri = pathlib.Path(os.path.abspath(self.index_file)).as_uri() + "?mode=ro"
+        return sqlite3.connect(uri, uri=True)
+
+    def _build_index(self, stamp: str):
+        self.logger.debug("Building index %s" % (self.index_file))
+        # build in a temporary file and move it atomically
+        # such that concurrent wrappers never see an incomplete index
+        fd, tmp_name = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(self.index_file)), suffix=".tmp")
+        os.close(fd)
+        try:
+            conn = sqlite3.connect(tmp_name)
+            with conn:
+                conn.execute("CREATE TABLE solubility (instance TEXT PRIMARY KEY, status TEXT) WITHOUT ROWID")
+                conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+                # the first entry of an instance wins
+                conn.executemany("INSERT OR IGNORE INTO solubility VALUES (?, ?)",
+                                 self._read_sol_file())
+                conn.execute("INSERT INTO meta VALUES ('source', ?)", (stamp,))
+            conn.close()
+            os.replace(tmp_name, self.index_file)
+        finally:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+
+    def _read_sol_file(self):
+        with open(self.sol_file) as fp:
+            for line in fp:
+                fields = line.split()
+                if len(fields) >= 2:
+                    yield fields[0], fields[1]
@@ -14,17 +14,26 @@ import os
 import sys
 import time
 import random
-import shutil
-import json
 import logging
-import re
-import traceback
 import tempfile
+import typing
+import copy
+import shlex
 
-from subprocess import Popen, PIPE
+from subprocess import Popen
 from tempfile import NamedTemporaryFile
 
-from genericWrapper4AC.argparser.parse import parse, get_parser, get_extended_parser
+# only the modules needed by every run are imported here;
+# optional features (asyncio API, batch mode, run cache, cgroup limits,
+# in-process targets, log tailing, core binding, ...) import their modules when used
+# (see test/test_startup)
+from genericWrapper4AC.argparser.parse import parse, get_parser, get_extended_parser, parse_run_dict, get_run_template
+from genericWrapper4AC.parsing.output_parser import OutputParser
+from genericWrapper4AC.parsing.runsolver import parse_watcher, parse_var_file
+from genericWrapper4AC.data.result import encode_result
+from genericWrapper4AC.data.resources import from_rusage, from_runsolver
+from genericWrapper4AC.supervision.supervisor import ProcessSupervisor, become_subreaper
+from genericWrapper4AC.timing.phases import PhaseTimer, process_age, update_histogram
 
 __version__ = "2.0.0"
 
@@ -36,6 +45,37 @@ def signalHandler(signum, frame):
     sys.exit(2)
 
 
+# characters which have a special meaning for the shell;
+# commands including them are passed to a shell
+SHELL_CHARS = set("|&;<>()$`*?[]{}~\n")
+
+
+def split_command(cmd: str):
+    '''
+        splits a command line string into an argv list
+        if the command does not require a shell
+
+        Arguments
+        ---------
+        cmd: str
+            command line string
+
+        Returns
+        -------
+        argv list or None if the command requires a shell
+    '''
+    if SHELL_CHARS.intersection(cmd):
+        return None
+    try:
+        argv = shlex.split(cmd)
+    except ValueError:
+        return None
+    # environment assignments, e.g., "OMP_NUM_THREADS=1 ./solver"
+    if not argv or "=" in argv[0]:
+        return None
+    return argv
+
+
 class AbstractWrapper(object):
     '''
         abstract algorithm wrapper
@@ -55,15 +95,13 @@ class AbstractWrapper(object):
 
         self.RESULT_MAPPING = {"SAT": "SUCCESS",
                                "UNSAT": "SUCCESS"}
-        self._watcher_file = None
-        self._solver_file = None
-
         self._exit_code = None
+        # the start-up of the interpreter is only part of the first run (see run())
+        self._first_run = True
 
         self._crashed_if_non_zero_status = True
-        self._use_tmpdir = False
 
-        self._subprocesses = []
+        self._reset_run_state()
 
         self._DEBUG = True
         if self._DEBUG:
@@ -76,6 +114,13 @@ class AbstractWrapper(object):
         self.parser = get_parser()
         self.args = None
 
+        # see start_fork_server()
+        self._fork_server = None
+        # signal forwarded to the running runs if a batch is stopped (see run_batch)
+        self._stop_signal = signal.SIGTERM
+        # see _get_run_template()
+        self._run_template = None
+
     def main(self, exit: bool = True):
         '''
             main method of the generic wrapper
@@ -95,13 +140,266 @@ class AbstractWrapper(object):
         signal.signal(signal.SIGQUIT, signalHandler)
         signal.signal(signal.SIGINT, signalHandler)
 
+        if "--daemon-socket" in sys.argv:
+            self.serve(socket_path=sys.argv[sys.argv.index("--daemon-socket") + 1])
+            return
+
+        if "--batch-file" in sys.argv:
+            self.main_batch()
+            return
+
+        self.run(cmd_arguments=sys.argv)
+        self.print_result_string()
+        self.write_result()
+        if exit:
+            if self.data.exit_code:
+                sys.exit(self.data.exit_code)
+            else:
+                sys.exit(0)
+
+    def run(self, cmd_arguments: typing.List[str]):
+        '''
+            parses <cmd_arguments> and executes a single target algorithm run;
+            all per-run state is reset such that the same wrapper object
+            can be used for many runs (e.g., in daemon mode)
+
+            Arguments
+            ---------
+            cmd_arguments: typing.List[str]
+                command line arguments (incl. the name of the script)
+
+            Returns
+            -------
+            data: ~genericWrapper4AC.data.data.Data
+        '''
+
+        self._reset_run_state()
+        if self._first_run:
+            self._first_run = False
+            startup = process_age()
+            if startup is not None:
+                self._timer.record("interpreter_start", startup)
+
         # returns genericWrapper4AC.data.data.Data
-        self.data, self.args = parse(cmd_arguments=sys.argv, parser=self.parser)
+        with self._timer.phase("argument_parsing"):
+            self.data, self.args = parse(cmd_arguments=cmd_arguments, parser=self.parser)
+
+        return self.execute()
+
+    def _reset_run_state(self):
+        '''
+            resets all attributes which are specific to a single run
+        '''
+        self._watcher_file = None
+        self._solver_file = None
+        # variable file of the runsolver (see --runsolver-var-file)
+        self._var_file = None
+        # ~genericWrapper4AC.parsing.runsolver.RunsolverReport (see read_runsolver_output)
+        self._runsolver_report = None
+        self._subprocesses = []
+        self._use_tmpdir = False
+        self._core_allocation = None
+        # True if the wrapper process may fork only by the fork server, i.e., if it has
+        # several threads (run_batch with more than one worker) or an event loop (run_async)
+        self._fork_unsafe = False
+        # parser fed while the target algorithm was running (see --tail-solver-output)
+        self._output_parser = None
+        # reason if the run was stopped because of --stop-if-worse-than
+        self._stopped_early = None
+        # resource usage (wait4) of the runsolver or of the target algorithm
+        self._rusage = None
+        # target algorithm executed without runsolver
+        # (see call_python_target, call_fork_server and call_cgroup_target)
+        self._target_process = None
+        # durations of the phases of the run (see phase())
+        self._timer = PhaseTimer()
+
+    def execute(self):
+        '''
+            executes the run described by self.data:
+            calls the target algorithm, reads the runsolver output,
+            processes the results and cleans up
+
+            Returns
+            -------
+            data: ~genericWrapper4AC.data.data.Data
+        '''
+
+        try:
+            run_cache = self._get_run_cache()
+            if run_cache is not None and run_cache.lookup(self.data):
+                sys.exit()
+
+            with self.phase("tmpdir_setup"):
+                runargs = self._prepare_run()
+
+            start_time = time.time()
+            if self._fork_server is not None:
+                self.call_fork_server(runargs)
+            else:
+                with self.phase("command_construction"):
+                    target_cmd = self.get_command_line_args(
+                        runargs=runargs, config=dict(self.data.config))
+                self.call_target(target_cmd)
+            self.data.time = time.time() - start_time
+            self.logger.debug("Measured wallclock time: %f" %
+                              (self.data.time))
+
+            self._process_run(run_cache)
+
+            sys.exit()
+
+        except (KeyboardInterrupt, SystemExit):
+            with self.phase("cleanup"):
+                self.cleanup()
+            self._finish_timings()
+
+        return self.data
+
+    async def run_async(self, instance: str, seed: int, cutoff: int, config: dict,
+                        specifics: str = "0", runlength: int = 0):
+        '''
+            executes a single run in the running asyncio event loop
+            (no signal handlers, no threads, no sys.exit);
+            many runs can be executed concurrently, e.g., with asyncio.gather.
+            Each run uses its own (shallow) copy of the wrapper
+            and the hooks get_command_line_args and process_results as in execute().
+            If the run is cancelled, its process tree is terminated.
+
+            Arguments
+            ---------
+            instance: str
+                problem instance
+            seed: int
+                random seed
+            cutoff: int
+                runtime cutoff
+            config: dict
+                parameter name (with prefix) -> value
+            specifics: str
+                instance specifics
+            runlength: int
+                runlength
+
+            Returns
+            -------
+            data: ~genericWrapper4AC.data.data.Data
+        '''
+        if self.args is None:
+            # global arguments (runsolver, mem-limit, ...) fall back to defaults
+            self.args, _ = self.parser.parse_known_args([])
+
+        wrapper = copy.copy(self)
+        wrapper._reset_run_state()
+        wrapper.data = parse_run_dict(run={"instance": instance, "seed": seed, "cutoff": cutoff,
+                                           "config": config, "specifics": specifics,
+                                           "runlength": runlength},
+                                      template=self._get_run_template())
+        return await wrapper.execute_async()
+
+    async def execute_async(self):
+        '''
+            asyncio version of execute() (see run_async)
+
+            Returns
+            -------
+            data: ~genericWrapper4AC.data.data.Data
+        '''
+        import asyncio
+        try:
+            run_cache = self._get_run_cache()
+            if run_cache is None or not run_cache.lookup(self.data):
+                with self.phase("tmpdir_setup"):
+                    runargs = self._prepare_run()
+                if self._fork_server is not None:
+                    await asyncio.get_running_loop().run_in_executor(
+                        None, self.call_fork_server, runargs)
+                else:
+                    with self.phase("command_construction"):
+                        target_cmd = self.get_command_line_args(
+                            runargs=runargs, config=dict(self.data.config))
+                    await self.call_target_async(target_cmd)
+                self._process_run(run_cache)
+        except SystemExit:
+            pass
+        finally:
+            # terminating the process tree (e.g., if the run was cancelled)
+            # waits for the grace period and must not block the event loop
+            if self._subprocesses:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._terminate_subprocesses)
+            with self.phase("cleanup"):
+                self.cleanup()
+            self._finish_timings()
+        return self.data
+
+    def phase(self, name: str):
+        '''
+            context manager measuring the duration of the phase <name> of the current run
+            (see ~genericWrapper4AC.timing.phases.PHASES);
+            subclasses can measure their own phases, e.g., the verification of a solution
+            in process_results (nested phases are not counted in the outer phase)
+
+            Arguments
+            ---------
+            name: str
+                name of the phase
+        '''
+        return self._timer.phase(name)
+
+    def _finish_timings(self):
+        '''
+            stores the durations of the phases in the result (see --report-timings)
+            and adds them to the histogram file (see --timing-histogram)
+        '''
+        self.data.timings = self._timer.get_timings()
+        if self.data.timing_histogram:
+            try:
+                update_histogram(self.data.timing_histogram, self.data.timings)
+            except (OSError, ValueError) as e:
+                self.logger.warning("Could not update the timing histogram %s (%s)" % (
+                    self.data.timing_histogram, e))
+
+    def _get_run_cache(self):
+        '''
+            returns the run cache (see --run-cache-dir) or None;
+            results are only cached for deterministic target algorithms (see --deterministic)
+            and if the cache can be opened
+        '''
+        if not self.data.run_cache_dir:
+            return None
+        if not self.data.deterministic:
+            self.logger.warning("The run cache is not used since the target algorithm "
+                                "is not marked as deterministic (see --deterministic)")
+            return None
+        import sqlite3
+        from genericWrapper4AC.cache.run_cache import RunCache
+        try:
+            return RunCache(cache_dir=self.data.run_cache_dir,
+                            seed_independent=self.data.seed_independent,
+                            namespace=type(self).__name__,
+                            options=self.get_cache_options())
+        except (sqlite3.Error, OSError) as e:
+            self.logger.warning("The run cache is not used since it cannot be opened: %s" % (e))
+            return None
+
+    def _prepare_run(self):
+        '''
+            sets up the temporary directories of the run
+
+            Returns
+            -------
+            runargs: dict
+                non-configuration arguments passed to get_command_line_args
+        '''
+        if self.data.reap_orphans:
+            become_subreaper()
+
         self.data.tmp_dir, algo_temp_dir = self.set_tmpdir(tmp_dir=self.data.tmp_dir)
 
         # because of legacy reasons,
         # we still pass a dictionary to get_command_line_args
-        runargs = {
+        return {
             "instance": self.data.instance,
             "specifics": self.data.specifics,
             "cutoff": self.data.cutoff,
@@ -110,50 +408,286 @@ class AbstractWrapper(object):
             "tmp": algo_temp_dir.name
         }
 
-        try:
-            target_cmd = self.get_command_line_args(
-                runargs=runargs, config=self.data.config)
+    def _process_run(self, run_cache):
+        '''
+            reads the runsolver output and the results of the target algorithm
+            (process_results) after the target algorithm was called
 
-            start_time = time.time()
-            self.call_target(target_cmd)
-            self.data.time = time.time() - start_time
-            self.logger.debug("Measured wallclock time: %f" %
-                              (self.data.time))
+            Arguments
+            ---------
+            run_cache: ~genericWrapper4AC.cache.run_cache.RunCache
+                the results are stored in the cache (if not None)
+        '''
+        with self.phase("watcher_parse"):
             self.read_runsolver_output()
-            self.logger.debug("Measured time by runsolver: %f" %
-                              (self.data.time))
+        self.logger.debug("Measured time by runsolver: %f" %
+                          (self.data.time))
+
+        # bounded capture (see --log-capture bounded/shm)
+        dropped = getattr(self._solver_file, "dropped", 0)
+        if dropped:
+            self.data.additional += "; dropped %d bytes of the target algorithm output" % (dropped)
 
+        with self.phase("result_parse"):
             resultMap = self.process_results(
                 self._solver_file, {"exit_code": self.data.exit_code, "instance": self.data.instance})
 
-            if 'status' in resultMap:
-                self.data.status = self.RESULT_MAPPING.get(
-                    resultMap['status'], resultMap['status'])
-            if 'runtime' in resultMap:
-                self.data.time = resultMap['runtime']
-            if 'quality' in resultMap:
-                self.data.cost = resultMap['quality']
-            if 'cost' in resultMap:  # overrides quality
-                self.data.cost = resultMap['cost']
-            elif 'misc' in resultMap:
-                self.data.additional += "; " + resultMap['misc']
-
-            # if quality is still set to 2**32 - 1 and we use the new format,
-            # overwrite quality with runtime, since irace only looks at the
-            # cost field
-            if self.data.new_format and self.data.cost == 2 ** 32 - 1:
-                self.data.cost = self.data.time
+        if 'status' in resultMap:
+            self.data.status = self.RESULT_MAPPING.get(
+                resultMap['status'], resultMap['status'])
+        if 'runtime' in resultMap:
+            self.data.time = resultMap['runtime']
+        if 'quality' in resultMap:
+            self.data.cost = resultMap['quality']
+        if 'cost' in resultMap:  # overrides quality
+            self.data.cost = resultMap['cost']
+        elif 'misc' in resultMap:
+            self.data.additional += "; " + resultMap['misc']
+
+        if self._output_parser is not None and self._output_parser.trajectory:
+            self.data.trajectory = self._output_parser.trajectory
+
+        if self._stopped_early:
+            best = self._output_parser.best_quality
+            self.data.status = "TIMEOUT"
+            self.data.cost = self.data.max_quality if best is None else best
+            self.data.additional += "; stopped early: %s" % (self._stopped_early)
 
-            sys.exit()
+        # if quality is still set to 2**32 - 1 and we use the new format,
+        # overwrite quality with runtime, since irace only looks at the
+        # cost field
+        if self.data.new_format and self.data.cost == 2 ** 32 - 1:
+            self.data.cost = self.data.time
+
+        # early stopped runs depend on the bounds
+        if run_cache is not None and not self._stopped_early:
+            run_cache.store(self.data)
+
+    def run_batch(self, runs: typing.Iterable[dict], n_workers: int = None):
+        '''
+            executes many runs in parallel on a bounded pool of workers;
+            each run is limited by the runsolver as a single run would be.
+            The results are yielded as soon as they are available
+            (i.e., not in the order of <runs>).
+
+            Arguments
+            ---------
+            runs: typing.Iterable[dict]
+                runs described by dictionaries with the keys
+                instance, seed, cutoff, config (dict),
+                specifics and runlength (optional)
+            n_workers: int
+                number of parallel runs;
+                if None, see get_batch_workers()
+
+            Returns
+            -------
+            generator of tuples (run: dict, data: ~genericWrapper4AC.data.data.Data);
+            if the generator is closed or interrupted (e.g., by a signal, see main_batch),
+            the pending runs are not started anymore and the running runs are terminated
+        '''
+
+        import threading
+        from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+
+        if self.args is None:
+            # global arguments (runsolver, mem-limit, ...) fall back to defaults
+            self.args, _ = self.parser.parse_known_args([])
+        if n_workers is None:
+            n_workers = self.get_batch_workers(mem_limit=self.args.mem_limit)
+
+        template = self._get_run_template()
+        # wrappers of the running runs
+        running = set()
+        lock = threading.Lock()
+        stopped = threading.Event()
+
+        def execute_run(run):
+            # each run gets its own (shallow) copy of the wrapper
+            # such that the per-run state is not shared between the threads
+            wrapper = copy.copy(self)
+            wrapper._reset_run_state()
+            wrapper._fork_unsafe = n_workers > 1
+            wrapper.data = parse_run_dict(run=run, template=template)
+            with lock:
+                if stopped.is_set():
+                    wrapper.data.status = "ABORT"
+                    return wrapper.data
+                running.add(wrapper)
+            try:
+                return wrapper.execute()
+            finally:
+                with lock:
+                    running.discard(wrapper)
+
+        executor = ThreadPoolExecutor(max_workers=n_workers)
+        futures = dict((executor.submit(execute_run, run), run) for run in runs)
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            stopped.set()
+            # concurrent.futures.Executor.shutdown(cancel_futures=True) requires Python 3.9
+            for future in futures:
+                future.cancel()
+            # the runsolver forwards the signal to the target algorithm;
+            # runs which started their target algorithm in the meantime get it as well
+            signaled = set()
+            while True:
+                with lock:
+                    supervisors = [sub for wrapper in running for sub in list(wrapper._subprocesses)]
+                for supervisor in supervisors:
+                    if supervisor not in signaled:
+                        supervisor.send_signal(self._stop_signal)
+                        signaled.add(supervisor)
+                if not wait(futures, timeout=0.1).not_done:
+                    break
+            executor.shutdown()
+
+    def _get_run_template(self):
+        '''
+            Data object with the global arguments of self.args
+            (see genericWrapper4AC.argparser.parse.get_run_template);
+            only created again if self.args changed
+        '''
+        if self._run_template is None or self._run_template[0] is not self.args:
+            self._run_template = (self.args, get_run_template(self.args))
+        return self._run_template[1]
+
+    def get_batch_workers(self, mem_limit: int):
+        '''
+            number of parallel runs in batch mode:
+            at most one run per available core
+            and not more runs than fit into the physical memory
+
+            Arguments
+            ---------
+            mem_limit: int
+                memory limit per run in MB
+        '''
+        try:
+            n_cores = len(os.sched_getaffinity(0))
+        except AttributeError:
+            n_cores = os.cpu_count() or 1
+        try:
+            mem_mb = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // 1024 ** 2
+        except (ValueError, OSError):
+            return n_cores
+        return max(1, min(n_cores, mem_mb // max(1, mem_limit)))
 
+    def main_batch(self):
+        '''
+            executes all runs of the file given by --batch-file
+            and prints one JSON line per run as soon as it finished;
+            if the wrapper receives SIGTERM, SIGINT or SIGQUIT, the running runs are terminated
+            and all runs without result are printed as ABORT
+        '''
+        import json
+        self.args, _ = self.parser.parse_known_args(sys.argv[1:])
+
+        with open(self.args.batch_file) as fp:
+            runs = [json.loads(line) for line in fp if line.strip()]
+
+        def stop_batch(signum, frame):
+            # further signals must not interrupt the termination of the running runs
+            for other in (signal.SIGTERM, signal.SIGQUIT, signal.SIGINT):
+                signal.signal(other, signal.SIG_IGN)
+            # run_batch forwards the signal to the running runs
+            self._stop_signal = signum
+            sys.exit(2)
+
+        for signum in (signal.SIGTERM, signal.SIGQUIT, signal.SIGINT):
+            signal.signal(signum, stop_batch)
+
+        def print_result(run, data):
+            self.data = data
+            result = dict(run)
+            result.update(self.get_result_dict())
+            sys.stdout.write(json.dumps(result) + "\n")
+            sys.stdout.flush()
+
+        if self.args.fork_server:
+            self.start_fork_server()
+        # ids of the runs with printed results
+        finished = set()
+        batch = self.run_batch(runs=runs, n_workers=self.args.batch_workers)
+        try:
+            for run, data in batch:
+                print_result(run, data)
+                finished.add(id(run))
         except (KeyboardInterrupt, SystemExit):
-            self.cleanup()
-            self.print_result_string()
-            if exit:
-                if self.data.exit_code:
-                    sys.exit(self.data.exit_code)
-                else:
-                    sys.exit(0)
+            # terminates the running runs (if the signal was not received in run_batch)
+            batch.close()
+            template = self._get_run_template()
+            for run in runs:
+                if id(run) not in finished:
+                    data = parse_run_dict(run=run, template=template)
+                    data.status = "ABORT"
+                    data.additional = "; batch was stopped by a signal"
+                    print_result(run, data)
+            raise
+        finally:
+            self.stop_fork_server()
+
+    def serve(self, socket_path: str):
+        '''
+            runs the wrapper as a long-lived daemon
+            which serves run requests on the unix socket <socket_path>
+            (see genericWrapper4AC.daemon.client for the client side)
+
+            Arguments
+            ---------
+            socket_path: str
+                path of the unix socket
+        '''
+
+        from genericWrapper4AC.daemon.server import WrapperServer
+
+        # the start-up of the daemon is not part of its runs
+        self._first_run = False
+        if "--fork-server" in sys.argv:
+            self.start_fork_server()
+        server = WrapperServer(socket_path=socket_path, wrapper=self)
+        self.logger.info("Serving target algorithm runs on %s" % (socket_path))
+        try:
+            server.serve_forever()
+        except (KeyboardInterrupt, SystemExit):
+            pass
+        finally:
+            server.server_close()
+            self.stop_fork_server()
+
+    def prepare(self):
+        '''
+            hook for expensive initializations of the target algorithm
+            (e.g., loading models or instance libraries);
+            called once in the template process of the fork server (see start_fork_server).
+            The default implementation does nothing.
+        '''
+        pass
+
+    def start_fork_server(self):
+        '''
+            starts the fork server ("warm pool"):
+            a template process calls prepare() once
+            and all following runs are executed in forks of this template
+            (without runsolver, limited with setrlimit;
+            callables returned by get_command_line_args are called in the fork,
+            command lines are exec'd)
+        '''
+        from genericWrapper4AC.inprocess.fork_server import ForkServer
+
+        if self._fork_server is None:
+            self._fork_server = ForkServer(wrapper=self)
+            self.logger.info("Started fork server (pid %d)" % (self._fork_server.pid))
+
+    def stop_fork_server(self):
+        '''
+            terminates the template process of the fork server (if started)
+        '''
+        if self._fork_server is not None:
+            self._fork_server.stop()
+            self._fork_server = None
 
     def set_tmpdir(self, tmp_dir):
         '''
@@ -174,7 +708,7 @@ class AbstractWrapper(object):
 
         if not os.path.isdir(tmp_dir):
             self.data.status = "ABORT"
-            self.data.additional = "temp directory is missing - should have been at %s." % (args.tmp_dir)
+            self.data.additional = "temp directory is missing - should have been at %s." % (tmp_dir)
             self.data.exit_code = 1
             sys.exit(1)
 
@@ -183,96 +717,493 @@ class AbstractWrapper(object):
 
         return tmp_dir, algo_tmp_dir
 
-    def call_target(self, target_cmd: str):
+    def call_target(self, target_cmd: typing.Union[str, typing.List[str], typing.Callable]):
         '''
             extends the target algorithm command line call with the runsolver
             and executes it
 
             Arguments
             --------
-            target_cmd: str
-                target cmd (from get_command_line_args)
+            target_cmd: typing.Union[str, typing.List[str], typing.Callable]
+                target cmd (from get_command_line_args);
+                either an argv list (executed directly without a shell)
+                or a string (split into an argv list if it does not
+                require any shell features, otherwise executed by a shell)
+                or a Python callable (see call_python_target)
                 
         '''
-        random_id = random.randint(0, 1000000)
-        self._watcher_file = NamedTemporaryFile(
-            suffix=".log", prefix="watcher-%d-" % (random_id), dir=self.data.tmp_dir, delete=False)
-        self._solver_file = NamedTemporaryFile(
-            suffix=".log", prefix="solver-%d-" % (random_id), dir=self.data.tmp_dir, delete=False)
+        if callable(target_cmd):
+            self.call_python_target(target_cmd)
+            return
 
-        runsolver_cmd = [self.data.runsolver, "-M", self.data.mem_limit, "-C", self.data.cutoff,
-                         "-w", "\"%s\"" % (self._watcher_file.name),
-                         "-o", "\"%s\"" % (self._solver_file.name)]
+        if self.data.limit_backend == "cgroup":
+            from genericWrapper4AC.limits.cgroup import delegated_cgroup
+            try:
+                cgroup = delegated_cgroup()
+            except OSError as e:
+                self.logger.warning("cgroup v2 limits not available (%s); falling back to runsolver" % (e))
+            else:
+                self.call_cgroup_target(target_cmd, cgroup=cgroup)
+                return
 
-        runsolver_cmd = " ".join(map(str, runsolver_cmd)) + " " + target_cmd
-        # for debugging
-        self.logger.debug("Calling runsolver. Command-line:")
-        self.logger.debug(runsolver_cmd)
+        runsolver_cmd, shell, cmd_str = self._get_runsolver_cmd(target_cmd)
+        tailer = self._get_tailer()
 
         # run
         try:
-            io = Popen(runsolver_cmd, shell=True,
-                       preexec_fn=os.setpgrp, universal_newlines=True)
-            self._subprocesses.append(io)
-            io.wait()
-            self._subprocesses.remove(io)
+            # start_new_session instead of preexec_fn since the latter
+            # is not safe in the presence of threads (batch mode)
+            with self.phase("process_spawn"):
+                io = Popen(runsolver_cmd, shell=shell,
+                           start_new_session=True, universal_newlines=True)
+            supervisor = ProcessSupervisor(io, orphans=self.data.reap_orphans)
+            self._subprocesses.append(supervisor)
+            if tailer is not None:
+                tailer.start()
+            with self.phase("target_exit"):
+                supervisor.wait()
+            self._subprocesses.remove(supervisor)
+            self._rusage = supervisor.rusage
             if io.stdout:
                 io.stdout.flush()
+            if tailer is not None:
+                tailer.finish()
+                self._output_parser = tailer.parser
+        except OSError:
+            self.data.status = "ABORT"
+            self.data.additional = "execution failed: %s" % (cmd_str)
+            self._exit_code = 1
+            sys.exit(1)
+        finally:
+            if self._core_allocation is not None and not self._subprocesses:
+                self._core_allocation.release()
+        self._solver_file.seek(0)
+        self._watcher_file.seek(0)
+
+    def _get_runsolver_cmd(self, target_cmd: typing.Union[str, typing.List[str]]):
+        '''
+            creates the log files and
+            extends the target algorithm command line call with the runsolver
+
+            Returns
+            -------
+            (runsolver_cmd: typing.Union[str, typing.List[str]], shell: bool, cmd_str: str)
+                the runsolver cmd is a string if it has to be executed by a shell
+        '''
+        # before any log file is created since the run can be aborted
+        if self.data.cores_per_run:
+            self._acquire_cores()
+        self._create_log_files(watcher=True)
+
+        runsolver_cmd = [self.data.runsolver]
+        if self.data.mem_limit is not None:
+            runsolver_cmd += ["-M", self.data.mem_limit]
+        if self.data.cutoff is not None:
+            runsolver_cmd += ["-C", self.data.cutoff]
+        runsolver_cmd += ["-w", self._watcher_file.name,
+                          "-o", self._solver_file.name]
+        if self._var_file is not None:
+            runsolver_cmd += ["-v", self._var_file.name]
+
+        if self._core_allocation is not None:
+            runsolver_cmd += ["--phys-cores", str(self._core_allocation)]
+
+        runsolver_cmd = list(map(str, runsolver_cmd))
+
+        if isinstance(target_cmd, str):
+            target_argv = split_command(target_cmd)
+        else:
+            target_argv = list(map(str, target_cmd))
+
+        if target_argv is None:
+            # compatibility path: the target cmd requires a shell
+            shell = True
+            runsolver_cmd = " ".join(map(shlex.quote, runsolver_cmd)) + " " + target_cmd
+            cmd_str = runsolver_cmd
+        else:
+            shell = False
+            runsolver_cmd += target_argv
+            cmd_str = " ".join(map(shlex.quote, runsolver_cmd))
+
+        # for debugging
+        self.logger.debug("Calling runsolver. Command-line:")
+        self.logger.debug(cmd_str)
+
+        return runsolver_cmd, shell, cmd_str
+
+    def _acquire_cores(self):
+        '''
+            allocates --cores-per-run cores for the run (see --core-lock-dir);
+            the run is reported as ABORT if no cores are free within --core-wait-timeout seconds
+            or if the machine has fewer cores than requested
+
+            Returns
+            -------
+            allocation: ~genericWrapper4AC.scheduling.cores.CoreAllocation
+        '''
+        from genericWrapper4AC.scheduling.cores import CoreScheduler
+        try:
+            self._core_allocation = CoreScheduler(lock_dir=self.data.core_lock_dir).acquire(
+                n_cores=self.data.cores_per_run, timeout=self.data.core_wait_timeout)
+        except ValueError as e:
+            self.data.status = "ABORT"
+            self.data.additional += "; %s" % (e)
+            self._exit_code = 1
+            sys.exit(1)
+        if self._core_allocation is None:
+            self.data.status = "ABORT"
+            self.data.additional += "; no %d free cores within %g seconds" % (
+                self.data.cores_per_run, self.data.core_wait_timeout)
+            self._exit_code = 1
+            sys.exit(1)
+        self.data.additional += "; cores: %s" % (
+            " ".join(map(str, self._core_allocation.cores)))
+        return self._core_allocation
+
+    def _create_log_files(self, watcher: bool):
+        '''
+            creates the solver file and (if <watcher>) the watcher file of the runsolver
+            in --temp-file-dir or in /dev/shm (see --log-capture);
+            with --log-capture bounded or shm, the solver file is a FIFO read into a bounded buffer
+            (see --log-head-size and --log-buffer-size)
+
+            Arguments
+            ---------
+            watcher: bool
+                create a watcher file
+        '''
+        random_id = random.randint(0, 1000000)
+        log_dir = self.data.tmp_dir
+        if self.data.log_capture == "shm":
+            from genericWrapper4AC.capture.fifo import shm_dir
+            log_dir = shm_dir(fallback=self.data.tmp_dir)
+        if watcher:
+            self._watcher_file = NamedTemporaryFile(
+                suffix=".log", prefix="watcher-%d-" % (random_id), dir=log_dir, delete=False)
+            if self.data.runsolver_var_file:
+                self._var_file = NamedTemporaryFile(
+                    suffix=".txt", prefix="vars-%d-" % (random_id), dir=log_dir, delete=False)
+        if self.data.log_capture == "disk":
+            self._solver_file = NamedTemporaryFile(
+                suffix=".log", prefix="solver-%d-" % (random_id), dir=log_dir, delete=False)
+        else:
+            from genericWrapper4AC.capture.fifo import FifoLog
+            from genericWrapper4AC.capture.buffer import HeadTailBuffer
+            buffer = HeadTailBuffer(head=self.data.log_head_size * 1024 ** 2,
+                                    tail=self.data.log_buffer_size * 1024 ** 2,
+                                    patterns=self.get_capture_patterns())
+            self._solver_file = FifoLog(dir=log_dir, prefix="solver-%d-" % (random_id), buffer=buffer)
+
+    def _get_tailer(self):
+        '''
+            returns the reader of the solver output while the target algorithm is running
+            (start()/finish() or start_async()/finish_async()) or None:
+            with --log-capture disk, a LogTailer of the solver file if the output
+            has to be parsed during the run (see --tail-solver-output and --stop-if-worse-than);
+            with --log-capture bounded or shm, the solver file itself (a FIFO which has
+            to be read in any case; it feeds the LogTailer, if any)
+        '''
+        tailer = None
+        if self.data.tail_output or self.data.stop_bounds:
+            from genericWrapper4AC.parsing.tail import LogTailer
+            tailer = LogTailer(path=self._solver_file.name,
+                               parser=self.get_output_parser(),
+                               check=self._check_dominated if self.data.stop_bounds else None)
+        if self.data.log_capture != "disk":
+            # the FIFO can only be read once
+            self._solver_file.tailer = tailer
+            return self._solver_file
+        return tailer
+
+    async def call_target_async(self, target_cmd: typing.Union[str, typing.List[str], typing.Callable]):
+        '''
+            asyncio version of call_target:
+            the runsolver is waited for and its output is read in the event loop
+            (see ~genericWrapper4AC.supervision.supervisor.ProcessSupervisor.wait_async
+            and the start_async methods of the tailers);
+            the cgroup backend is executed by call_target in the default executor
+            of the event loop; Python callables require the fork server (see call_python_target)
+
+            Arguments
+            --------
+            target_cmd: typing.Union[str, typing.List[str], typing.Callable]
+                target cmd (from get_command_line_args)
+        '''
+        import asyncio
+        if callable(target_cmd):
+            # the event loop may run executor threads (see call_python_target)
+            self._fork_unsafe = True
+            self.call_python_target(target_cmd)
+            return
+        if self.data.limit_backend == "cgroup":
+            await asyncio.get_running_loop().run_in_executor(None, self.call_target, target_cmd)
+            return
+
+        runsolver_cmd, shell, cmd_str = self._get_runsolver_cmd(target_cmd)
+        tailer = self._get_tailer()
+
+        try:
+            # not an asyncio subprocess since its child watcher would reap the runsolver
+            # before wait4 gets its resource usage
+            with self.phase("process_spawn"):
+                io = Popen(runsolver_cmd, shell=shell,
+                           start_new_session=True, universal_newlines=True)
+            supervisor = ProcessSupervisor(io, orphans=self.data.reap_orphans)
+            self._subprocesses.append(supervisor)
+            if tailer is not None:
+                tailer.start_async()
+            with self.phase("target_exit"):
+                await supervisor.wait_async()
+            self._subprocesses.remove(supervisor)
+            self._rusage = supervisor.rusage
+            if tailer is not None:
+                await tailer.finish_async()
+                self._output_parser = tailer.parser
+        except asyncio.CancelledError:
+            # stops reading the output (the process tree is terminated by execute_async)
+            if tailer is not None:
+                tailer.finish()
+            raise
         except OSError:
             self.data.status = "ABORT"
-            self.data.additional = "execution failed: %s" % (
-                " ".join(map(str, runsolver_cmd)))
+            self.data.additional = "execution failed: %s" % (cmd_str)
             self._exit_code = 1
             sys.exit(1)
+        finally:
+            if self._core_allocation is not None and not self._subprocesses:
+                self._core_allocation.release()
         self._solver_file.seek(0)
         self._watcher_file.seek(0)
 
+    def call_python_target(self, target: typing.Callable):
+        '''
+            executes a Python callable as target algorithm in a forked child process,
+            i.e., without runsolver and without starting a new interpreter.
+            The output of the callable (stdout and stderr) is written to the solver file;
+            CPU time and memory are limited with setrlimit (RLIMIT_CPU, RLIMIT_AS)
+            and for the whole process tree by sampling /proc.
+            In batch mode with more than one worker and in the asyncio API,
+            the run is reported as ABORT (forking a multi-threaded process
+            can deadlock the child; use the fork server instead).
+
+            Arguments
+            --------
+            target: typing.Callable
+                called without arguments (e.g., a functools.partial)
+        '''
+        if self._fork_unsafe:
+            # locks held by other threads at the time of the fork are never released in the child
+            self.data.status = "ABORT"
+            self.data.additional += "; Python targets require the fork server (--fork-server) " \
+                                    "in batch mode with more than one worker and in the asyncio API"
+            self._exit_code = 1
+            sys.exit(1)
+        from genericWrapper4AC.inprocess.forked_process import ForkedProcess
+        self.logger.debug("Calling Python target %s in a forked process" % (target))
+        self._call_without_runsolver(lambda solver_file: ForkedProcess(
+            target=target, output_fd=solver_file.fileno(),
+            cutoff=self.data.cutoff, mem_limit=self.data.mem_limit))
+
+    def call_fork_server(self, runargs: dict):
+        '''
+            executes the target algorithm in a fork of the template process
+            of the fork server (see start_fork_server);
+            get_command_line_args is called in the template
+            such that it can use the state set up by prepare()
+
+            Arguments
+            --------
+            runargs: dict
+                passed to get_command_line_args
+        '''
+        self.logger.debug("Calling target algorithm in a fork of the template process")
+        self._call_without_runsolver(lambda solver_file: self._fork_server.start_run(
+            runargs=runargs, config=dict(self.data.config), cutoff=self.data.cutoff,
+            mem_limit=self.data.mem_limit, output=solver_file.name))
+        self.logger.debug("Measured time from fork to exit: %f" % (self._target_process.wall))
+
+    def call_cgroup_target(self, target_cmd: typing.Union[str, typing.List[str]], cgroup: str):
+        '''
+            executes the target algorithm in its own cgroup (see --limit-backend)
+            instead of calling it with runsolver
+
+            Arguments
+            --------
+            target_cmd: typing.Union[str, typing.List[str]]
+                target cmd (from get_command_line_args)
+            cgroup: str
+                delegated cgroup (see genericWrapper4AC.limits.cgroup.delegated_cgroup)
+        '''
+        if isinstance(target_cmd, str):
+            target_argv = split_command(target_cmd)
+            if target_argv is None:
+                target_argv = ["/bin/sh", "-c", target_cmd]
+        else:
+            target_argv = list(map(str, target_cmd))
+
+        cores = None
+        if self.data.cores_per_run:
+            cores = self._acquire_cores().cores
+
+        self.logger.debug("Calling target algorithm in a cgroup of %s. Command-line:" % (cgroup))
+        self.logger.debug(" ".join(map(shlex.quote, target_argv)))
+
+        from genericWrapper4AC.limits.cgroup import CgroupProcess
+        try:
+            self._call_without_runsolver(lambda solver_file: CgroupProcess(
+                cmd=target_argv, output=solver_file, parent=cgroup,
+                cutoff=self.data.cutoff, mem_limit=self.data.mem_limit, cores=cores))
+        finally:
+            if self._core_allocation is not None and not self._subprocesses:
+                self._core_allocation.release()
+
+    def _call_without_runsolver(self, start: typing.Callable):
+        '''
+            creates the solver file and
+            waits for the target process returned by <start>(solver_file)
+        '''
+        self._create_log_files(watcher=False)
+
+        tailer = self._get_tailer()
+
+        with self.phase("process_spawn"):
+            self._target_process = start(self._solver_file)
+        supervisor = ProcessSupervisor(self._target_process, orphans=self.data.reap_orphans)
+        self._subprocesses.append(supervisor)
+        if tailer is not None:
+            tailer.start()
+        with self.phase("target_exit"):
+            supervisor.wait()
+        self._subprocesses.remove(supervisor)
+        self._rusage = supervisor.rusage
+        if tailer is not None:
+            tailer.finish()
+            self._output_parser = tailer.parser
+        self._solver_file.seek(0)
+
+    def _read_target_process(self):
+        '''
+            extracts runtime, status and exit code of a target executed
+            without runsolver (by call_python_target, call_fork_server or call_cgroup_target);
+            equivalent to read_runsolver_output
+        '''
+        process = self._target_process
+        self.data.time = process.cpu_time
+        if process.memout:
+            self.data.status = "TIMEOUT"
+            self.data.memout = True
+            self.data.additional += " memory limit was exceeded"
+        elif process.timeout:
+            self.data.status = "TIMEOUT"
+        if process.term_signal is None:
+            self.data.exit_code = process.returncode
+        self.data.resources = process.resources
+
+    def _check_dominated(self, parser: OutputParser, elapsed: float):
+        '''
+            terminates the running target algorithm if the best quality so far
+            is worse than one of the bounds of --stop-if-worse-than
+
+            Arguments
+            ---------
+            parser: ~genericWrapper4AC.parsing.output_parser.OutputParser
+                parser fed with the output so far
+            elapsed: float
+                elapsed wallclock time in seconds
+
+            Returns
+            -------
+            True if the target algorithm was terminated
+        '''
+        best = parser.best_quality
+        for cost, after in self.data.stop_bounds:
+            if elapsed >= after and (best is None or best > cost):
+                self._stopped_early = "best quality %s was worse than %g after %g sec" % (
+                    best, cost, after)
+                self.logger.debug("Stop target algorithm: %s" % (self._stopped_early))
+                for sub in self._subprocesses:
+                    # the runsolver forwards the signal to the target algorithm
+                    sub.send_signal(signal.SIGTERM)
+                return True
+        return False
+
     def float_regex(self):
-        return '[+-]?\d+(?:\.\d+)?(?:[eE][+-]\d+)?'
+        return r'[+-]?\d+(?:\.\d+)?(?:[eE][+-]\d+)?'
 
     def read_runsolver_output(self):
         '''
-            reads self._watcher_file, 
+            reads self._watcher_file (and the variable file, see --runsolver-var-file)
+            in a single pass (see ~genericWrapper4AC.parsing.runsolver),
             extracts runtime
             and returns if memout or timeout found
         '''
+        if self._target_process is not None:
+            self._read_target_process()
+            return
+
         self.logger.debug("Reading runsolver output from %s" %
                           (self._watcher_file.name))
         try:
-            data = str(self._watcher_file.read().decode("utf8"))
-        except:
+            # the exit code of the target algorithm is only in the watcher file
+            report = parse_watcher(self._watcher_file.read())
+            if self._var_file is not None:
+                with open(self._var_file.name, "rb") as fp:
+                    parse_var_file(fp.read(), report=report)
+        except OSError:
             # due to the common, rare runsolver bug,
             # the watcher file can be corrupted and can failed to be read
             self.data.exit_code = 0
-            self.logger.warn(
+            self.logger.warning(
                 "Failed to read runsolver's watcher file---trust own wc-time measurment")
+            # the runsolver waited for the target algorithm
+            if self._rusage is not None:
+                self.data.resources = from_rusage(self._rusage)
             return
+        self._runsolver_report = report
+        self.data.resources = from_runsolver(report)
 
-        if (re.search('runsolver_max_cpu_time_exceeded', data) or re.search('Maximum CPU time exceeded', data)):
+        if report.timeout:
             self.data.status = "TIMEOUT"
 
-        if (re.search('runsolver_max_memory_limit_exceeded', data) or re.search('Maximum VSize exceeded', data)):
+        if report.memout:
             self.data.status = "TIMEOUT"
+            self.data.memout = True
             self.data.additional += " memory limit was exceeded"
 
-        cpu_pattern1 = re.compile('^runsolver_cputime: (%s)' % (
-            self.float_regex()), re.MULTILINE)
-        cpu_match1 = re.search(cpu_pattern1, data)
+        if report.cpu_time is not None:
+            self.data.time = report.cpu_time
 
-        cpu_pattern2 = re.compile('^CPU time \\(s\\): (%s)' % (
-            self.float_regex()), re.MULTILINE)
-        cpu_match2 = re.search(cpu_pattern2, data)
+        if report.exit_code is not None:
+            self.data.exit_code = report.exit_code
 
-        if (cpu_match1):
-            self.data.time = float(cpu_match1.group(1))
-        if (cpu_match2):
-            self.data.time = float(cpu_match2.group(1))
+    def get_result_dict(self):
+        '''
+            returns the result in the new AClib format as a dictionary
+        '''
+
+        # ensure a minimal runtime of 0.0005
+        self.data.time = max(0.0005, self.data.time)
 
-        exitcode_pattern = re.compile('Child status: ([0-9]+)')
-        exitcode_match = re.search(exitcode_pattern, data)
+        if self.args.overwrite_cost_runtime:
+            self.data.cost = self.data.time
 
-        if (exitcode_match):
-            self.data.exit_code = int(exitcode_match.group(1))
+        result = {"status": str(self.data.status),
+                  "cost": float(self.data.cost),
+                  "runtime": float(self.data.time),
+                  "misc": str(self.data.additional)
+                  }
+        if self.data.trajectory:
+            if all(t is not None for t, _ in self.data.trajectory):
+                result["trajectory"] = [[t, q] for t, q in self.data.trajectory]
+            else:
+                # the times are only known with --tail-solver-output
+                result["qualities"] = [q for _, q in self.data.trajectory]
+        # resource usage (see ~genericWrapper4AC.data.resources)
+        for name, value in self.data.resources.items():
+            result[name] = value
+        if self.data.report_timings and self.data.timings:
+            result["timings"] = dict(self.data.timings)
+        return result
 
     def print_result_string(self):
         '''
@@ -281,18 +1212,10 @@ class AbstractWrapper(object):
               if it new call string format was used
         '''
 
-        # ensure a minimal runtime of 0.0005
-        self.data.time = max(0.0005, self.data.time)
-
-        if self.args.overwrite_cost_runtime:
-            self.data.cost = self.data.time
+        aclib2_out_dict = self.get_result_dict()
 
         if self.data.new_format:
-            aclib2_out_dict = {"status": str(self.data.status),
-                               "cost": float(self.data.cost),
-                               "runtime": float(self.data.time),
-                               "misc": str(self.data.additional)
-                               }
+            import json
             print("Result of this algorithm run: %s" %
                   (json.dumps(aclib2_out_dict)))
 
@@ -307,62 +1230,146 @@ class AbstractWrapper(object):
         sys.stdout.write("\n")
         sys.stdout.flush()
 
+    def get_result_payload(self):
+        '''
+            returns the result (see get_result_dict) encoded in --result-format;
+            falls back to JSON if msgpack is not installed
+        '''
+        result = self.get_result_dict()
+        try:
+            return encode_result(result, result_format=self.args.result_format)
+        except ImportError:
+            self.logger.error("msgpack is not installed; writing the result as JSON")
+            return encode_result(result, result_format="json")
+
+    def write_result(self):
+        '''
+            writes the result (see get_result_dict) to --result-file and/or --result-fd
+            such that callers do not have to scan stdout;
+            falls back to JSON if msgpack is not installed
+        '''
+        if self.args is None or (self.args.result_file is None and self.args.result_fd is None):
+            return
+
+        payload = self.get_result_payload()
+        if self.args.result_file is not None:
+            with open(self.args.result_file, "wb") as fp:
+                fp.write(payload)
+        if self.args.result_fd is not None:
+            with os.fdopen(self.args.result_fd, "wb", closefd=False) as fp:
+                fp.write(payload)
+
     def cleanup(self):
         '''
             cleanup if error occurred or external signal handled
         '''
         if (len(self._subprocesses) > 0):
-            print("killing the target run!")
-            try:
-                for sub in self._subprocesses:
-                    # sub.terminate()
-                    Popen(["pkill", "-TERM", "-P", str(sub.pid)],
-                          universal_newlines=True)
-                    self.logger.debug("Wait %d seconds ..." %
-                                      (self._DELAY2KILL))
-                    time.sleep(self._DELAY2KILL)
-                    if sub.returncode is None:  # still running
-                        sub.kill()
-
-                self.logger.debug(
-                    "done... If anything in the subprocess tree fork'd a new process group, we may not have caught everything...")
-                self.data.additional += "; forced to exit by signal or keyboard interrupt."
-                self.data.time = self.data.cutoff
-            except (OSError, KeyboardInterrupt, SystemExit):
-                self.data.additional += "; forced to exit by multiple signals/interrupts."
-                self.data.time = self.data.cutoff
-
-        if (self.data.status is "ABORT" or self.data.status is "CRASHED"):
+            self._terminate_subprocesses()
+
+        if self._core_allocation is not None:
+            self._core_allocation.release()
+
+        if self.data.status in ["ABORT", "CRASHED"]:
             if self.data.exit_code:
                 self.data.additional += '; Problem with run. Exit code was %d.' % (
                     self.data.exit_code)
             else:
                 self.data.additional += '; Problem with run. Exit code was N/A.'
 
-            if (self._watcher_file and self._solver_file):
-                self.data.additional += '; Preserving runsolver output at %s - preserving target algorithm output at %s' % (
-                    self._watcher_file.name or "<none>", self._solver_file.name or "<none>")
-
         try:
             if self._watcher_file:
                 self._watcher_file.close()
             if self._solver_file:
                 self._solver_file.close()
+            if self._var_file:
+                self._var_file.close()
+                os.remove(self._var_file.name)
 
+            # in-process targets (call_python_target) have no watcher file
+            log_files = [f for f in (self._watcher_file, self._solver_file) if f]
             if self.data.status not in ["ABORT", "CRASHED"]:
-                os.remove(self._watcher_file.name)
-                os.remove(self._solver_file.name)
-            elif self._use_tmpdir:
-                shutil.copy(self._watcher_file.name, ".")
-                shutil.copy(self._solver_file.name, ".")
-                os.remove(self._watcher_file.name)
-                os.remove(self._solver_file.name)
+                for log_file in log_files:
+                    os.remove(log_file.name)
+            elif self._watcher_file and self._solver_file:
+                watcher_path, solver_path = self._preserve_logs(log_files)
+                self.data.additional += '; Preserving runsolver output at %s - preserving target algorithm output at %s' % (
+                    watcher_path, solver_path)
+            elif self._solver_file:
+                solver_path, = self._preserve_logs(log_files)
+                self.data.additional += '; Preserving target algorithm output at %s' % (
+                    solver_path)
 
         except (OSError, KeyboardInterrupt, SystemExit):
             self.data.additional = "problems removing temporary cd files during cleanup."
         except AttributeError:
             pass  # in internal mode, these files are not generated
 
+    def _terminate_subprocesses(self):
+        '''
+            terminates the process trees of the running target algorithms
+            (blocks for up to _DELAY2KILL seconds)
+        '''
+        print("killing the target run!")
+        try:
+            for supervisor in list(self._subprocesses):
+                # SIGTERM to the whole process tree, SIGKILL after at most _DELAY2KILL seconds
+                self.logger.debug("Terminate process tree of %d (grace period: %d seconds) ..." % (
+                    supervisor.pid, self._DELAY2KILL))
+                supervisor.terminate(grace=self._DELAY2KILL)
+                self._subprocesses.remove(supervisor)
+
+            self.logger.debug("done...")
+            self.data.additional += "; forced to exit by signal or keyboard interrupt."
+            self.data.time = self.data.cutoff
+        except (OSError, KeyboardInterrupt, SystemExit):
+            self.data.additional += "; forced to exit by multiple signals/interrupts."
+            self.data.time = self.data.cutoff
+
+    def _preserve_logs(self, log_files: typing.List):
+        '''
+            moves the (closed) log files of an ABORT/CRASHED run
+            to the working directory and compresses them (see --log-compression);
+            the solver output of --log-capture bounded/shm only contains the kept part
+            (see _create_log_files)
+
+            Arguments
+            ---------
+            log_files: typing.List
+                watcher and/or solver file
+
+            Returns
+            -------
+            paths: typing.List[str]
+                paths of the preserved logs
+        '''
+        import shutil
+        from genericWrapper4AC.capture.compress import COMPRESSIONS, copy_compressed
+
+        compression = self.data.log_compression
+        if compression == "zstd":
+            try:
+                import zstandard
+            except ImportError:
+                self.logger.error("zstandard is not installed; compressing the logs with gzip")
+                compression = "gzip"
+
+        paths = []
+        for log_file in log_files:
+            if self.data.log_capture != "shm" and not self._use_tmpdir:
+                # already in the working directory
+                path = log_file.name
+            else:
+                path = os.path.abspath(os.path.basename(log_file.name))
+            path += COMPRESSIONS[compression]
+
+            if compression != "none":
+                copy_compressed(log_file.name, path, compression=compression)
+                os.remove(log_file.name)
+            elif path != log_file.name:
+                shutil.move(log_file.name, path)
+            paths.append(path)
+        return paths
+
     def get_command_line_args(self, runargs, config):
         '''
         Returns the command call list containing arguments to execute the implementing subclass' solver.
@@ -374,9 +1381,55 @@ class AbstractWrapper(object):
             config: a mapping from parameter name (with prefix) to parameter value.
         Returns:
             A command call list to execute a target algorithm.
+            An argv list is executed directly (without a shell);
+            a string is only passed to a shell if it requires shell features (e.g., pipes);
+            a Python callable (e.g., a functools.partial) is called in a forked process without runsolver.
         '''
         raise NotImplementedError()
 
+    def get_output_parser(self):
+        '''
+        Returns a new ~genericWrapper4AC.parsing.output_parser.OutputParser
+        for the output of the target algorithm; used by parse_output().
+        The default implementation returns a parser without any patterns.
+        '''
+        return OutputParser()
+
+    def get_cache_options(self):
+        '''
+        Returns the wrapper-specific options which change the result of a run
+        (e.g., how the output is verified) as a dictionary;
+        they are part of the key of the run cache (see --run-cache-dir).
+        The default implementation returns an empty dictionary.
+        '''
+        return {}
+
+    def get_capture_patterns(self):
+        '''
+        Returns the regular expressions of the lines of the target algorithm output
+        which are kept by the bounded capture (see --log-head-size) even if they are
+        neither in the head nor in the tail of the output.
+        The default implementation returns the patterns of get_output_parser().
+        '''
+        return self.get_output_parser().patterns
+
+    def parse_output(self, filepointer):
+        '''
+        Parses the target algorithm output line by line with the parser of get_output_parser().
+        Subclasses can use this in process_results() instead of reading the whole output.
+        If the output was already parsed while the target algorithm was running
+        (see --tail-solver-output), that parser is returned without reading the output again.
+
+        Args:
+            filepointer: a pointer to the file containing the solver execution standard out.
+        Returns:
+            the ~genericWrapper4AC.parsing.output_parser.OutputParser after parsing
+        '''
+        if self._output_parser is None:
+            self.logger.debug("reading solver results from %s" % (getattr(filepointer, "name", "<stream>")))
+            self._output_parser = self.get_output_parser().parse(filepointer)
+        return self._output_parser
+
     def process_results(self, filepointer, out_args):
         '''
         Parse a results file to extract the run's status (SUCCESS/CRASHED/etc) and other optional results.
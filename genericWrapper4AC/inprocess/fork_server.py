@@ -0,0 +1,274 @@
+'''
+fork server ("warm pool"):
+a template process runs the prepare() hook of the wrapper once;
+each run is a fork of this template such that the per-run overhead
+does not depend on the start-up costs of the target algorithm
+
+Protocol (unix socket, one connection per run, one JSON object per line):
+    wrapper -> template: {"runargs": {...}, "config": {...}, "cutoff": <int>,
+                          "mem_limit": <int>, "output": <path of the solver file>}
+    template -> wrapper: {"pid": <pid of the run>}
+    template -> wrapper: {"returncode": <int>, "term_signal": <int>, "memout": <bool>,
+                          "timeout": <bool>, "utime": <float>, "stime": <float>, "wall": <float>,
+                          "tree_cpu_time": <float>, "resources": {...}}
+    (or {"error": <str>} if the run could not be started)
+
+@author:     Marius Lindauer
+@copyright:  2018 ML4AAD. All rights reserved.
+@license:    BSD
+'''
+
+import os
+import sys
+import json
+import time
+import signal
+import shutil
+import socket
+import tempfile
+import traceback
+import socketserver
+
+from genericWrapper4AC.inprocess.forked_process import ForkedProcess
+
+
+def exec_command(cmd):
+    '''
+        replaces the current (forked) process by the command <cmd>;
+        a string is executed by a shell
+
+        Arguments
+        ---------
+        cmd: typing.Union[str, typing.List[str]]
+    '''
+    if isinstance(cmd, str):
+        cmd = ["/bin/sh", "-c", cmd]
+    os.execvp(cmd[0], [str(arg) for arg in cmd])
+
+
+class TemplateRequestHandler(socketserver.StreamRequestHandler):
+    '''
+        handles a single run in a fork of the (prepared) template process
+    '''
+
+    def handle(self):
+        request = json.loads(self.rfile.readline().decode("utf8"))
+        try:
+            target = self.server.wrapper.get_command_line_args(
+                runargs=request["runargs"], config=request["config"])
+        except Exception as e:
+            traceback.print_exc()
+            self._send({"error": repr(e)})
+            return
+        if not callable(target):
+            cmd = target
+            target = lambda: exec_command(cmd)
+
+        with open(request["output"], "ab") as output:
+            start_time = time.monotonic()
+            process = ForkedProcess(target=target, output_fd=output.fileno(),
+                                    cutoff=request["cutoff"], mem_limit=request["mem_limit"])
+            self._send({"pid": process.pid})
+            process.wait()
+            wall = time.monotonic() - start_time
+
+        self._send({"returncode": process.returncode,
+                    "term_signal": process.term_signal,
+                    "memout": process.memout,
+                    "timeout": process.timeout,
+                    "utime": process.rusage.ru_utime,
+                    "stime": process.rusage.ru_stime,
+                    "wall": wall,
+                    "tree_cpu_time": process.tree_cpu_time,
+                    "resources": dict(process.resources, wall_time=wall)})
+
+    def _send(self, msg: dict):
+        self.wfile.write((json.dumps(msg) + "\n").encode("utf8"))
+        self.wfile.flush()
+
+
+class TemplateServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+
+    def __init__(self, socket_path: str, wrapper):
+        self.wrapper = wrapper
+        socketserver.UnixStreamServer.__init__(
+            self, socket_path, TemplateRequestHandler)
+
+
+class ForkServerRun(object):
+    '''
+        run executed by the fork server;
+        provides the same interface as
+        ~genericWrapper4AC.inprocess.forked_process.ForkedProcess
+    '''
+
+    def __init__(self, sock: socket.socket):
+        self._sock = sock
+        self._rfile = sock.makefile("rb")
+        self.returncode = None
+        self.term_signal = None
+        self.memout = False
+        self.timeout = False
+        self.utime = None
+        self.stime = None
+        self.wall = None
+        self.tree_cpu_time = 0.
+        self.resources = {}
+
+        msg = self._receive()
+        if "error" in msg:
+            self._close()
+            raise RuntimeError("fork server could not start the run: %s" % (msg["error"]))
+        self.pid = msg["pid"]
+
+    def _receive(self):
+        line = self._rfile.readline()
+        if not line:
+            raise RuntimeError("fork server closed the connection")
+        return json.loads(line.decode("utf8"))
+
+    def _close(self):
+        self._rfile.close()
+        self._sock.close()
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self):
+        if self.returncode is None:
+            try:
+                msg = self._receive()
+            finally:
+                self._close()
+            self.returncode = msg["returncode"]
+            self.term_signal = msg["term_signal"]
+            self.memout = msg["memout"]
+            self.timeout = msg["timeout"]
+            self.utime = msg["utime"]
+            self.stime = msg["stime"]
+            self.wall = msg["wall"]
+            self.tree_cpu_time = msg.get("tree_cpu_time", 0.)
+            self.resources = msg.get("resources", {})
+        return self.returncode
+
+    @property
+    def cpu_time(self):
+        '''
+            CPU time (user + system) of the run
+            (see ~genericWrapper4AC.inprocess.forked_process.ForkedProcess.cpu_time);
+            None if it is still running
+        '''
+        if self.utime is None:
+            return None
+        return max(self.utime + self.stime, self.tree_cpu_time)
+
+    def send_signal(self, signum: int):
+        # the run is the leader of its own process group
+        if self.returncode is None:
+            try:
+                os.killpg(self.pid, signum)
+            except ProcessLookupError:
+                pass
+
+    def terminate(self):
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self):
+        self.send_signal(signal.SIGKILL)
+
+
+class ForkServer(object):
+    '''
+        starts and stops the template process
+        and requests runs from it
+    '''
+
+    def __init__(self, wrapper):
+        '''
+            forks the template process and waits until wrapper.prepare() finished
+
+            Arguments
+            ---------
+            wrapper: ~genericWrapper4AC.generic_wrapper.AbstractWrapper
+                wrapper whose prepare() and get_command_line_args() are called in the template
+        '''
+        self._socket_dir = tempfile.mkdtemp(prefix="gw4ac-fork-server-")
+        self.socket_path = os.path.join(self._socket_dir, "template.sock")
+
+        # make sure that buffered output is not written twice
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        ready_r, ready_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # template
+            os.close(ready_r)
+            self._run_template(wrapper, ready_w)
+        os.close(ready_w)
+        self.pid = pid
+
+        with os.fdopen(ready_r, "rb") as ready:
+            msg = ready.read().decode("utf8")
+        if msg != "ready":
+            self.stop()
+            raise RuntimeError("fork server could not be started: %s" % (msg))
+
+    def _run_template(self, wrapper, ready_w):
+        exit_code = 1
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            server = TemplateServer(socket_path=self.socket_path, wrapper=wrapper)
+            try:
+                wrapper.prepare()
+            except Exception as e:
+                traceback.print_exc()
+                os.write(ready_w, repr(e).encode("utf8"))
+                raise
+            os.write(ready_w, b"ready")
+            os.close(ready_w)
+            server.serve_forever()
+            exit_code = 0
+        finally:
+            os._exit(exit_code)
+
+    def start_run(self, runargs: dict, config: dict, cutoff: int, mem_limit: int, output: str):
+        '''
+            starts a run in a fork of the template
+
+            Arguments
+            ---------
+            runargs: dict
+                passed to get_command_line_args
+            config: dict
+                passed to get_command_line_args
+            cutoff: int
+                CPU time limit in seconds
+            mem_limit: int
+                memory limit in MB
+            output: str
+                file the output of the run is appended to
+
+            Returns
+            -------
+            run: ForkServerRun
+        '''
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(self.socket_path)
+        request = {"runargs": runargs, "config": config, "cutoff": cutoff,
+                   "mem_limit": mem_limit, "output": output}
+        sock.sendall((json.dumps(request) + "\n").encode("utf8"))
+        return ForkServerRun(sock)
+
+    def stop(self):
+        '''
+            terminates the template process
+        '''
+        if self.pid is not None:
+            try:
+                os.kill(self.pid, signal.SIGTERM)
+                os.waitpid(self.pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+            self.pid = None
+        shutil.rmtree(self._socket_dir, ignore_errors=True)
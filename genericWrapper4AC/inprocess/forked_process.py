@@ -0,0 +1,252 @@
+'''
+executes a Python callable as target algorithm in a forked child process
+(i.e., without runsolver and without starting a new interpreter);
+CPU time and memory are limited via setrlimit for each process
+and for the whole process tree by sampling /proc (as the runsolver does)
+
+@author:     Marius Lindauer
+@copyright:  2018 ML4AAD. All rights reserved.
+@license:    BSD
+'''
+
+import os
+import sys
+import math
+import time
+import select
+import signal
+import typing
+import resource
+import traceback
+
+from genericWrapper4AC.data.resources import from_rusage
+from genericWrapper4AC.supervision.supervisor import pidfd_open
+
+# message of the child if it ran out of memory
+MEMOUT = b"memout"
+
+
+def read_tree_usage(pid: int):
+    '''
+        CPU time and virtual memory of the process tree of <pid>
+        (the processes in the session of <pid> and the descendants of <pid>);
+        the CPU time includes the waited-for children of the processes
+
+        Returns
+        -------
+        (cpu_time: float, vsize: int)
+            in seconds and bytes
+    '''
+    stats = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open("/proc/%s/stat" % (entry), "rb") as fp:
+                stat = fp.read()
+        except OSError:
+            continue
+        # the command name may contain spaces and parentheses
+        stats[int(entry)] = stat[stat.rindex(b")") + 2:].split()
+
+    children = {}
+    for child, fields in stats.items():
+        children.setdefault(int(fields[1]), []).append(child)
+    members = set(member for member, fields in stats.items() if int(fields[3]) == pid)
+    stack = [pid]
+    while stack:
+        member = stack.pop()
+        if member in stats:
+            members.add(member)
+            stack.extend(children.get(member, []))
+
+    # utime, stime, cutime, cstime (in clock ticks) and vsize (in bytes)
+    ticks = sum(sum(int(value) for value in stats[member][11:15]) for member in members)
+    vsize = sum(int(stats[member][20]) for member in members)
+    return ticks / os.sysconf("SC_CLK_TCK"), vsize
+
+
+class ForkedProcess(object):
+    '''
+        forked child executing a Python callable;
+        provides the parts of the subprocess.Popen interface
+        used by the generic wrapper (pid, returncode, wait, send_signal, kill)
+    '''
+
+    def __init__(self, target: typing.Callable, output_fd: int,
+                 cutoff: int = None, mem_limit: int = None, poll_interval: float = 0.1):
+        '''
+            Arguments
+            ---------
+            target: typing.Callable
+                called without arguments in the child;
+                everything written to stdout/stderr goes to <output_fd>
+            output_fd: int
+                file descriptor of the solver output file
+            cutoff: int
+                CPU time limit in seconds (of the whole process tree)
+            mem_limit: int
+                limit of the address space in MB (of the whole process tree)
+            poll_interval: float
+                seconds between two samples of the process tree (see read_tree_usage)
+        '''
+        self.cutoff = cutoff
+        self.mem_limit = mem_limit
+        self.poll_interval = poll_interval
+        # CPU time of the process tree in the last sample
+        self.tree_cpu_time = 0.
+        self.returncode = None
+        self.term_signal = None
+        self.memout = False
+        self.timeout = False
+        self.rusage = None
+        self.wall_time = None
+
+        # make sure that buffered output is not written twice
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        status_r, status_w = os.pipe()
+        self._start_time = time.monotonic()
+        pid = os.fork()
+        if pid == 0:  # child
+            os.close(status_r)
+            self._run_child(target, output_fd, cutoff, mem_limit, status_w)
+        os.close(status_w)
+        self.pid = pid
+        self._status_fd = status_r
+
+    @staticmethod
+    def _run_child(target, output_fd, cutoff, mem_limit, status_w):
+        exit_code = 1
+        try:
+            os.setsid()
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            os.dup2(output_fd, 1)
+            os.dup2(output_fd, 2)
+            # sys.stdout/sys.stderr may have been replaced (e.g., by redirect_stdout)
+            sys.stdout = open(1, "w", closefd=False)
+            sys.stderr = open(2, "w", closefd=False)
+            resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+            # the rlimits only apply to each process on its own (and are inherited);
+            # the limits of the whole tree are enforced by ForkedProcess.wait
+            if cutoff is not None:
+                # SIGXCPU at the cutoff, SIGKILL shortly after
+                soft = int(math.ceil(cutoff))
+                resource.setrlimit(resource.RLIMIT_CPU, (soft, soft + 2))
+            if mem_limit is not None:
+                limit = int(mem_limit) * 1024 ** 2
+                resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+            target()
+            exit_code = 0
+        except MemoryError:
+            os.write(status_w, MEMOUT)
+            exit_code = 1
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except BaseException:
+            traceback.print_exc()
+            exit_code = 1
+        finally:
+            try:
+                sys.stdout.flush()
+                sys.stderr.flush()
+            finally:
+                os._exit(exit_code)
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self):
+        '''
+            waits for the child and collects its exit status and resource usage
+        '''
+        if self.returncode is None:
+            if self.cutoff is not None or self.mem_limit is not None:
+                self._limit_tree()
+            _, status, self.rusage = os.wait4(self.pid, 0)
+            self.wall_time = time.monotonic() - self._start_time
+            if os.WIFSIGNALED(status):
+                self.term_signal = os.WTERMSIG(status)
+                self.returncode = -self.term_signal
+            else:
+                self.returncode = os.WEXITSTATUS(status)
+            self.memout = self.memout or os.read(self._status_fd, len(MEMOUT)) == MEMOUT
+            # SIGXCPU is only sent if RLIMIT_CPU (i.e., the cutoff) was reached
+            self.timeout = self.timeout or self.term_signal == signal.SIGXCPU or \
+                (self.term_signal == signal.SIGKILL and self.cutoff is not None
+                 and self.cpu_time >= self.cutoff)
+            os.close(self._status_fd)
+        return self.returncode
+
+    def _limit_tree(self):
+        '''
+            samples the process tree of the child until the child exits
+            and kills the tree if its CPU time exceeds the cutoff
+            or its virtual memory exceeds the memory limit
+        '''
+        fd = pidfd_open(self.pid)
+        if fd is None:
+            return
+        try:
+            while True:
+                if fd != -1:
+                    if select.select([fd], [], [], self.poll_interval)[0]:
+                        return
+                elif os.waitid(os.P_PID, self.pid, os.WEXITED | os.WNOHANG | os.WNOWAIT) is not None:
+                    return
+                else:
+                    time.sleep(self.poll_interval)
+
+                self.tree_cpu_time, vsize = read_tree_usage(self.pid)
+                if self.cutoff is not None and self.tree_cpu_time >= self.cutoff:
+                    self.timeout = True
+                elif self.mem_limit is not None and vsize > int(self.mem_limit) * 1024 ** 2:
+                    self.memout = True
+                else:
+                    continue
+                self.kill()
+                return
+        finally:
+            if fd != -1:
+                os.close(fd)
+
+    @property
+    def cpu_time(self):
+        '''
+            CPU time (user + system) of the child and its waited-for descendants
+            (at least the CPU time of the whole tree in the last sample);
+            None if it is still running
+        '''
+        if self.rusage is None:
+            return None
+        return max(self.rusage.ru_utime + self.rusage.ru_stime, self.tree_cpu_time)
+
+    @property
+    def resources(self):
+        '''
+            resource usage of the child (see ~genericWrapper4AC.data.resources);
+            empty if it is still running
+        '''
+        if self.rusage is None:
+            return {}
+        return from_rusage(self.rusage, wall_time=self.wall_time)
+
+    def send_signal(self, signum: int):
+        if self.returncode is None:
+            try:
+                os.killpg(self.pid, signum)
+            except ProcessLookupError:
+                # the child has not called setsid() yet
+                try:
+                    os.kill(self.pid, signum)
+                except ProcessLookupError:
+                    pass
+
+    def terminate(self):
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self):
+        self.send_signal(signal.SIGKILL)
@@ -0,0 +1,399 @@
+'''
+cgroup v2 resource limits as an alternative to runsolver:
+each run is executed in its own child cgroup of a delegated cgroup;
+memory is limited by memory.max (i.e., on the resident memory and not on the virtual memory),
+the CPU time is read from cpu.stat,
+the resource usage from cpu.stat, memory.peak and io.stat
+and memory outs are detected by the oom_kill counter of memory.events
+
+@author:     Marius Lindauer
+@copyright:  2018 ML4AAD. All rights reserved.
+@license:    BSD
+'''
+
+import os
+import time
+import atexit
+import random
+import signal
+import typing
+import logging
+
+from subprocess import Popen, STDOUT, TimeoutExpired
+
+CGROUP_ROOT = "/sys/fs/cgroup"
+
+# moves the shell into the cgroup given as $0 before exec'ing the target;
+# thread-safe alternative to preexec_fn
+ENTER_CGROUP = 'echo $$ > "$0/cgroup.procs" && exec "$@"'
+
+# cgroup delegated to the wrapper (see delegated_cgroup)
+_delegated = None
+# leaf cgroup the wrapper moved itself into (see delegated_cgroup)
+_leaf = None
+
+
+def read_keyed_file(path: str):
+    '''
+        reads a flat keyed file of the cgroup v2 interface
+        (e.g., cpu.stat or memory.events)
+
+        Arguments
+        ---------
+        path: str
+            path of the file (lines of the form "<key> <int>")
+
+        Returns
+        -------
+        values: typing.Dict[str, int]
+    '''
+    values = {}
+    with open(path) as fp:
+        for line in fp:
+            fields = line.split()
+            if len(fields) == 2:
+                values[fields[0]] = int(fields[1])
+    return values
+
+
+def read_io_stat(path: str):
+    '''
+        reads the io.stat file of the cgroup v2 interface
+
+        Arguments
+        ---------
+        path: str
+            path of the file (lines of the form "<major>:<minor> <key>=<int> ...")
+
+        Returns
+        -------
+        values: typing.Dict[str, int]
+            sums over all devices
+    '''
+    values = {}
+    with open(path) as fp:
+        for line in fp:
+            for field in line.split()[1:]:
+                key, _, value = field.partition("=")
+                values[key] = values.get(key, 0) + int(value)
+    return values
+
+
+def own_cgroup(root: str = CGROUP_ROOT):
+    '''
+        path of the cgroup v2 of the current process
+    '''
+    with open("/proc/self/cgroup") as fp:
+        for line in fp:
+            if line.startswith("0::"):
+                return os.path.join(root, line.strip()[3:].lstrip("/"))
+    raise OSError("process is not in a cgroup v2 hierarchy")
+
+
+def delegated_cgroup(root: str = CGROUP_ROOT):
+    '''
+        returns a cgroup in which the wrapper can create child cgroups
+        with the memory controller enabled;
+        since cgroup v2 does not allow processes in inner cgroups,
+        the wrapper moves itself into a leaf cgroup if necessary.
+        Raises OSError if cgroups are not delegated to the wrapper.
+
+        Arguments
+        ---------
+        root: str
+            mount point of the cgroup v2 hierarchy
+
+        Returns
+        -------
+        path: str
+    '''
+    global _delegated, _leaf
+    if _delegated is not None:
+        return _delegated
+
+    if not os.path.exists(os.path.join(root, "cgroup.controllers")):
+        raise OSError("no cgroup v2 hierarchy mounted at %s" % (root))
+    base = own_cgroup(root=root)
+    with open(os.path.join(base, "cgroup.controllers")) as fp:
+        if "memory" not in fp.read().split():
+            raise OSError("memory controller not available in %s" % (base))
+    if not os.access(base, os.W_OK):
+        raise OSError("cgroup %s is not delegated" % (base))
+
+    with open(os.path.join(base, "cgroup.subtree_control")) as fp:
+        subtree_control = fp.read().split()
+    if "memory" not in subtree_control:
+        leaf = os.path.join(base, "gw4ac-wrapper-%d" % (os.getpid()))
+        os.makedirs(leaf, exist_ok=True)
+        try:
+            with open(os.path.join(leaf, "cgroup.procs"), "w") as fp:
+                fp.write(str(os.getpid()))
+            with open(os.path.join(base, "cgroup.subtree_control"), "w") as fp:
+                fp.write("+memory")
+        except OSError:
+            # the wrapper must not stay in the leaf if the memory controller is not enabled
+            try:
+                with open(os.path.join(base, "cgroup.procs"), "w") as fp:
+                    fp.write(str(os.getpid()))
+                os.rmdir(leaf)
+            except OSError as e:
+                logging.getLogger("GenericWrapper").warning("Could not remove cgroup %s: %s" % (leaf, e))
+            raise
+        _leaf = leaf
+        atexit.register(release_delegated_cgroup)
+
+    _delegated = base
+    return _delegated
+
+
+def release_delegated_cgroup():
+    '''
+        undoes the changes of delegated_cgroup (called at exit):
+        moves the wrapper back from its leaf cgroup into the delegated cgroup
+        and removes the leaf; skipped if other processes are still in the leaf
+    '''
+    global _delegated, _leaf
+    if _leaf is None:
+        return
+    leaf, _leaf, _delegated = _leaf, None, None
+    base = os.path.dirname(leaf)
+    try:
+        with open(os.path.join(leaf, "cgroup.procs")) as fp:
+            if fp.read().split() != [str(os.getpid())]:
+                return
+        # processes are only allowed in cgroups without controllers for their children
+        with open(os.path.join(base, "cgroup.subtree_control"), "w") as fp:
+            fp.write("-memory")
+        with open(os.path.join(base, "cgroup.procs"), "w") as fp:
+            fp.write(str(os.getpid()))
+        os.rmdir(leaf)
+    except OSError as e:
+        logging.getLogger("GenericWrapper").debug("Could not remove cgroup %s: %s" % (leaf, e))
+
+
+class CgroupProcess(object):
+    '''
+        target algorithm run in its own cgroup;
+        provides the same interface as
+        ~genericWrapper4AC.inprocess.forked_process.ForkedProcess
+    '''
+
+    # terminate(grace) stops all processes of the run (see ProcessSupervisor.terminate)
+    terminates_tree = True
+
+    def __init__(self, cmd: typing.List[str], output, parent: str,
+                 cutoff: int = None, mem_limit: int = None,
+                 cores: typing.List[int] = None, poll_interval: float = 0.05):
+        '''
+            creates the cgroup and starts <cmd> in it
+
+            Arguments
+            ---------
+            cmd: typing.List[str]
+                argv of the target algorithm
+            output: file
+                file for stdout and stderr of the target algorithm
+            parent: str
+                delegated cgroup (see delegated_cgroup)
+            cutoff: int
+                CPU time limit in seconds (of all processes in the cgroup)
+            mem_limit: int
+                memory limit in MB
+            cores: typing.List[int]
+                cores the run is bound to (if the cpuset controller is enabled)
+            poll_interval: float
+                seconds between two checks of the CPU time
+        '''
+        self.cutoff = cutoff
+        self.poll_interval = poll_interval
+        self.returncode = None
+        self.term_signal = None
+        self.memout = False
+        self.timeout = False
+        self.cpu_stat = {}
+        self.memory_events = {}
+        self.memory_peak = None
+        self.io_stat = {}
+        self.wall_time = None
+
+        self.path = os.path.join(parent, "gw4ac-run-%d-%d" % (os.getpid(), random.randint(0, 1000000)))
+        os.mkdir(self.path)
+        try:
+            if mem_limit is not None:
+                self._write("memory.max", str(int(mem_limit) * 1024 ** 2))
+                if os.path.exists(os.path.join(self.path, "memory.swap.max")):
+                    self._write("memory.swap.max", "0")
+            if cores and os.path.exists(os.path.join(self.path, "cpuset.cpus")):
+                self._write("cpuset.cpus", ",".join(map(str, cores)))
+
+            self._popen = Popen(["/bin/sh", "-c", ENTER_CGROUP, self.path] + list(map(str, cmd)),
+                                stdout=output, stderr=STDOUT, start_new_session=True)
+            self._start_time = time.monotonic()
+        except Exception:
+            os.rmdir(self.path)
+            raise
+        self.pid = self._popen.pid
+
+    def _write(self, name: str, value: str):
+        with open(os.path.join(self.path, name), "w") as fp:
+            fp.write(value)
+
+    def _usage(self):
+        return read_keyed_file(os.path.join(self.path, "cpu.stat"))["usage_usec"] / 1000000
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self):
+        '''
+            waits for the run; kills all processes in the cgroup
+            if their CPU time exceeds the cutoff
+        '''
+        if self.returncode is not None:
+            return self.returncode
+
+        while True:
+            try:
+                self._popen.wait(timeout=self.poll_interval)
+                break
+            except TimeoutExpired:
+                pass
+            if self.cutoff is not None and self._usage() >= self.cutoff:
+                self.timeout = True
+                self.kill()
+        self.wall_time = time.monotonic() - self._start_time
+
+        # processes which left the process group of the target
+        # are still in the cgroup
+        self.kill()
+        self.cpu_stat = read_keyed_file(os.path.join(self.path, "cpu.stat"))
+        self.memory_events = read_keyed_file(os.path.join(self.path, "memory.events"))
+        self.memout = self.memory_events.get("oom_kill", 0) > 0
+        # memory.peak requires Linux 5.19, io.stat the io controller
+        try:
+            with open(os.path.join(self.path, "memory.peak")) as fp:
+                self.memory_peak = int(fp.read())
+        except (OSError, ValueError):
+            pass
+        try:
+            self.io_stat = read_io_stat(os.path.join(self.path, "io.stat"))
+        except (OSError, ValueError):
+            pass
+        self._remove()
+
+        self.returncode = self._popen.returncode
+        if self.returncode < 0:
+            self.term_signal = -self.returncode
+        return self.returncode
+
+    def _remove(self, timeout: float = 1):
+        end = time.monotonic() + timeout
+        while True:
+            try:
+                os.rmdir(self.path)
+                return
+            except OSError as e:  # killed processes are still exiting
+                if time.monotonic() > end:
+                    # the run itself is still reported
+                    logging.getLogger("GenericWrapper").warning(
+                        "Could not remove cgroup %s: %s" % (self.path, e))
+                    return
+                time.sleep(0.01)
+
+    @property
+    def cpu_time(self):
+        '''
+            CPU time (user + system) of all processes of the cgroup;
+            None if the run is still running
+        '''
+        if "usage_usec" not in self.cpu_stat:
+            return None
+        return self.cpu_stat["usage_usec"] / 1000000
+
+    @property
+    def resources(self):
+        '''
+            resource usage of all processes of the cgroup
+            (see ~genericWrapper4AC.data.resources);
+            empty if the run is still running
+        '''
+        if self.wall_time is None:
+            return {}
+        resources = {"wall_time": self.wall_time}
+        for name, key in [("user_time", "user_usec"), ("system_time", "system_usec")]:
+            if key in self.cpu_stat:
+                resources[name] = self.cpu_stat[key] / 1000000
+        if self.memory_peak is not None:
+            # not the resident memory (see RESOURCE_FIELDS)
+            resources["peak_memory_mb"] = self.memory_peak / 1024 ** 2
+        for name, key in [("read_bytes", "rbytes"), ("write_bytes", "wbytes")]:
+            if key in self.io_stat:
+                resources[name] = self.io_stat[key]
+        return resources
+
+    def send_signal(self, signum: int):
+        if self.returncode is None:
+            try:
+                os.killpg(self.pid, signum)
+            except ProcessLookupError:
+                pass
+
+    def terminate(self, grace: float = None):
+        '''
+            sends SIGTERM to the process group of the target;
+            with <grace> (e.g., if the run is interrupted), SIGTERM is sent to all processes
+            in the cgroup, the remaining ones are killed after <grace> seconds,
+            the target is reaped and the cgroup is removed
+
+            Arguments
+            ---------
+            grace: float
+                seconds between SIGTERM and SIGKILL
+        '''
+        if grace is None:
+            self.send_signal(signal.SIGTERM)
+            return
+        if self.returncode is not None:  # cgroup already removed
+            return
+
+        # wait() can be interrupted after it removed the cgroup
+        if os.path.isdir(self.path):
+            from genericWrapper4AC.supervision.supervisor import wait_for_exit
+            wait_for_exit(self._signal_all(signal.SIGTERM), timeout=grace)
+            self.kill()
+            self._popen.wait()
+            self._remove()
+        else:
+            self._popen.wait()
+        self.returncode = self._popen.returncode
+        if self.returncode < 0:
+            self.term_signal = -self.returncode
+
+    def kill(self):
+        '''
+            kills all processes in the cgroup
+        '''
+        if self.returncode is not None:  # cgroup already removed
+            return
+        if os.path.exists(os.path.join(self.path, "cgroup.kill")):
+            self._write("cgroup.kill", "1")
+            return
+        # kernels < 5.14
+        self._signal_all(signal.SIGKILL)
+
+    def _signal_all(self, signum: int):
+        '''
+            sends <signum> to all processes in the cgroup
+
+            Returns
+            -------
+            pids: typing.List[int]
+        '''
+        with open(os.path.join(self.path, "cgroup.procs")) as fp:
+            pids = [int(pid) for pid in fp.read().split()]
+        for pid in pids:
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
+        return pids
@@ -0,0 +1,138 @@
+'''
+incremental, line-by-line parsing of the target algorithm output
+
+@author:     Marius Lindauer
+@copyright:  2018 ML4AAD. All rights reserved.
+@license:    BSD
+'''
+
+import re
+import typing
+
+
+class OutputParser(object):
+    '''
+        base class for parsers of the target algorithm output.
+        Subclasses register regular expressions together with handlers;
+        the output is fed line by line and for each line, the handler
+        of the first matching pattern is called.
+        Parsing stops as soon as a handler marks the parser as done,
+        i.e., the remaining output is never read.
+    '''
+
+    def __init__(self):
+        self._patterns = []
+        self.done = False
+        # anytime trajectory: list of (elapsed wallclock time, quality);
+        # the time is only known if the output is parsed while the target is running
+        self.trajectory = []
+        self.elapsed = None
+
+    def register(self, pattern: str, handler: typing.Callable):
+        '''
+            registers a pattern; patterns are tried in the order of registration
+
+            Arguments
+            ---------
+            pattern: str
+                regular expression (searched in each line)
+            handler: typing.Callable
+                called with the match object and the line
+        '''
+        self._patterns.append((re.compile(pattern), handler))
+
+    @property
+    def patterns(self):
+        '''
+            registered regular expressions (compiled, in the order of registration)
+        '''
+        return [regex for regex, _ in self._patterns]
+
+    def record_quality(self, quality: float):
+        '''
+            adds an intermediate quality to the trajectory
+
+            Arguments
+            ---------
+            quality: float
+                quality reported by the target algorithm (minimization)
+        '''
+        self.trajectory.append((self.elapsed, quality))
+
+    @property
+    def best_quality(self):
+        '''
+            best (i.e., smallest) quality reported so far; None if none was reported
+        '''
+        if not self.trajectory:
+            return None
+        return min(quality for _, quality in self.trajectory)
+
+    def feed(self, line: typing.Union[str, bytes]):
+        '''
+            parses a single line of output
+
+            Arguments
+            ---------
+            line: typing.Union[str, bytes]
+                line of the target algorithm output
+
+            Returns
+            -------
+            done: bool
+                True if no further output is required
+        '''
+        if self.done:
+            return True
+        if isinstance(line, bytes):
+            line = line.decode("utf8", errors="replace")
+        for regex, handler in self._patterns:
+            match = regex.search(line)
+            if match:
+                handler(match, line)
+                break
+        return self.done
+
+    def parse(self, filepointer: typing.Iterable):
+        '''
+            feeds all lines of <filepointer> until the parser is done
+
+            Arguments
+            ---------
+            filepointer: typing.Iterable
+                file (text or binary mode) or any other iterable of lines
+
+            Returns
+            -------
+            self
+        '''
+        for line in filepointer:
+            if self.feed(line):
+                break
+        return self
+
+
+class QualityOutputParser(OutputParser):
+    '''
+        parser for quality-optimizing target algorithms
+        which print intermediate qualities;
+        by default, each line consisting of a single number is a quality
+    '''
+
+    FLOAT_REGEX = r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?"
+
+    def __init__(self, pattern: str = None):
+        '''
+            Arguments
+            ---------
+            pattern: str
+                regular expression whose first group is the quality
+                (default: a line with a single number)
+        '''
+        OutputParser.__init__(self)
+        if pattern is None:
+            pattern = r"^\s*(%s)\s*$" % (self.FLOAT_REGEX)
+        self.register(pattern, self._read_quality)
+
+    def _read_quality(self, match, line):
+        self.record_quality(float(match.group(1)))
@@ -0,0 +1,172 @@
+'''
+single-pass parsing of the runsolver output:
+the watcher file (-w) and the variable file (-v)
+
+@author:     Marius Lindauer
+@copyright:  2018 ML4AAD. All rights reserved.
+@license:    BSD
+'''
+
+import re
+
+FLOAT = rb"[+-]?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?"
+
+# messages of limit violations (can be part of a longer line)
+TIMEOUT_MESSAGES = [b"Maximum CPU time exceeded", b"runsolver_max_cpu_time_exceeded"]
+MEMOUT_MESSAGES = [b"Maximum VSize exceeded", b"runsolver_max_memory_limit_exceeded"]
+
+# all other information extracted from the watcher file in a single pass;
+# lines are matched by the preceding newline instead of "^"
+# since the regular expression engine searches much faster for a literal
+WATCHER_PATTERN = re.compile(
+    rb"\n(?:"
+    rb"Child status: (?P<exit_code>\d+)"
+    rb"|Child ended because it received signal (?P<signal>\d+)"
+    rb"|Real time \(s\): (?P<wall_time>" + FLOAT + rb")"
+    rb"|CPU time \(s\): (?P<cpu_time>" + FLOAT + rb")"
+    rb"|runsolver_cputime: (?P<old_cpu_time>" + FLOAT + rb")"
+    rb"|CPU user time \(s\): (?P<user_time>" + FLOAT + rb")"
+    rb"|CPU system time \(s\): (?P<system_time>" + FLOAT + rb")"
+    rb"|Max\. virtual memory \(cumulated for all children\) \(KiB\): (?P<max_vm>\d+)"
+    rb"|Max\. memory \(cumulated for all children\) \(KiB\): (?P<max_rss>\d+)"
+    rb"|\[startup\+(?P<sample>" + FLOAT + rb") s\]"
+    # getrusage(RUSAGE_CHILDREN) of the runsolver
+    rb"|maximum resident set size= (?P<rusage_max_rss>\d+)"
+    rb"|block input operations= (?P<block_input>\d+)"
+    rb"|block output operations= (?P<block_output>\d+)"
+    rb"|voluntary context switches= (?P<voluntary_context_switches>\d+)"
+    rb"|involuntary context switches= (?P<involuntary_context_switches>\d+)"
+    rb")")
+
+# fields of RunsolverReport with integer values
+INT_FIELDS = {"exit_code", "signal", "max_vm", "max_rss", "block_input", "block_output",
+              "voluntary_context_switches", "involuntary_context_switches"}
+
+# variable of the variable file -> (field of RunsolverReport, type)
+VARIABLES = {b"WCTIME": ("wall_time", float),
+             b"CPUTIME": ("cpu_time", float),
+             b"USERTIME": ("user_time", float),
+             b"SYSTEMTIME": ("system_time", float),
+             b"MAXVM": ("max_vm", int),
+             b"TIMEOUT": ("timeout", lambda value: value == b"true"),
+             b"MEMOUT": ("memout", lambda value: value == b"true")}
+
+
+class RunsolverReport(object):
+    '''
+        accounting of a run by the runsolver;
+        fields are None if the runsolver did not report them
+    '''
+
+    __slots__ = ["timeout", "memout", "exit_code", "signal", "wall_time", "cpu_time",
+                 "user_time", "system_time", "max_vm", "max_rss", "samples",
+                 "block_input", "block_output",
+                 "voluntary_context_switches", "involuntary_context_switches"]
+
+    def __init__(self):
+        # limit violations
+        self.timeout = False
+        self.memout = False
+        # exit code of the target algorithm or the signal which killed it
+        self.exit_code = None
+        self.signal = None
+        # seconds
+        self.wall_time = None
+        self.cpu_time = None
+        self.user_time = None
+        self.system_time = None
+        # peak virtual and resident memory of all processes (KiB)
+        self.max_vm = None
+        self.max_rss = None
+        # number of times the runsolver sampled the process tree
+        self.samples = 0
+        # block I/O operations (512 bytes) and context switches of all processes
+        self.block_input = None
+        self.block_output = None
+        self.voluntary_context_switches = None
+        self.involuntary_context_switches = None
+
+    def __repr__(self):
+        return "RunsolverReport(%s)" % (", ".join("%s=%r" % (name, getattr(self, name))
+                                                  for name in self.__slots__))
+
+
+def parse_watcher(data: bytes, report: RunsolverReport = None):
+    '''
+        parses the watcher file of the runsolver
+
+        Arguments
+        ---------
+        data: bytes
+            content of the watcher file
+        report: RunsolverReport
+            report which is updated (default: a new one)
+
+        Returns
+        -------
+        report: RunsolverReport
+    '''
+    if report is None:
+        report = RunsolverReport()
+    report.timeout = any(message in data for message in TIMEOUT_MESSAGES)
+    report.memout = any(message in data for message in MEMOUT_MESSAGES)
+
+    old_cpu_time = None
+    rusage_max_rss = None
+    # the runsolver repeats the last samples at the end
+    samples = set()
+    for match in WATCHER_PATTERN.finditer(b"\n" + data):
+        name = match.lastgroup
+        value = match.group(name)
+        if name == "sample":
+            samples.add(value)
+        elif name == "old_cpu_time":
+            old_cpu_time = float(value)
+        elif name == "rusage_max_rss":
+            rusage_max_rss = int(value)
+        elif name in INT_FIELDS:
+            if getattr(report, name) is None:
+                setattr(report, name, int(value))
+        elif getattr(report, name) is None:
+            setattr(report, name, float(value))
+    if report.cpu_time is None:
+        report.cpu_time = old_cpu_time
+    # the sampled memory is missing for runs shorter than the first sample;
+    # getrusage knows the peak of the largest process
+    if rusage_max_rss is not None and (report.max_rss or 0) < rusage_max_rss:
+        report.max_rss = rusage_max_rss
+    report.samples = len(samples)
+    return report
+
+
+def parse_var_file(data: bytes, report: RunsolverReport = None):
+    '''
+        parses the variable file of the runsolver (lines "KEY=VALUE");
+        its values override the values of the watcher file
+        (except for limit violations only found in the watcher file)
+
+        Arguments
+        ---------
+        data: bytes
+            content of the variable file
+        report: RunsolverReport
+            report which is updated (default: a new one)
+
+        Returns
+        -------
+        report: RunsolverReport
+    '''
+    if report is None:
+        report = RunsolverReport()
+    for line in data.splitlines():
+        key, sep, value = line.partition(b"=")
+        if sep and key in VARIABLES:
+            name, type_ = VARIABLES[key]
+            try:
+                value = type_(value.strip())
+            except ValueError:
+                continue
+            # limit violations reported in the watcher file are kept
+            if value is not False:
+                setattr(report, name, value)
+    return report
@@ -0,0 +1,143 @@
+'''
+tails the solver output file while the target algorithm is still running
+
+@author:     Marius Lindauer
+@copyright:  2018 ML4AAD. All rights reserved.
+@license:    BSD
+'''
+
+import time
+import typing
+import threading
+
+from genericWrapper4AC.parsing.output_parser import OutputParser
+
+
+class LogTailer(object):
+    '''
+        follows a growing file (the solver file with --log-capture disk)
+        in a thread (start() and finish()) or in the asyncio event loop
+        (start_async() and finish_async()) and feeds each complete line to an OutputParser;
+        ~genericWrapper4AC.capture.fifo.FifoLog reads the output itself and only calls feed()
+    '''
+
+    def __init__(self, path: str, parser: OutputParser, poll_interval: float = 0.05,
+                 check: typing.Callable = None):
+        '''
+            Arguments
+            ---------
+            path: str
+                file to follow
+            parser: ~genericWrapper4AC.parsing.output_parser.OutputParser
+                parser fed with the lines of the file
+            poll_interval: float
+                waiting time in seconds if no new output is available
+            check: typing.Callable
+                called with the parser and the elapsed time after each read;
+                not called anymore after it returned True
+        '''
+        self.path = path
+        self.parser = parser
+        self.poll_interval = poll_interval
+        self.check = check
+        self.start_time = None
+        self._finished = threading.Event()
+        # incomplete last line of the output read so far
+        self._rest = b""
+        self._thread = None
+        # asyncio task following the file (see start_async)
+        self._task = None
+
+    def start(self):
+        '''
+            starts following the file in a thread
+        '''
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        for _ in self._follow():
+            time.sleep(self.poll_interval)
+
+    def _follow(self):
+        '''
+            reads the file until the target algorithm has terminated;
+            yields whenever no new output is available
+        '''
+        self.start_time = time.time()
+        with open(self.path, "rb") as fp:
+            while not self.parser.done:
+                # check before reading such that the last read
+                # happens after the target algorithm has terminated
+                finished = self._finished.is_set()
+                chunk = fp.read(1024 * 1024)
+                if not chunk and finished:
+                    self.feed_rest()
+                    break
+                self.feed(chunk, check=not finished)
+                if not chunk:
+                    yield
+
+    def start_async(self):
+        '''
+            asyncio version of start(): follows the file in a task of the running event loop
+        '''
+        import asyncio
+        self._task = asyncio.ensure_future(self._follow_async())
+
+    async def _follow_async(self):
+        import asyncio
+        for _ in self._follow():
+            await asyncio.sleep(self.poll_interval)
+
+    def feed(self, chunk: bytes, check: bool = True):
+        '''
+            feeds the complete lines of <chunk> to the parser;
+            used by _follow() and by readers which get the output themselves
+            (see ~genericWrapper4AC.capture.fifo.FifoLog)
+
+            Arguments
+            ---------
+            chunk: bytes
+                next part of the output (may be empty)
+            check: bool
+                call <check> afterwards
+        '''
+        if self.start_time is None:
+            self.start_time = time.time()
+        self.parser.elapsed = time.time() - self.start_time
+        if chunk and not self.parser.done:
+            lines = (self._rest + chunk).split(b"\n")
+            self._rest = lines.pop()
+            for line in lines:
+                if self.parser.feed(line + b"\n"):
+                    break
+
+        if check and self.check is not None:
+            if self.check(self.parser, self.parser.elapsed):
+                self.check = None
+
+    def feed_rest(self):
+        '''
+            feeds the last line if the output does not end with a newline
+        '''
+        if self._rest:
+            self.parser.feed(self._rest)
+            self._rest = b""
+
+    def finish(self):
+        '''
+            signals that the target algorithm has terminated;
+            reads the remaining output and waits for the thread
+            (after start_async(), the task stops on its own)
+        '''
+        self._finished.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    async def finish_async(self):
+        '''
+            asyncio version of finish() (after start_async())
+        '''
+        self._finished.set()
+        await self._task
@@ -0,0 +1,184 @@
+'''
+hands out disjoint sets of cores to concurrently running wrappers
+on the same machine
+
+The slot table is a directory with one lock file per core;
+a core is allocated as long as a process holds an exclusive flock on its file.
+Since the kernel releases flocks if a process dies,
+crashed wrappers cannot leak cores.
+
+@author:     Marius Lindauer
+@copyright:  2018 ML4AAD. All rights reserved.
+@license:    BSD
+'''
+
+import os
+import glob
+import time
+import fcntl
+import typing
+import logging
+
+# default maximal waiting time in seconds for free cores
+DEFAULT_TIMEOUT = 600
+
+
+def read_numa_nodes():
+    '''
+        reads the mapping from core id to NUMA node from sysfs
+
+        Returns
+        -------
+        dict: core id -> NUMA node id (empty if not available)
+    '''
+    nodes = {}
+    for node_dir in glob.glob("/sys/devices/system/node/node[0-9]*"):
+        node = int(os.path.basename(node_dir)[4:])
+        try:
+            with open(os.path.join(node_dir, "cpulist")) as fp:
+                cpulist = fp.read().strip()
+        except OSError:
+            continue
+        for core in parse_cpulist(cpulist):
+            nodes[core] = node
+    return nodes
+
+
+def parse_cpulist(cpulist: str):
+    '''
+        parses a list in the kernel format, e.g., "0-3,8,10-11"
+    '''
+    cores = []
+    for part in filter(None, cpulist.split(",")):
+        if "-" in part:
+            first, last = part.split("-")
+            cores.extend(range(int(first), int(last) + 1))
+        else:
+            cores.append(int(part))
+    return cores
+
+
+class CoreScheduler(object):
+    '''
+        allocates disjoint core sets via a lock-file slot table
+    '''
+
+    def __init__(self, lock_dir: str = None, cores: typing.List[int] = None,
+                 numa_nodes: typing.Dict[int, int] = None):
+        '''
+            Arguments
+            ---------
+            lock_dir: str
+                directory of the slot table;
+                has to be the same for all wrappers on a machine
+                (default: <tmp>/gw4ac-cores-<uid>)
+            cores: typing.List[int]
+                cores that can be allocated (default: affinity of this process)
+            numa_nodes: typing.Dict[int, int]
+                mapping from core to NUMA node (default: read from sysfs)
+        '''
+        self.logger = logging.getLogger("CoreScheduler")
+
+        if lock_dir is None:
+            lock_dir = os.path.join(os.environ.get("TMPDIR", "/tmp"),
+                                    "gw4ac-cores-%d" % (os.getuid()))
+        os.makedirs(lock_dir, exist_ok=True)
+        self.lock_dir = lock_dir
+
+        if cores is None:
+            cores = sorted(os.sched_getaffinity(0))
+        self.cores = cores
+
+        if numa_nodes is None:
+            numa_nodes = read_numa_nodes()
+        self.numa_nodes = numa_nodes
+
+    def acquire(self, n_cores: int, timeout: float = DEFAULT_TIMEOUT, poll: float = 0.05):
+        '''
+            allocates <n_cores> cores;
+            cores of a single NUMA node are preferred
+
+            Arguments
+            ---------
+            n_cores: int
+                number of cores
+            timeout: float
+                maximal waiting time in seconds for free cores (None: wait forever)
+            poll: float
+                waiting time in seconds between two attempts
+
+            Returns
+            -------
+            CoreAllocation or None if no cores could be allocated in time
+        '''
+        if n_cores > len(self.cores):
+            raise ValueError("Cannot allocate %d cores on a machine with %d cores" % (
+                n_cores, len(self.cores)))
+
+        start = time.time()
+        waiting = False
+        while True:
+            allocation = self._try_acquire(n_cores)
+            if allocation is not None:
+                return allocation
+            if timeout is not None and time.time() - start >= timeout:
+                return None
+            if not waiting:
+                self.logger.debug("Waiting for %d free cores" % (n_cores))
+                waiting = True
+            time.sleep(poll)
+
+    def _try_acquire(self, n_cores: int):
+        # group cores by NUMA node; unknown nodes are treated as one node
+        by_node = {}
+        for core in self.cores:
+            by_node.setdefault(self.numa_nodes.get(core, -1), []).append(core)
+
+        # 1st choice: all cores on one node
+        for node in sorted(by_node):
+            locks = self._lock_cores(by_node[node], n_cores)
+            if len(locks) == n_cores:
+                return CoreAllocation(locks)
+            self._unlock(locks)
+
+        # 2nd choice: spread over several nodes
+        locks = self._lock_cores(self.cores, n_cores)
+        if len(locks) == n_cores:
+            return CoreAllocation(locks)
+        self._unlock(locks)
+        return None
+
+    def _lock_cores(self, cores: typing.List[int], n_cores: int):
+        locks = {}
+        for core in cores:
+            if len(locks) == n_cores:
+                break
+            fp = open(os.path.join(self.lock_dir, "core-%d.lock" % (core)), "a")
+            try:
+                fcntl.flock(fp, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                locks[core] = fp
+            except OSError:
+                fp.close()
+        return locks
+
+    @staticmethod
+    def _unlock(locks: typing.Dict[int, typing.IO]):
+        for fp in locks.values():
+            fp.close()  # releases the flock
+
+
+class CoreAllocation(object):
+    '''
+        set of allocated cores; released by release() or if the process exits
+    '''
+
+    def __init__(self, locks: typing.Dict[int, typing.IO]):
+        self._locks = locks
+        self.cores = sorted(locks)
+
+    def release(self):
+        CoreScheduler._unlock(self._locks)
+        self._locks = {}
+
+    def __str__(self):
+        return ",".join(map(str, self.cores))
@@ -0,0 +1,399 @@
+'''
+event-driven supervision of the process tree of a target algorithm run:
+waits on pidfds (instead of sleeping) and kills the process group of the run;
+with --reap-orphans, it also finds the members of the tree in /proc,
+including orphans which left the process group of the run
+
+@author:     Marius Lindauer
+@copyright:  2018 ML4AAD. All rights reserved.
+@license:    BSD
+'''
+
+import os
+import time
+import signal
+import selectors
+import subprocess
+
+# prctl option to become the parent of orphaned descendants
+PR_SET_CHILD_SUBREAPER = 36
+
+
+def become_subreaper():
+    '''
+        makes the current process the subreaper of its descendants (Linux only),
+        i.e., orphans are re-parented to it instead of to init
+        and can still be found and reaped by the supervisor
+
+        Returns
+        -------
+        success: bool
+    '''
+    import ctypes
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        return libc.prctl(PR_SET_CHILD_SUBREAPER, 1, 0, 0, 0) == 0
+    except (OSError, AttributeError):
+        return False
+
+
+def read_stat(pid: int):
+    '''
+        reads /proc/<pid>/stat
+
+        Returns
+        -------
+        (state: str, ppid: int, pgrp: int, session: int, starttime: int)
+        or None if the process does not exist
+    '''
+    try:
+        with open("/proc/%d/stat" % (pid), "rb") as fp:
+            stat = fp.read()
+    except OSError:
+        return None
+    # the command name may contain spaces and parentheses
+    fields = stat[stat.rindex(b")") + 2:].split()
+    return (fields[0].decode(), int(fields[1]), int(fields[2]), int(fields[3]), int(fields[19]))
+
+
+def read_all_stats():
+    '''
+        reads the stat of all processes
+
+        Returns
+        -------
+        stats: typing.Dict[int, tuple]
+            see read_stat
+    '''
+    stats = {}
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            stat = read_stat(int(entry))
+            if stat is not None:
+                stats[int(entry)] = stat
+    return stats
+
+
+def pidfd_open(pid: int):
+    '''
+        returns a pidfd of <pid>, -1 if pidfds are not supported
+        or None if the process does not exist
+    '''
+    if not hasattr(os, "pidfd_open"):
+        return -1
+    try:
+        return os.pidfd_open(pid)
+    except ProcessLookupError:
+        return None
+    except OSError:
+        return -1
+
+
+def wait_for_exit(pids, timeout: float):
+    '''
+        waits until all processes <pids> exited (or became zombies)
+        or <timeout> seconds elapsed
+
+        Returns
+        -------
+        alive: typing.Set[int]
+            processes still running after the timeout
+    '''
+    end = time.monotonic() + timeout
+    alive = set()
+    with selectors.DefaultSelector() as selector:
+        for pid in pids:
+            fd = pidfd_open(pid)
+            if fd is None:
+                continue
+            if fd == -1:
+                alive.add(pid)
+            else:
+                selector.register(fd, selectors.EVENT_READ, pid)
+        try:
+            while selector.get_map() and time.monotonic() < end:
+                for key, _ in selector.select(end - time.monotonic()):
+                    selector.unregister(key.fd)
+                    os.close(key.fd)
+            # fallback without pidfds: polling
+            while alive and time.monotonic() < end:
+                alive = set(pid for pid in alive if _is_running(pid))
+                if alive:
+                    time.sleep(0.01)
+        finally:
+            for key in list(selector.get_map().values()):
+                alive.add(key.data)
+                os.close(key.fd)
+    return set(pid for pid in alive if _is_running(pid))
+
+
+def _is_running(pid: int):
+    stat = read_stat(pid)
+    return stat is not None and stat[0] not in ("Z", "X")
+
+
+class ProcessSupervisor(object):
+    '''
+        supervises the process tree of a single run;
+        wraps a subprocess.Popen (or a compatible object, e.g.,
+        ~genericWrapper4AC.inprocess.forked_process.ForkedProcess)
+    '''
+
+    def __init__(self, process, scan_interval: float = 1, orphans: bool = True):
+        '''
+            Arguments
+            ---------
+            process: subprocess.Popen
+                root of the process tree;
+                has to be the leader of a new session (start_new_session=True)
+            scan_interval: float
+                seconds between two scans of the process tree while waiting;
+                processes seen in a scan are killed even if they left the session
+                (if the wrapper is their subreaper, see become_subreaper)
+            orphans: bool
+                scan /proc for processes which left the process group of the root
+                (see members); otherwise only the process group is signaled
+        '''
+        self.process = process
+        self.pid = process.pid
+        self.scan_interval = scan_interval
+        self.orphans = orphans
+        self.rusage = None
+        # pid -> starttime of all processes seen in the tree
+        self._known = {}
+        # starttime of the root; its pid can be recycled after it was reaped
+        stat = read_stat(self.pid)
+        self._root_start = None if stat is None else stat[4]
+
+    def _recycled(self, stat):
+        '''
+            True if <stat> (see read_stat) of the pid of the root belongs to another process
+        '''
+        return stat is not None and stat[4] != self._root_start
+
+    @property
+    def returncode(self):
+        return self.process.returncode
+
+    def members(self):
+        '''
+            running processes of the tree:
+            descendants of the root, processes in the session or process group of the root
+            and processes seen in an earlier scan (see scan_interval)
+
+            Returns
+            -------
+            members: typing.Set[int]
+        '''
+        stats = read_all_stats()
+        children = {}
+        for pid, stat in stats.items():
+            children.setdefault(stat[1], []).append(pid)
+
+        # a pid is not recycled while it is the id of a process group or session;
+        # only a new process with the pid of the root could be a leader again
+        own_root = not self._recycled(stats.get(self.pid))
+        members = set(pid for pid, stat in stats.items()
+                      if (own_root and self.pid in (stat[2], stat[3]))
+                      or self._known.get(pid) == stat[4])
+        stack = [self.pid] if own_root else []
+        while stack:
+            pid = stack.pop()
+            if pid in stats:
+                members.add(pid)
+                stack.extend(children.get(pid, []))
+        members.discard(os.getpid())
+
+        for pid in members:
+            self._known[pid] = stats[pid][4]
+        return set(pid for pid in members if stats[pid][0] not in ("Z", "X"))
+
+    def wait(self):
+        '''
+            waits for the root process and kills processes of the tree left behind
+
+            Returns
+            -------
+            returncode: int
+        '''
+        if not isinstance(self.process, subprocess.Popen):
+            # limits are enforced in the wait() of the other process types
+            # (which also reap the root, i.e., only the scan is safe afterwards)
+            self.process.wait()
+            self.rusage = getattr(self.process, "rusage", None)
+            if self.orphans:
+                self._kill(self.members())
+            return self.returncode
+
+        fd = pidfd_open(self.pid)
+        if fd is not None and fd != -1:
+            with selectors.DefaultSelector() as selector:
+                selector.register(fd, selectors.EVENT_READ)
+                try:
+                    while not selector.select(self.scan_interval if self.orphans else None):
+                        self.members()
+                finally:
+                    os.close(fd)
+        else:
+            try:
+                os.waitid(os.P_PID, self.pid, os.WEXITED | os.WNOWAIT)
+            except ChildProcessError:  # already reaped
+                pass
+
+        # the root is a zombie until it is reaped, i.e., its pid is not recycled yet
+        self.kill_leftovers()
+        return self._reap_root()
+
+    async def wait_async(self):
+        '''
+            asyncio version of wait() for a subprocess.Popen:
+            waits on the pidfd of the root in the event loop;
+            scans of /proc (see orphans) are executed in the default executor
+            (as well as wait() itself if pidfds are not supported)
+
+            Returns
+            -------
+            returncode: int
+        '''
+        import asyncio
+        loop = asyncio.get_running_loop()
+        fd = pidfd_open(self.pid) if isinstance(self.process, subprocess.Popen) else -1
+        if fd is None or fd == -1:
+            return await loop.run_in_executor(None, self.wait)
+
+        exited = loop.create_future()
+        loop.add_reader(fd, lambda: exited.done() or exited.set_result(None))
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(asyncio.shield(exited),
+                                           self.scan_interval if self.orphans else None)
+                    break
+                except asyncio.TimeoutError:
+                    await loop.run_in_executor(None, self.members)
+        finally:
+            loop.remove_reader(fd)
+            os.close(fd)
+
+        if self.orphans:
+            await loop.run_in_executor(None, self.kill_leftovers)
+        else:
+            self.kill_leftovers()
+        # the root already exited, i.e., wait4 does not block
+        return self._reap_root()
+
+    def _reap_root(self):
+        '''
+            reaps the (exited) root with wait4 to get the resource usage
+        '''
+        try:
+            _, status, self.rusage = os.wait4(self.pid, 0)
+            if os.WIFSIGNALED(status):
+                self.process.returncode = -os.WTERMSIG(status)
+            else:
+                self.process.returncode = os.WEXITSTATUS(status)
+        except ChildProcessError:  # already reaped
+            self.process.wait()
+        return self.returncode
+
+    def kill_leftovers(self):
+        '''
+            kills the processes of the tree which are still running
+            after the root exited (before the root is reaped)
+        '''
+        if self.orphans:
+            self._kill(self.members())
+        else:
+            self._signal_group(signal.SIGKILL)
+
+    def send_signal(self, signum: int):
+        self.process.send_signal(signum)
+
+    def kill(self):
+        self.process.kill()
+
+    def terminate(self, grace: float):
+        '''
+            sends SIGTERM to all processes of the tree
+            and SIGKILL to the remaining ones after <grace> seconds;
+            returns as soon as all processes are gone and the root is reaped
+
+            Arguments
+            ---------
+            grace: float
+                seconds between SIGTERM and SIGKILL
+        '''
+        if getattr(self.process, "terminates_tree", False):
+            # e.g., all processes of a cgroup run (see ~genericWrapper4AC.limits.cgroup.CgroupProcess)
+            self.process.terminate(grace=grace)
+            if self.orphans:
+                self._kill(self.members())
+            return
+
+        if not self.orphans:
+            self._signal_group(signal.SIGTERM)
+            wait_for_exit([self.pid], timeout=grace)
+            # children of the root may ignore SIGTERM even if the root exited
+            self._signal_group(signal.SIGKILL)
+            self._reap_terminated_root()
+            return
+
+        members = self.members()
+        for pid in members:
+            self._signal(pid, signal.SIGTERM)
+        alive = wait_for_exit(members, timeout=grace)
+        # processes started in the meantime
+        alive |= self.members()
+        if alive:
+            self._kill(alive)
+            self.process.kill()
+        self._reap()
+        self._reap_terminated_root()
+
+    def _reap_terminated_root(self):
+        '''
+            reaps the root after terminate() (wait() is not called anymore)
+        '''
+        if isinstance(self.process, subprocess.Popen):
+            self._reap_root()
+        else:
+            self.process.wait()
+
+    def _signal_group(self, signum: int):
+        '''
+            sends <signum> to the process group of the root
+            (unless the pid of the root was recycled)
+        '''
+        if self._recycled(read_stat(self.pid)):
+            return
+        try:
+            os.killpg(self.pid, signum)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def _kill(self, pids):
+        for pid in pids:
+            self._signal(pid, signal.SIGKILL)
+        wait_for_exit(pids, timeout=1)
+        self._reap()
+
+    @staticmethod
+    def _signal(pid: int, signum: int):
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            pass
+
+    def _reap(self):
+        '''
+            reaps orphans of the tree re-parented to the wrapper (see become_subreaper);
+            the root itself is reaped by wait()
+        '''
+        me = os.getpid()
+        for pid, stat in read_all_stats().items():
+            if pid != self.pid and stat[0] == "Z" and stat[1] == me \
+                    and (self.pid in (stat[2], stat[3]) or self._known.get(pid) == stat[4]):
+                try:
+                    os.waitpid(pid, os.WNOHANG)
+                except ChildProcessError:
+                    pass
@@ -0,0 +1,146 @@
+'''
+instrumentation of the wrapper's own overhead:
+monotonic timestamps of the phases of a run (see --report-timings)
+aggregated into a histogram file across runs (see --timing-histogram)
+
+@author:     Marius Lindauer
+@copyright:  2018 ML4AAD. All rights reserved.
+@license:    BSD
+'''
+
+import os
+import time
+import typing
+import contextlib
+
+# phases of a run in chronological order
+PHASES = ["interpreter_start", "argument_parsing", "tmpdir_setup", "command_construction",
+          "process_spawn", "target_exit", "watcher_parse", "result_parse", "verification",
+          "cleanup"]
+
+# upper bounds (seconds) of the bins of the histogram; larger durations are counted in "inf"
+BIN_BOUNDS = [m * 10 ** e for e in range(-5, 3) for m in (1, 2, 5)]
+
+
+def process_age():
+    '''
+        seconds since the start of the current process
+        (i.e., including the start-up of the interpreter);
+        read from /proc/self/stat (resolution: one clock tick, usually 10 ms)
+
+        Returns
+        -------
+        age: float
+            None if /proc is not available
+    '''
+    try:
+        with open("/proc/self/stat", "rb") as fp:
+            stat = fp.read()
+        # the name of the executable (in parentheses) can contain spaces;
+        # starttime is the 22nd field
+        start_ticks = int(stat.rsplit(b")", 1)[1].split()[19])
+        boot_time = time.clock_gettime(time.CLOCK_BOOTTIME)
+        return max(0., boot_time - start_ticks / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class PhaseTimer(object):
+    '''
+        measures the durations of the phases of a run;
+        phases can be nested (e.g., the verification during the result parsing),
+        the duration of the outer phase excludes the nested phases
+    '''
+
+    def __init__(self):
+        # phase -> seconds
+        self.durations = {}
+        # monotonic start time of the first measurement of each phase
+        self.timestamps = {}
+        # [phase, start, time spent in nested phases]
+        self._stack = []
+
+    def record(self, phase: str, seconds: float, start: float = None):
+        '''
+            adds <seconds> to the duration of <phase>
+        '''
+        self.durations[phase] = self.durations.get(phase, 0.) + seconds
+        if start is not None:
+            self.timestamps.setdefault(phase, start)
+
+    @contextlib.contextmanager
+    def phase(self, phase: str):
+        '''
+            context manager measuring <phase>
+        '''
+        frame = [phase, time.monotonic(), 0.]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - frame[1]
+            self._stack.pop()
+            self.record(phase, elapsed - frame[2], start=frame[1])
+            if self._stack:
+                self._stack[-1][2] += elapsed
+
+    def get_timings(self):
+        '''
+            Returns
+            -------
+            timings: typing.Dict[str, float]
+                measured phases (in the order of PHASES) -> seconds
+        '''
+        order = {phase: i for i, phase in enumerate(PHASES)}
+        return {phase: self.durations[phase]
+                for phase in sorted(self.durations, key=lambda p: order.get(p, len(PHASES)))}
+
+
+def _bin(seconds: float):
+    for bound in BIN_BOUNDS:
+        if seconds <= bound:
+            return "%g" % (bound)
+    return "inf"
+
+
+def update_histogram(path: str, timings: typing.Dict[str, float]):
+    '''
+        adds the timings of a run to the histogram file <path>;
+        the file is locked (flock) such that concurrent wrappers can share it.
+        Format (JSON): {"runs": <int>,
+                        "phases": {<phase>: {"count": <int>, "sum": <float>,
+                                             "min": <float>, "max": <float>,
+                                             "bins": {<upper bound in seconds>: <int>}}}}
+
+        Arguments
+        ---------
+        path: str
+            histogram file (created if it does not exist)
+        timings: typing.Dict[str, float]
+            phase -> seconds (see PhaseTimer.get_timings)
+    '''
+    import json
+    import fcntl
+
+    with open(path, "a+") as fp:
+        fcntl.flock(fp, fcntl.LOCK_EX)
+        try:
+            fp.seek(0)
+            content = fp.read()
+            histogram = json.loads(content) if content.strip() else {"runs": 0, "phases": {}}
+            histogram["runs"] += 1
+            for phase, seconds in timings.items():
+                stats = histogram["phases"].setdefault(
+                    phase, {"count": 0, "sum": 0., "min": seconds, "max": seconds, "bins": {}})
+                stats["count"] += 1
+                stats["sum"] += seconds
+                stats["min"] = min(stats["min"], seconds)
+                stats["max"] = max(stats["max"], seconds)
+                key = _bin(seconds)
+                stats["bins"][key] = stats["bins"].get(key, 0) + 1
+            fp.seek(0)
+            fp.truncate()
+            json.dump(histogram, fp, indent=1, sort_keys=True)
+            fp.flush()
+        finally:
+            fcntl.flock(fp, fcntl.LOCK_UN)
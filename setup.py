@@ -72,6 +72,7 @@ setuptools.setup(
     python_requires='>=3.5',
     test_suite='nose.collector',
     tests_require=["nose", "numpy", "scipy", "scikit-learn"],
+    extras_require={"msgpack": ["msgpack"], "zstd": ["zstandard"]},
     cmdclass={'install': InstallRunsolver},
     include_package_data=True,
     package_data={"genericWrapper4AC": ["binaries/runsolver"]},
@@ -0,0 +1,34 @@
+import os
+import shutil
+import unittest
+import subprocess
+
+TEST_BINARIES = os.path.join(os.path.dirname(__file__), "test_binaries")
+RUNSOLVER_LOCATION = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                                  "runsolver", "runsolver-3.4.0", "src")
+
+
+def get_runsolver():
+    '''
+        path of the runsolver used by the tests (test/test_binaries/runsolver);
+        if it is missing, it is copied from the runsolver sources as by setup.py install
+        (and built with make if necessary); skips the test if there is no runsolver
+    '''
+    runsolver = os.path.join(TEST_BINARIES, "runsolver")
+    if os.path.isfile(runsolver):
+        return runsolver
+
+    source = os.path.join(RUNSOLVER_LOCATION, "runsolver")
+    if not os.path.isfile(source):
+        try:
+            subprocess.check_call(["make"], cwd=RUNSOLVER_LOCATION,
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except (OSError, subprocess.CalledProcessError):
+            raise unittest.SkipTest("runsolver is missing and could not be built")
+
+    os.makedirs(TEST_BINARIES, exist_ok=True)
+    # copied under another name first such that concurrent tests never see a partial binary
+    tmp_name = "%s.%d" % (runsolver, os.getpid())
+    shutil.copy(source, tmp_name)
+    os.replace(tmp_name, runsolver)
+    return runsolver
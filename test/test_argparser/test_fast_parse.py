@@ -0,0 +1,66 @@
+import unittest
+
+from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter
+
+from genericWrapper4AC.argparser.parse import get_parser, get_extended_parser, \
+    fast_parse_known_args, parse
+from genericWrapper4AC.domain_specific.satwrapper import SatWrapper
+
+OLD = ["wrapper.py", "inst.cnf", "SAT", "10.5", "0", "42", "-rnd-freq", "0", "-var-decay", "'0.5'"]
+NEW = ["wrapper.py", "--instance", "inst.cnf", "--cutoff", "10.5", "--seed", "42",
+       "--config", "-rnd-freq", "0", "-var-decay", "'0.5'"]
+
+CALLS = [
+    OLD,
+    NEW,
+    OLD + ["--mem-limit", "100", "--runsolver-path", "/bin/runsolver"],
+    NEW + ["--mem-limit", "100", "--runsolver-path", "/bin/runsolver"],
+    ["wrapper.py", "--tail-solver-output", "--stop-if-worse-than", "1@2",
+     "--stop-if-worse-than", "0.5@10"] + NEW[1:],
+    NEW[:3] + ["--max_quality", "-1", "--deterministic"] + NEW[3:] + ["-x", "-2.5"],
+    OLD + ["--limit-backend", "cgroup", "--result-fd", "3", "--overwrite_cost_runtime"],
+]
+
+FALLBACK = [
+    OLD + ["--help"],
+    OLD + ["--mem-limit=100"],
+    OLD + ["--mem-limit", "abc"],
+    OLD + ["--mem-limit"],
+    OLD + ["--mem-limit", "--deterministic"],
+    OLD + ["--limit-backend", "docker"],
+    OLD + ["--stop-if-worse-than", "1"],
+    OLD + ["--", "-a"],
+]
+
+
+def argparse_parse_known_args(parser, arg_strings, new_format):
+    if new_format:
+        parser = get_extended_parser(parser=ArgumentParser(
+            parents=[parser], formatter_class=ArgumentDefaultsHelpFormatter,
+            allow_abbrev=False, add_help=False))
+    return parser.parse_known_args(arg_strings)
+
+
+class TestFastParse(unittest.TestCase):
+
+    def test_equivalence(self):
+        sat_calls = CALLS + [call + ["--sol-file", "sol.txt", "--native-sat-checker"] for call in CALLS]
+        for parser, calls in [(get_parser(), CALLS), (SatWrapper().parser, sat_calls)]:
+            for call in calls:
+                new_format = "--config" in call
+                fast = fast_parse_known_args(parser, call[1:], new_format=new_format)
+                self.assertIsNotNone(fast, call)
+                self.assertEqual(fast, argparse_parse_known_args(parser, call[1:], new_format), call)
+
+    def test_fallback(self):
+        parser = get_parser()
+        for call in FALLBACK:
+            self.assertIsNone(fast_parse_known_args(parser, call[1:], new_format=False), call)
+
+    def test_parse(self):
+        d, main_args = parse(cmd_arguments=NEW + ["--mem-limit", "100"], parser=get_parser())
+        self.assertEqual(d.cutoff, 11)
+        self.assertEqual(d.seed, 42)
+        self.assertEqual(d.mem_limit, 100)
+        self.assertEqual(d.config, {"-rnd-freq": "0", "-var-decay": "0.5"})
+        self.assertTrue(d.new_format)
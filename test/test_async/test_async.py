@@ -0,0 +1,190 @@
+import unittest
+import os
+import time
+import asyncio
+import threading
+import functools
+import tempfile
+
+from genericWrapper4AC.generic_wrapper import AbstractWrapper
+from genericWrapper4AC.data.data import Data
+from examples.MiniSAT.MiniSATWrapper import MiniSATWrapper
+from test import get_runsolver
+
+
+class SleepWrapper(AbstractWrapper):
+
+    def get_command_line_args(self, runargs, config):
+        return ["sleep", "100"]
+
+    def process_results(self, filepointer, out_args):
+        return {"status": "SUCCESS"}
+
+
+def print_quality(quality):
+    print(quality)
+
+
+class PythonTargetWrapper(AbstractWrapper):
+
+    def get_command_line_args(self, runargs, config):
+        return functools.partial(print_quality, runargs["seed"])
+
+    def process_results(self, filepointer, out_args):
+        return {"status": "SUCCESS", "quality": float(filepointer.read().decode("utf8"))}
+
+
+class StubbornWrapper(SleepWrapper):
+
+    def _terminate_subprocesses(self):
+        # as if the target algorithm ignored SIGTERM for the whole grace period
+        time.sleep(self._DELAY2KILL)
+        SleepWrapper._terminate_subprocesses(self)
+
+
+class TestAsync(unittest.TestCase):
+
+    def setUp(self):
+        self.runsolver = get_runsolver()
+
+    def test_concurrent_runs(self):
+        wrapper = MiniSATWrapper()
+        wrapper.args, _ = wrapper.parser.parse_known_args(
+            ["--runsolver-path", self.runsolver])
+
+        async def run_all():
+            return await asyncio.gather(*[
+                wrapper.run_async(instance="examples/MiniSAT/gzip_vc1071.cnf",
+                                  specifics="SAT", seed=seed, cutoff=10,
+                                  config={"-rnd-freq": "0"})
+                for seed in range(1, 7)])
+
+        results = asyncio.run(run_all())
+
+        self.assertEqual([data.seed for data in results], list(range(1, 7)))
+        for data in results:
+            self.assertEqual(data.status, "SUCCESS")
+            self.assertGreater(2, data.time)
+        # the wrapper itself is not modified by the runs
+        self.assertIsNone(wrapper.data)
+
+    def test_no_reader_threads(self):
+        # the output is read in the event loop for all capture modes
+        for log_capture in ["disk", "bounded"]:
+            wrapper = MiniSATWrapper()
+            wrapper.args, _ = wrapper.parser.parse_known_args(
+                ["--runsolver-path", self.runsolver, "--log-capture", log_capture,
+                 "--tail-solver-output"])
+
+            async def run_all(n_threads):
+                runs = asyncio.gather(*[
+                    wrapper.run_async(instance="examples/MiniSAT/gzip_vc1071.cnf",
+                                      specifics="SAT", seed=seed, cutoff=10,
+                                      config={"-rnd-freq": "0"})
+                    for seed in range(1, 4)])
+                while not runs.done():
+                    n_threads.append(threading.active_count())
+                    await asyncio.sleep(0.01)
+                return runs.result()
+
+            n_threads = []
+            results = asyncio.run(run_all(n_threads))
+
+            for data in results:
+                self.assertEqual(data.status, "SUCCESS")
+            self.assertEqual(max(n_threads), threading.active_count())
+
+    def test_python_targets(self):
+        wrapper = PythonTargetWrapper()
+
+        async def run_all():
+            return await asyncio.gather(*[
+                wrapper.run_async(instance="dummy", seed=seed, cutoff=10, config={})
+                for seed in range(1, 4)])
+
+        # the process of the event loop must not fork
+        for data in asyncio.run(run_all()):
+            self.assertEqual(data.status, "ABORT")
+            self.assertIn("--fork-server", data.additional)
+
+        wrapper.start_fork_server()
+        try:
+            for data in asyncio.run(run_all()):
+                self.assertEqual(data.status, "SUCCESS")
+                self.assertEqual(data.cost, data.seed)
+        finally:
+            wrapper.stop_fork_server()
+
+    def test_cancel(self):
+        wrapper = SleepWrapper()
+        wrapper.args, _ = wrapper.parser.parse_known_args(
+            ["--runsolver-path", os.path.abspath(self.runsolver)])
+
+        # the logs of the cancelled run are preserved in the working directory
+        cwd = os.getcwd()
+        tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(tmp_dir.name)
+        self.addCleanup(tmp_dir.cleanup)
+        self.addCleanup(os.chdir, cwd)
+
+        async def cancel_run():
+            task = asyncio.ensure_future(wrapper.run_async(
+                instance="dummy", seed=1, cutoff=100, config={}))
+            await asyncio.sleep(0.5)
+            task.cancel()
+            start_time = time.monotonic()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            return time.monotonic() - start_time
+
+        self.assertLess(asyncio.run(cancel_run()), 1)
+
+    def test_rusage(self):
+        wrapper = AbstractWrapper()
+        wrapper.data = Data()
+        wrapper.data.tmp_dir = "."
+        wrapper.data.runsolver = self.runsolver
+        wrapper.data.cutoff = 10
+
+        asyncio.run(wrapper.call_target_async(["sleep", "0.1"]))
+        for log_file in [wrapper._watcher_file, wrapper._solver_file]:
+            log_file.close()
+            os.remove(log_file.name)
+
+        self.assertIsNotNone(wrapper._rusage)
+        self.assertEqual(wrapper._subprocesses, [])
+
+    def test_cancel_does_not_block_loop(self):
+        wrapper = StubbornWrapper()
+        wrapper._DELAY2KILL = 1
+        wrapper.args, _ = wrapper.parser.parse_known_args(
+            ["--runsolver-path", os.path.abspath(self.runsolver)])
+        cwd = os.getcwd()
+        tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(tmp_dir.name)
+        self.addCleanup(tmp_dir.cleanup)
+        self.addCleanup(os.chdir, cwd)
+
+        async def ticker(gaps):
+            last = time.monotonic()
+            while True:
+                await asyncio.sleep(0.01)
+                gaps.append(time.monotonic() - last)
+                last = time.monotonic()
+
+        async def cancel_run():
+            gaps = []
+            tick = asyncio.ensure_future(ticker(gaps))
+            task = asyncio.ensure_future(wrapper.run_async(
+                instance="dummy", seed=1, cutoff=100, config={}))
+            await asyncio.sleep(0.5)
+            task.cancel()
+            start_time = time.monotonic()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            tick.cancel()
+            return time.monotonic() - start_time, max(gaps)
+
+        duration, max_gap = asyncio.run(cancel_run())
+        self.assertGreaterEqual(duration, 0.9)
+        self.assertLess(max_gap, 0.3)
@@ -0,0 +1,135 @@
+import unittest
+import os
+import sys
+import json
+import time
+import signal
+import functools
+import tempfile
+import subprocess
+
+from examples.MiniSAT.MiniSATWrapper import MiniSATWrapper
+from genericWrapper4AC.generic_wrapper import AbstractWrapper
+from test import get_runsolver
+
+
+def print_quality(quality):
+    print(quality)
+
+
+class PythonTargetWrapper(AbstractWrapper):
+
+    def get_command_line_args(self, runargs, config):
+        return functools.partial(print_quality, runargs["seed"])
+
+    def process_results(self, filepointer, out_args):
+        return {"status": "SUCCESS", "quality": float(filepointer.read().decode("utf8"))}
+
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.runsolver = get_runsolver()
+
+        self.runs = [{"instance": "examples/MiniSAT/gzip_vc1071.cnf",
+                      "specifics": "SAT",
+                      "cutoff": 10,
+                      "seed": seed,
+                      "config": {"-rnd-freq": 0, "-var-decay": 0.001}}
+                     for seed in range(1, 9)]
+
+    def test_run_batch(self):
+
+        wrapper = MiniSATWrapper()
+        wrapper.args, _ = wrapper.parser.parse_known_args(
+            ["--runsolver-path", self.runsolver])
+
+        results = list(wrapper.run_batch(runs=self.runs, n_workers=3))
+
+        self.assertEqual(len(results), len(self.runs))
+        self.assertEqual(sorted(data.seed for _, data in results),
+                         list(range(1, 9)))
+        for run, data in results:
+            self.assertEqual(run["seed"], data.seed)
+            self.assertEqual(data.status, "SUCCESS")
+            self.assertGreater(2, data.time)
+
+    def test_python_targets(self):
+
+        wrapper = PythonTargetWrapper()
+        runs = [{"instance": "dummy", "cutoff": 10, "seed": seed, "config": {}}
+                for seed in range(1, 5)]
+
+        # a single worker thread can fork safely
+        for _, data in wrapper.run_batch(runs=runs, n_workers=1):
+            self.assertEqual(data.status, "SUCCESS")
+            self.assertEqual(data.cost, data.seed)
+
+        # several worker threads have to use the fork server
+        for _, data in wrapper.run_batch(runs=runs, n_workers=2):
+            self.assertEqual(data.status, "ABORT")
+            self.assertIn("--fork-server", data.additional)
+
+        wrapper.start_fork_server()
+        try:
+            for _, data in wrapper.run_batch(runs=runs, n_workers=2):
+                self.assertEqual(data.status, "SUCCESS")
+        finally:
+            wrapper.stop_fork_server()
+
+    def test_batch_file(self):
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json") as fp:
+            for run in self.runs:
+                fp.write(json.dumps(run) + "\n")
+            fp.flush()
+
+            out = subprocess.check_output(
+                [sys.executable, "examples/MiniSAT/MiniSATWrapper.py",
+                 "--batch-file", fp.name, "--batch-workers", "2",
+                 "--runsolver-path", self.runsolver],
+                env=dict(os.environ, PYTHONPATH="."),
+                universal_newlines=True)
+
+        results = [json.loads(line) for line in out.split("\n")
+                   if line.startswith("{")]
+        self.assertEqual(len(results), len(self.runs))
+        for res in results:
+            self.assertEqual(res["status"], "SUCCESS")
+            self.assertIn(res["seed"], range(1, 9))
+
+    def test_signal(self):
+        wrapper = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                               "test_resources", "sleep_wrapper.py")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # each run creates its instance after 2 seconds
+            instances = [os.path.join(tmp_dir, "done-%d" % (i)) for i in range(6)]
+            batch_file = os.path.join(tmp_dir, "batch.json")
+            with open(batch_file, "w") as fp:
+                for seed, instance in enumerate(instances):
+                    fp.write(json.dumps({"instance": instance, "seed": seed, "cutoff": 10,
+                                         "config": {"-time": 2}}) + "\n")
+
+            process = subprocess.Popen(
+                [sys.executable, wrapper, "--batch-file", batch_file, "--batch-workers", "2",
+                 "--runsolver-path", os.path.abspath(self.runsolver)],
+                stdout=subprocess.PIPE, cwd=tmp_dir,
+                env=dict(os.environ, PYTHONPATH=os.getcwd()), universal_newlines=True)
+            out = ""
+            while "Calling runsolver" not in out:
+                out += process.stdout.readline()
+            time.sleep(0.2)
+            process.send_signal(signal.SIGTERM)
+            out += process.communicate(timeout=30)[0]
+            time.sleep(2.5)
+
+            self.assertEqual(process.returncode, 2)
+            results = [json.loads(line) for line in out.split("\n")
+                       if line.startswith("{")]
+            self.assertEqual(sorted(res["seed"] for res in results), list(range(6)))
+            for res in results:
+                self.assertEqual(res["status"], "ABORT")
+            # neither the running nor the pending runs finished
+            for instance in instances:
+                self.assertFalse(os.path.exists(instance))
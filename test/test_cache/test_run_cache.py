@@ -0,0 +1,142 @@
+import unittest
+import os
+import tempfile
+from unittest import mock
+
+from examples.MiniSAT.MiniSATWrapper import MiniSATWrapper
+from genericWrapper4AC.cache.run_cache import RunCache
+from genericWrapper4AC.data.data import Data
+from test import get_runsolver
+
+
+class TestRunCache(unittest.TestCase):
+
+    def setUp(self):
+        self.runsolver = get_runsolver()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def get_data(self, cutoff, seed=1, status=None, time=None, memout=False):
+        data = Data()
+        data.instance = "inst"
+        data.config = {"-a": "1"}
+        data.seed = seed
+        data.cutoff = cutoff
+        if status is not None:
+            data.status = status
+            data.time = time
+            data.cost = time
+            data.memout = memout
+        return data
+
+    def test_cutoff_rules(self):
+        cache = RunCache(cache_dir=self.tmp_dir.name)
+
+        cache.store(self.get_data(cutoff=10, status="SUCCESS", time=5))
+        cache.store(self.get_data(cutoff=20, status="TIMEOUT", time=20))
+        cache.store(self.get_data(cutoff=20, seed=2, status="CRASHED", time=1))
+
+        # SUCCESS answers all cutoffs larger than its runtime
+        for cutoff in [5, 10, 100]:
+            data = self.get_data(cutoff=cutoff)
+            self.assertTrue(cache.lookup(data))
+            self.assertEqual((data.status, data.time), ("SUCCESS", 5))
+
+        # TIMEOUT at cutoff 20 answers smaller cutoffs
+        data = self.get_data(cutoff=3)
+        self.assertTrue(cache.lookup(data))
+        self.assertEqual((data.status, data.time, data.cost), ("TIMEOUT", 3, 3))
+
+        # neither answers 5 < cutoff <= 20 for another seed
+        self.assertFalse(cache.lookup(self.get_data(cutoff=3, seed=2)))
+        # ... unless the target ignores the seed
+        cache = RunCache(cache_dir=self.tmp_dir.name, seed_independent=True)
+        cache.store(self.get_data(cutoff=10, status="TIMEOUT", time=10))
+        self.assertTrue(cache.lookup(self.get_data(cutoff=3, seed=42)))
+
+    def test_memout(self):
+        cache = RunCache(cache_dir=self.tmp_dir.name)
+        cache.store(self.get_data(cutoff=10, status="TIMEOUT", time=4, memout=True))
+
+        # the memory out happens again for all cutoffs larger than its runtime
+        for cutoff in [5, 100]:
+            data = self.get_data(cutoff=cutoff)
+            self.assertTrue(cache.lookup(data))
+            self.assertEqual((data.status, data.time, data.memout), ("TIMEOUT", 4, True))
+
+        # smaller cutoffs are reached before
+        data = self.get_data(cutoff=3)
+        self.assertTrue(cache.lookup(data))
+        self.assertEqual((data.status, data.time, data.memout), ("TIMEOUT", 3, False))
+
+    def test_options(self):
+        RunCache(cache_dir=self.tmp_dir.name, options={"sat_checker": None}).store(
+            self.get_data(cutoff=10, status="SUCCESS", time=5))
+
+        self.assertTrue(RunCache(cache_dir=self.tmp_dir.name, options={"sat_checker": None}).lookup(
+            self.get_data(cutoff=10)))
+        self.assertFalse(RunCache(cache_dir=self.tmp_dir.name, options={"sat_checker": "checker"}).lookup(
+            self.get_data(cutoff=10)))
+
+    def test_limit_backend(self):
+        cache = RunCache(cache_dir=self.tmp_dir.name)
+        data = self.get_data(cutoff=10, status="TIMEOUT", time=4, memout=True)
+        data.mem_limit = 100
+        data.limit_backend = "runsolver"
+        cache.store(data)
+
+        # the memory limit of runsolver (virtual memory) is not the one of a cgroup (resident memory)
+        data = self.get_data(cutoff=10)
+        data.mem_limit = 100
+        data.limit_backend = "cgroup"
+        self.assertFalse(cache.lookup(data))
+        data.limit_backend = "runsolver"
+        self.assertTrue(cache.lookup(data))
+
+    def test_wrapper(self):
+        argv = ("examples/MiniSAT/MiniSATWrapper.py --instance examples/MiniSAT/gzip_vc1071.cnf "
+                "--cutoff 10 --seed 42 --runsolver-path %s --run-cache-dir %s --deterministic "
+                "--config -rnd-freq 0" % (self.runsolver, self.tmp_dir.name)).split(" ")
+
+        data = MiniSATWrapper().run(argv)
+        self.assertEqual(data.status, "SUCCESS")
+
+        wrapper = MiniSATWrapper()
+        with mock.patch.object(wrapper, "call_target", side_effect=AssertionError):
+            cached = wrapper.run(argv)
+
+        self.assertEqual(cached.status, "SUCCESS")
+        self.assertEqual(cached.time, data.time)
+        self.assertIn("result from run cache", cached.additional)
+
+    def test_not_deterministic(self):
+        argv = ("examples/MiniSAT/MiniSATWrapper.py --instance examples/MiniSAT/gzip_vc1071.cnf "
+                "--cutoff 10 --seed 42 --runsolver-path %s --run-cache-dir %s "
+                "--config -rnd-freq 0" % (self.runsolver, self.tmp_dir.name)).split(" ")
+
+        with self.assertLogs("GenericWrapper", level="WARNING"):
+            data = MiniSATWrapper().run(argv)
+        self.assertEqual(data.status, "SUCCESS")
+        # nothing was cached
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+    def test_broken_database(self):
+        cache = RunCache(cache_dir=self.tmp_dir.name)
+        with open(cache.db_file, "wb") as fp:
+            fp.write(b"not a database" * 1000)
+
+        # lookup and store only log a warning
+        with self.assertLogs("RunCache", level="WARNING"):
+            self.assertFalse(cache.lookup(self.get_data(cutoff=10)))
+        with self.assertLogs("RunCache", level="WARNING"):
+            cache.store(self.get_data(cutoff=10, status="SUCCESS", time=5))
+
+        # the wrapper runs without the cache
+        argv = ("examples/MiniSAT/MiniSATWrapper.py --instance examples/MiniSAT/gzip_vc1071.cnf "
+                "--cutoff 10 --seed 42 --runsolver-path %s --run-cache-dir %s --deterministic "
+                "--config -rnd-freq 0" % (self.runsolver, self.tmp_dir.name)).split(" ")
+        with self.assertLogs("GenericWrapper", level="WARNING"):
+            data = MiniSATWrapper().run(argv)
+        self.assertEqual(data.status, "SUCCESS")
@@ -1,17 +1,15 @@
 import unittest
 import sys
-import os
 
 from examples.MiniSAT.MiniSATWrapper import MiniSATWrapper
 from examples.SGD.SGDWrapper import SGDWrapper
+from test import get_runsolver
 
 
 class TestCalls(unittest.TestCase):
 
     def setUp(self):
-        self.runsolver = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)),
-            "test_binaries", "runsolver")
+        self.runsolver = get_runsolver()
 
     def test_minisat_old(self):
 
@@ -1,10 +1,13 @@
 import unittest
 import io
 import os
+import sys
 import tempfile
+import subprocess
 
 from genericWrapper4AC.domain_specific.satwrapper import SatWrapper
 from genericWrapper4AC.argparser.parse import parse
+from test import get_runsolver
 
 
 class TestChecker(unittest.TestCase):
@@ -59,6 +62,12 @@ CPU time              : 0.008 s
             "examples/MiniSAT/gzip_vc1071.cnf UNKNOWN")
         self.unknown_sol_file.flush()
 
+    def tearDown(self):
+        # remove the indices of the solubility files
+        for fp in [self.sat_sol_file, self.unsat_sol_file, self.unknown_sol_file]:
+            if os.path.exists(fp.name + ".idx"):
+                os.remove(fp.name + ".idx")
+
     def parse_results(self, solver, specific, sol_file):
         wrapper = SatWrapper()
         wrapper.data, wrapper.args = parse(cmd_arguments=self.call,
@@ -135,4 +144,35 @@ CPU time              : 0.008 s
         res_map = self.parse_results(solver="UNSATISFIABLE",
                                      specific="SATISFIABLE",
                                      sol_file="UNKNOWN")
-        self.assertEqual(res_map["status"], "CRASHED", res_map["misc"])
\ No newline at end of file
+        self.assertEqual(res_map["status"], "CRASHED", res_map["misc"])
+
+    def run_sat_checker(self, model, log_capture):
+        resources = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                 "test_resources")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            instance = os.path.join(tmp_dir, "instance.cnf")
+            with open(instance, "w") as fp:
+                fp.write("p cnf 2 2\n1 2 0\n-1 0\n")
+
+            # fails instead of hanging if the checker cannot read the solver output
+            return subprocess.check_output(
+                [sys.executable, os.path.join(resources, "model_wrapper.py"),
+                 "--instance", instance, "--cutoff", "10", "--seed", "42",
+                 "--runsolver-path", os.path.abspath(get_runsolver()),
+                 "--sat-checker", os.path.join(resources, "sat_checker.py"),
+                 "--temp-file-dir", tmp_dir,
+                 "--log-capture", log_capture,
+                 "--config", "-x1", model[0], "-x2", model[1]],
+                # logs of CRASHED runs are preserved in the working directory
+                cwd=tmp_dir, env=dict(os.environ, PYTHONPATH=os.getcwd()),
+                universal_newlines=True, timeout=60)
+
+    def test_sat_checker(self):
+        for log_capture in ["disk", "bounded", "shm"]:
+            out = self.run_sat_checker(model=["-1", "2"], log_capture=log_capture)
+            self.assertIn("Solution verified", out)
+            self.assertIn("Result for ParamILS: SUCCESS", out)
+
+            out = self.run_sat_checker(model=["1", "2"], log_capture=log_capture)
+            self.assertIn("Result for ParamILS: CRASHED", out)
+            self.assertIn("SOLVER BUG: solver returned a wrong model", out)
@@ -0,0 +1,218 @@
+import unittest
+import os
+import gzip
+import sys
+import time
+import tempfile
+import subprocess
+
+from genericWrapper4AC.generic_wrapper import AbstractWrapper
+from genericWrapper4AC.capture.buffer import RingBuffer, HeadTailBuffer, DROP_MARKER
+from genericWrapper4AC.capture.fifo import FifoLog
+from genericWrapper4AC.domain_specific.satwrapper import SatOutputParser
+from genericWrapper4AC.data.data import Data
+from test import get_runsolver
+
+
+class EchoWrapper(AbstractWrapper):
+
+    def get_command_line_args(self, runargs, config):
+        return [sys.executable, "-c", "import sys\n"
+                "sys.stdout.write('c progress\\n' * %s)\n"
+                "print('result %s')\n"
+                "sys.exit(%s)" % (config["-lines"], config["-quality"], config["-exit"])]
+
+    def process_results(self, filepointer, out_args):
+        output = filepointer.read().decode("utf8").split()
+        if out_args["exit_code"]:
+            return {"status": "CRASHED"}
+        return {"status": "SUCCESS", "quality": float(output[-1])}
+
+
+class TailWrapper(AbstractWrapper):
+
+    def get_output_parser(self):
+        return SatOutputParser()
+
+
+class TestCapture(unittest.TestCase):
+
+    def setUp(self):
+        self.runsolver = get_runsolver()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        # preserved logs are written to the working directory
+        os.chdir(self.tmp_dir.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def test_ring_buffer(self):
+        buffer = RingBuffer(size=10)
+        for i in range(100):
+            buffer.write(b"%d\n" % (i))
+        data = b"".join(b"%d\n" % (i) for i in range(100))
+        self.assertEqual(buffer.getvalue(), data[-10:])
+        self.assertEqual(buffer.dropped, len(data) - 10)
+
+    def test_head_tail_buffer(self):
+        lines = [b"c conflict %d\n" % (i) for i in range(10000)]
+        lines[5000] = b"s SATISFIABLE\n"
+        lines[6000] = b"v 1 -2 0\n"
+        buffer = HeadTailBuffer(head=100, tail=100, patterns=SatOutputParser().patterns)
+        for i in range(0, len(lines), 7):
+            buffer.write(b"".join(lines[i:i + 7]))
+
+        data = b"".join(lines)
+        kept = data[:100] + b"s SATISFIABLE\nv 1 -2 0\n" + data[-100:]
+        self.assertEqual(buffer.dropped, len(data) - len(kept))
+        self.assertEqual(buffer.getvalue(), data[:100] + DROP_MARKER % (buffer.dropped) +
+                         b"s SATISFIABLE\nv 1 -2 0\n" + data[-100:])
+
+        # nothing is dropped if the output is small
+        buffer = HeadTailBuffer(head=100, tail=100)
+        buffer.write(data[:150])
+        self.assertEqual(buffer.getvalue(), data[:150])
+        self.assertEqual(buffer.dropped, 0)
+
+    def test_fifo_log(self):
+        log = FifoLog(dir=self.tmp_dir.name, prefix="solver-", buffer=RingBuffer(size=1000))
+        process = subprocess.Popen(["seq", "1", "100000"], stdout=log)
+        log.start()
+        process.wait()
+        log.finish()
+
+        output = subprocess.check_output(["seq", "1", "100000"])
+        self.assertEqual(log.read(), output[-1000:])
+        self.assertEqual(log.dropped, len(output) - 1000)
+        log.seek(0)
+        self.assertEqual(list(log)[-1], b"100000\n")
+
+        log.close()
+        os.remove(log.name)
+
+    def test_fifo_log_held_open(self):
+        log = FifoLog(dir=self.tmp_dir.name, prefix="solver-", buffer=RingBuffer(size=1000))
+        log.start()
+        # e.g., an orphan of the run still holds the write end of the FIFO
+        orphan = os.open(log.name, os.O_WRONLY)
+        os.write(orphan, b"last line\n")
+        time.sleep(0.1)
+        log.finish(timeout=0.1)
+
+        self.assertFalse(log._thread.is_alive())
+        self.assertEqual(log.read(), b"last line\n")
+        # the read end is closed
+        with self.assertRaises(BrokenPipeError):
+            os.write(orphan, b"more\n")
+        os.close(orphan)
+
+        log.close()
+        os.remove(log.name)
+
+    def run_wrapper(self, quality: int, exit_code: int, lines: int = 0, options: list = [],
+                    capture: str = "shm"):
+        wrapper = EchoWrapper()
+        data = wrapper.run(["wrapper.py", "--instance", "dummy", "--cutoff", "5", "--seed", "1",
+                            "--runsolver-path", self.runsolver,
+                            "--temp-file-dir", self.tmp_dir.name, "--log-capture", capture] + options +
+                           ["--config", "-quality", str(quality), "-exit", str(exit_code), "-lines", str(lines)])
+        return wrapper, data
+
+    def test_success(self):
+        wrapper, data = self.run_wrapper(quality=3, exit_code=0)
+
+        self.assertEqual(data.status, "SUCCESS")
+        self.assertEqual(data.cost, 3)
+        for log_file in [wrapper._watcher_file, wrapper._solver_file]:
+            self.assertFalse(os.path.exists(log_file.name))
+        # nothing was written to the temp and the working directory
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+    def test_crashed_run_is_preserved(self):
+        wrapper, data = self.run_wrapper(quality=3, exit_code=1)
+
+        self.assertEqual(data.status, "CRASHED")
+        for log_file in [wrapper._watcher_file, wrapper._solver_file]:
+            self.assertFalse(os.path.exists(log_file.name))
+        preserved = sorted(os.listdir(self.tmp_dir.name))
+        self.assertEqual([name.split("-")[0] for name in preserved], ["solver", "watcher"])
+        with open(preserved[0]) as fp:
+            self.assertEqual(fp.read(), "result 3\n")
+        self.assertIn(os.path.abspath(preserved[0]), data.additional)
+
+    def test_tail(self):
+        wrapper = TailWrapper()
+        wrapper.data = Data()
+        wrapper.data.tmp_dir = self.tmp_dir.name
+        wrapper.data.runsolver = self.runsolver
+        wrapper.data.cutoff = 5
+        wrapper.data.tail_output = True
+        wrapper.data.log_capture = "shm"
+
+        wrapper.call_target([sys.executable, "-c", "print('s SATISFIABLE\\nv 1 -2\\nv 3 0', end='')"])
+        parser = wrapper.parse_output(filepointer=None)
+
+        wrapper._watcher_file.close()
+        wrapper._solver_file.close()
+        os.remove(wrapper._watcher_file.name)
+        os.remove(wrapper._solver_file.name)
+
+        self.assertEqual(parser.status, "SAT")
+        self.assertEqual(parser.model, [1, -2, 3])
+
+    def test_bounded_compressed(self):
+        # about 11MB of output
+        wrapper, data = self.run_wrapper(quality=3, exit_code=1, lines=1000000,
+                                         options=["--log-head-size", "1", "--log-buffer-size", "1",
+                                                  "--log-compression", "gzip"])
+
+        self.assertEqual(data.status, "CRASHED")
+        dropped = len(b"c progress\n" * 1000000 + b"result 3\n") - 2 * 1024 ** 2
+        self.assertIn("; dropped %d bytes of the target algorithm output" % (dropped), data.additional)
+
+        solver_log = [name for name in os.listdir(self.tmp_dir.name) if name.startswith("solver")][0]
+        self.assertTrue(solver_log.endswith(".log.gz"))
+        with gzip.open(solver_log) as fp:
+            output = fp.read()
+        self.assertEqual(len(output), 2 * 1024 ** 2 + len(DROP_MARKER % (dropped)))
+        self.assertTrue(output.endswith(b"c progress\nresult 3\n"))
+
+    def test_bounded_temp_dir(self):
+        wrapper, data = self.run_wrapper(quality=3, exit_code=1, lines=1000000, capture="bounded",
+                                         options=["--log-head-size", "1", "--log-buffer-size", "1"])
+
+        self.assertEqual(data.status, "CRASHED")
+        dropped = len(b"c progress\n" * 1000000 + b"result 3\n") - 2 * 1024 ** 2
+        self.assertIn("; dropped %d bytes of the target algorithm output" % (dropped), data.additional)
+
+        # only the kept part of the output was written
+        solver_log = [name for name in os.listdir(self.tmp_dir.name) if name.startswith("solver")][0]
+        self.assertEqual(os.path.getsize(solver_log), 2 * 1024 ** 2 + len(DROP_MARKER % (dropped)))
+
+    def test_disk(self):
+        wrapper, data = self.run_wrapper(quality=3, exit_code=1, lines=1000000, capture="disk",
+                                         options=["--log-head-size", "1", "--log-buffer-size", "1"])
+
+        self.assertEqual(data.status, "CRASHED")
+        self.assertNotIn("dropped", data.additional)
+
+        # the whole output is kept in a regular file
+        output = b"c progress\n" * 1000000 + b"result 3\n"
+        solver_log = [name for name in os.listdir(self.tmp_dir.name) if name.startswith("solver")][0]
+        self.assertEqual(os.path.getsize(solver_log), len(output))
+
+    def test_fifo_replaced_by_file(self):
+        log = FifoLog(dir=self.tmp_dir.name, prefix="solver-", buffer=RingBuffer(size=1000))
+        log.start()
+        os.write(log.fileno(), b"s SATISFIABLE\n")
+        log.finish()
+
+        # the output can be opened by its name (e.g., by an external checker)
+        self.assertTrue(os.path.isfile(log.name))
+        with open(log.name, "rb") as fp:
+            self.assertEqual(fp.read(), b"s SATISFIABLE\n")
+
+        log.close()
+        os.remove(log.name)
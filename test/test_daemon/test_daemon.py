@@ -0,0 +1,67 @@
+import unittest
+import os
+import json
+import tempfile
+import threading
+
+from examples.MiniSAT.MiniSATWrapper import MiniSATWrapper
+from genericWrapper4AC.daemon.server import WrapperServer
+from genericWrapper4AC.daemon.client import request_run
+from test import get_runsolver
+
+
+class TestDaemon(unittest.TestCase):
+
+    def setUp(self):
+        self.runsolver = get_runsolver()
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.tmp_dir.name, "wrapper.sock")
+        self.server = WrapperServer(socket_path=self.socket_path,
+                                    wrapper=MiniSATWrapper())
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        self.tmp_dir.cleanup()
+
+    def test_many_runs(self):
+
+        call_old = "examples/MiniSAT/MiniSATWrapper.py examples/MiniSAT/gzip_vc1071.cnf SAT 10 0 42 -rnd-freq 0"
+        call_new = "examples/MiniSAT/MiniSATWrapper.py --instance examples/MiniSAT/gzip_vc1071.cnf --cutoff 10 --seed 42 --config -rnd-freq 0"
+
+        # the new format must not break the old one (and vice versa)
+        for call in [call_old, call_new, call_old, call_new]:
+            argv = (call + " --runsolver-path " + self.runsolver).split(" ")
+            output, exit_code = request_run(self.socket_path, argv)
+
+            # minisat's exit code for SAT is passed through (as in main())
+            self.assertEqual(exit_code, 10)
+            self.assertIn("Result for ParamILS: SUCCESS", output)
+            self.assertEqual(
+                "Result of this algorithm run:" in output, "--config" in call)
+
+    def test_result_output(self):
+
+        result_file = os.path.join(self.tmp_dir.name, "result.json")
+        read_fd, write_fd = os.pipe()
+        argv = ["examples/MiniSAT/MiniSATWrapper.py", "--instance", "examples/MiniSAT/gzip_vc1071.cnf",
+                "--cutoff", "10", "--seed", "42", "--config", "-rnd-freq", "0",
+                "--runsolver-path", self.runsolver,
+                "--result-file", result_file, "--result-fd", str(write_fd)]
+        try:
+            output, exit_code = request_run(self.socket_path, argv)
+        finally:
+            os.close(write_fd)
+        with os.fdopen(read_fd, "rb") as fp:
+            from_fd = json.loads(fp.read().decode("utf8"))
+
+        # --result-file is written by the daemon, --result-fd by the client
+        with open(result_file) as fp:
+            from_file = json.load(fp)
+        self.assertEqual(from_file, from_fd)
+        self.assertEqual(from_file["status"], "SUCCESS")
+        self.assertIn("Result for ParamILS: SUCCESS", output)
@@ -0,0 +1,100 @@
+import unittest
+import sys
+import copy
+import json
+import pickle
+
+from genericWrapper4AC.generic_wrapper import AbstractWrapper
+from genericWrapper4AC.data.data import Data
+from genericWrapper4AC.data.request import RunRequest
+from genericWrapper4AC.argparser.parse import parse, get_parser, parse_run_dict, get_run_template
+from test import get_runsolver
+
+
+class ConfigWrapper(AbstractWrapper):
+
+    def get_command_line_args(self, runargs, config):
+        # existing hooks change, serialize and pickle the configuration
+        self.seen = json.dumps(config)
+        pickle.dumps(config)
+        config.pop("-a")
+        config["-c"] = "3"
+        return [sys.executable, "-c", "pass"]
+
+    def process_results(self, filepointer, out_args):
+        return {"status": "SUCCESS"}
+
+
+class TestRunRequest(unittest.TestCase):
+
+    def test_immutable_and_hashable(self):
+        request = RunRequest(instance="inst", seed=1, cutoff=10,
+                             config={"-a": "1", "-b": "2"})
+        with self.assertRaises(AttributeError):
+            request.seed = 2
+
+        # the order of the parameters does not matter
+        same = RunRequest(instance="inst", seed=1, cutoff=10,
+                          config=[("-b", "2"), ("-a", "1")])
+        self.assertEqual(request, same)
+        self.assertEqual(len(set([request, same])), 1)
+        self.assertNotEqual(request, request.replace(seed=2))
+        self.assertEqual(request.replace(seed=2).config, {"-a": "1", "-b": "2"})
+
+        self.assertEqual(pickle.loads(pickle.dumps(request)), request)
+        self.assertEqual(copy.copy(request), request)
+
+    def test_data_facade(self):
+        data = Data()
+        request = data.request
+        data.seed = 3
+        data.config = {"-a": "1"}
+
+        self.assertEqual(request, RunRequest())
+        self.assertEqual(data.request, RunRequest(seed=3, config={"-a": "1"}))
+        # the returned configuration is read-only
+        with self.assertRaises(TypeError):
+            data.config["-a"] = "2"
+        self.assertEqual(data.config, {"-a": "1"})
+        # and is not built again on each access
+        self.assertIs(data.config, data.config)
+        # but can be replaced
+        data.config = dict(data.config, **{"-a": "2"})
+        self.assertEqual(data.request, RunRequest(seed=3, config={"-a": "2"}))
+
+    def test_copy(self):
+        data = Data(request=RunRequest(instance="inst", cutoff=5))
+        data.mem_limit = 100
+        data.status = "SUCCESS"
+
+        other = data.copy(request=data.request.replace(seed=7))
+        self.assertEqual(other.seed, 7)
+        self.assertEqual(other.mem_limit, 100)
+        self.assertEqual(other.status, "CRASHED")
+        self.assertEqual(other.time, 5)
+        self.assertEqual(data.seed, None)
+        self.assertEqual(data.status, "SUCCESS")
+
+    def test_run_dict_equals_cmd_line(self):
+        cmd = ["wrapper.py", "--instance", "inst", "--cutoff", "9.5", "--seed", "3",
+               "--mem-limit", "100", "--config", "-a", "'1'", "-b", "2"]
+        parsed, args = parse(cmd_arguments=cmd, parser=get_parser())
+
+        run = {"instance": "inst", "cutoff": 9.5, "seed": 3, "config": {"-a": 1, "-b": 2}}
+        from_dict = parse_run_dict(run=run, template=get_run_template(args))
+
+        self.assertEqual(from_dict.cutoff, parsed.cutoff)
+        self.assertEqual(from_dict.config, parsed.config)
+        self.assertEqual(from_dict.mem_limit, 100)
+        self.assertEqual(from_dict.new_format, parsed.new_format)
+
+    def test_hook_gets_dict(self):
+        wrapper = ConfigWrapper()
+        data = wrapper.run(["wrapper.py", "--instance", "inst", "--cutoff", "5", "--seed", "1",
+                            "--runsolver-path", get_runsolver(),
+                            "--config", "-a", "1", "-b", "2"])
+
+        self.assertEqual(data.status, "SUCCESS")
+        self.assertEqual(json.loads(wrapper.seen), {"-a": "1", "-b": "2"})
+        # the request is not changed by the hook
+        self.assertEqual(data.config, {"-a": "1", "-b": "2"})
@@ -0,0 +1,106 @@
+import unittest
+import io
+import os
+import bz2
+import gzip
+import lzma
+import zlib
+import tempfile
+
+from genericWrapper4AC.domain_specific.cnf import CNF
+from genericWrapper4AC.domain_specific.satwrapper import SatWrapper
+from genericWrapper4AC.argparser.parse import parse
+
+INSTANCE = b"""c small instance
+p cnf 3 3
+1 2 0
+-1 3
+0
+-2 -3 0
+"""
+
+
+class TestCNF(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write(self, name, opener=open):
+        path = os.path.join(self.tmp_dir.name, name)
+        with opener(path, "wb") as fp:
+            fp.write(INSTANCE)
+        return path
+
+    def test_read_compressed(self):
+        for name, opener in [("a.cnf", open), ("a.cnf.gz", gzip.open),
+                             ("a.cnf.bz2", bz2.open), ("a.cnf.xz", lzma.open)]:
+            cnf = CNF.read(self.write(name, opener))
+            self.assertEqual(cnf.n_vars, 3)
+            self.assertEqual(cnf.n_clauses, 3)
+            self.assertEqual(list(cnf.literals), [1, 2, 0, -1, 3, 0, -2, -3, 0])
+
+    def test_verify(self):
+        cnf = CNF.read(self.write("a.cnf"))
+        self.assertTrue(cnf.verify([1, -2, 3])[0])
+        self.assertFalse(cnf.verify([1, 2, 3])[0])
+        self.assertFalse(cnf.verify([-1, -2, 3])[0])
+        # inconsistent model
+        self.assertFalse(cnf.verify([1, -1, -2, 3])[0])
+
+    def test_verify_big_instance(self):
+        cnf = CNF.read("examples/MiniSAT/gzip_vc1071.cnf")
+        self.assertEqual(cnf.n_vars, 10001)
+        self.assertFalse(cnf.verify([])[0])
+
+    def test_sat_wrapper(self):
+        instance = self.write("a.cnf.gz", gzip.open)
+        for model, status in [("v 1 -2 3 0", "SAT"), ("v 1 2 3 0", "CRASHED")]:
+            wrapper = SatWrapper()
+            wrapper.data, wrapper.args = parse(
+                cmd_arguments=["wrapper.py", "--native-sat-checker",
+                               "--instance", instance, "--config"],
+                parser=wrapper.parser)
+
+            res_file = io.StringIO("s SATISFIABLE\n%s\n" % (model))
+            res_file.name = "FAKE"
+
+            res_map = wrapper.process_results(res_file, exit_code=0)
+            self.assertEqual(res_map["status"], status, res_map["misc"])
+
+    def test_corrupt_instance(self):
+        checker = os.path.join(self.tmp_dir.name, "checker.sh")
+        with open(checker, "w") as fp:
+            fp.write("#!/bin/sh\necho Wrong solution\n")
+        os.chmod(checker, 0o755)
+
+        # invalid block type in the first deflate byte (after the 10 byte
+        # gzip header and the stored file name) and a corrupt xz block
+        for name, offset, opener, error in [
+                ("a.cnf.gz", lambda size: 10 + len(b"a.cnf\0"), gzip.open, zlib.error),
+                ("a.cnf.xz", lambda size: size // 2, lzma.open, lzma.LZMAError)]:
+            instance = self.write(name, opener)
+            with open(instance, "r+b") as fp:
+                data = bytearray(fp.read())
+                data[offset(len(data))] ^= 0xff
+                fp.seek(0)
+                fp.write(data)
+            self.assertRaises(error, CNF.read, instance)
+
+            # without an external checker, the result is not verified;
+            # otherwise the external checker is used
+            for extra, status, misc in [([], "SAT", "; could not read instance; could not verify SAT"),
+                                        (["--sat-checker", checker], "CRASHED", "wrong model")]:
+                wrapper = SatWrapper()
+                wrapper.data, wrapper.args = parse(
+                    cmd_arguments=["wrapper.py", "--native-sat-checker", "--instance", instance]
+                    + extra + ["--config"], parser=wrapper.parser)
+                res_file = io.StringIO("s SATISFIABLE\nv 1 -2 3 0\n")
+                res_file.name = "FAKE"
+
+                with self.assertLogs("GenericWrapper", level="WARNING"):
+                    res_map = wrapper.process_results(res_file, exit_code=0)
+                self.assertEqual(res_map["status"], status, name)
+                self.assertIn(misc, res_map["misc"])
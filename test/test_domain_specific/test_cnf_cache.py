@@ -0,0 +1,64 @@
+import unittest
+import os
+import time
+import tempfile
+from unittest import mock
+
+from genericWrapper4AC.domain_specific.cnf import CNF
+from genericWrapper4AC.domain_specific.cnf_cache import CNFCache
+
+
+class TestCNFCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.tmp_dir.name, "cache")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write(self, name, clauses):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, "w") as fp:
+            fp.write("p cnf 3 %d\n" % (len(clauses)))
+            for clause in clauses:
+                fp.write(" ".join(map(str, clause + [0])) + "\n")
+        return path
+
+    def test_load_from_cache(self):
+        path = self.write("a.cnf", [[1, 2], [-1, 3]])
+        cache = CNFCache(cache_dir=self.cache_dir)
+
+        cnf = cache.load(path)
+        self.assertTrue(os.path.isfile(cache.get_entry(path)))
+
+        # 2nd load must not parse the instance again
+        with mock.patch.object(CNF, "read", side_effect=AssertionError):
+            cached = CNFCache(cache_dir=self.cache_dir).load(path)
+
+        self.assertEqual(list(cached.literals), list(cnf.literals))
+        self.assertEqual(cached.n_vars, 3)
+        self.assertEqual(cached.n_clauses, 2)
+        self.assertTrue(cached.verify([1, 3])[0])
+        self.assertFalse(cached.verify([-1, -2])[0])
+
+    def test_invalidation(self):
+        path = self.write("a.cnf", [[1, 2]])
+        cache = CNFCache(cache_dir=self.cache_dir)
+        cache.load(path)
+
+        time.sleep(0.01)
+        path = self.write("a.cnf", [[1, 2], [3]])
+        self.assertEqual(list(cache.load(path).literals), [1, 2, 0, 3, 0])
+
+    def test_eviction(self):
+        cache = CNFCache(cache_dir=self.cache_dir, max_size=0)
+        cache.max_size = 150  # bytes
+        paths = [self.write("%d.cnf" % (i), [[1, 2, 3]] * 4) for i in range(3)]
+        for path in paths:
+            cache.load(path)
+            time.sleep(0.01)
+
+        # each entry has 40 + 16 * 4 bytes, i.e., only the last one fits
+        entries = [os.path.isfile(cache.get_entry(path)) for path in paths]
+        self.assertEqual(entries, [False, False, True])
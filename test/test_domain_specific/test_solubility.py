@@ -0,0 +1,54 @@
+import unittest
+import os
+import time
+import tempfile
+
+from genericWrapper4AC.domain_specific.solubility import SolubilityIndex
+
+
+class TestSolubilityIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.sol_file = os.path.join(self.tmp_dir.name, "sol.txt")
+        with open(self.sol_file, "w") as fp:
+            fp.write("inst10.cnf UNSATISFIABLE\n"
+                     "inst1.cnf SATISFIABLE\n"
+                     "inst2.cnf UNKNOWN\n"
+                     "inst1.cnf UNSATISFIABLE\n")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_lookup(self):
+        index = SolubilityIndex(self.sol_file)
+
+        # exact match; no prefix matches of other instances
+        self.assertEqual(index.lookup("inst1.cnf"), "SATISFIABLE")
+        self.assertEqual(index.lookup("inst10.cnf"), "UNSATISFIABLE")
+        self.assertEqual(index.lookup("inst2.cnf"), "UNKNOWN")
+        self.assertIsNone(index.lookup("inst"))
+        self.assertTrue(os.path.isfile(self.sol_file + ".idx"))
+
+    def test_special_characters(self):
+        # characters with a meaning in URIs
+        sol_dir = os.path.join(self.tmp_dir.name, "a?b#c%20 d")
+        os.mkdir(sol_dir)
+        sol_file = os.path.join(sol_dir, "sol.txt")
+        os.rename(self.sol_file, sol_file)
+
+        for _ in range(2):
+            index = SolubilityIndex(sol_file)
+            self.assertEqual(index.lookup("inst1.cnf"), "SATISFIABLE")
+            # answered by the index, not by the fallback table
+            self.assertIsNone(index._table)
+
+    def test_rebuild(self):
+        self.assertIsNone(SolubilityIndex(self.sol_file).lookup("inst3.cnf"))
+
+        time.sleep(0.01)
+        with open(self.sol_file, "a") as fp:
+            fp.write("inst3.cnf SATISFIABLE\n")
+
+        self.assertEqual(SolubilityIndex(self.sol_file).lookup("inst3.cnf"),
+                         "SATISFIABLE")
@@ -0,0 +1,85 @@
+import unittest
+import os
+import functools
+import tempfile
+
+from genericWrapper4AC.generic_wrapper import AbstractWrapper
+
+
+def print_quality(quality):
+    print(quality)
+
+
+def busy_loop():
+    while True:
+        pass
+
+
+class PreparedWrapper(AbstractWrapper):
+
+    def __init__(self, prepare_log):
+        AbstractWrapper.__init__(self)
+        self.prepare_log = prepare_log
+
+    def prepare(self):
+        with open(self.prepare_log, "a") as fp:
+            fp.write("%d\n" % (os.getpid()))
+        self.offset = 0.5
+
+    def get_command_line_args(self, runargs, config):
+        if config["target"] == "echo":
+            return ["echo", str(self.offset + runargs["seed"])]
+        if config["target"] == "loop":
+            return busy_loop
+        return functools.partial(print_quality, self.offset + runargs["seed"])
+
+    def process_results(self, filepointer, out_args):
+        output = filepointer.read().decode("utf8").strip()
+        if not output:
+            return {}
+        return {"status": "SUCCESS", "quality": float(output)}
+
+
+class TestForkServer(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.prepare_log = os.path.join(self.tmp_dir.name, "prepare.log")
+
+        self.wrapper = PreparedWrapper(prepare_log=self.prepare_log)
+        self.wrapper.args, _ = self.wrapper.parser.parse_known_args(
+            ["--temp-file-dir", self.tmp_dir.name])
+        self.wrapper.start_fork_server()
+
+    def tearDown(self):
+        self.wrapper.stop_fork_server()
+        self.tmp_dir.cleanup()
+
+    def test_prepared_runs(self):
+        runs = [{"instance": "dummy", "cutoff": 10, "seed": seed,
+                 "config": {"target": target}}
+                for seed in range(1, 5) for target in ["call", "echo"]]
+
+        results = list(self.wrapper.run_batch(runs=runs, n_workers=2))
+
+        self.assertEqual(len(results), len(runs))
+        for run, data in results:
+            self.assertEqual(data.status, "SUCCESS")
+            self.assertEqual(data.cost, run["seed"] + 0.5)
+            self.assertGreater(data.resources["wall_time"], 0)
+            self.assertGreater(data.resources["peak_rss_mb"], 0)
+
+        # prepare() was called once, in the template process
+        with open(self.prepare_log) as fp:
+            pids = fp.read().split()
+        self.assertEqual(len(pids), 1)
+        self.assertNotEqual(int(pids[0]), os.getpid())
+        self.assertFalse(hasattr(self.wrapper, "offset"))
+
+    def test_timelimit(self):
+        runs = [{"instance": "dummy", "cutoff": 1, "seed": 1,
+                 "config": {"target": "loop"}}]
+
+        (_, data), = self.wrapper.run_batch(runs=runs, n_workers=1)
+
+        self.assertEqual(data.status, "TIMEOUT")
@@ -0,0 +1,97 @@
+import unittest
+import os
+import sys
+import functools
+import subprocess
+
+from genericWrapper4AC.generic_wrapper import AbstractWrapper
+from genericWrapper4AC.data.data import Data
+
+
+def print_quality(quality):
+    print(quality)
+
+
+def busy_loop():
+    while True:
+        pass
+
+
+def allocate(n_mb):
+    blocks = []
+    while True:
+        blocks.append(bytearray(n_mb * 1024 ** 2))
+
+
+def run_children(code, n_children):
+    children = [subprocess.Popen([sys.executable, "-c", code]) for _ in range(n_children)]
+    for child in children:
+        child.wait()
+
+
+def fail():
+    raise ValueError("target failed")
+
+
+class TestForkedProcess(unittest.TestCase):
+
+    def call(self, target, cutoff=10, mem_limit=500):
+        wrapper = AbstractWrapper()
+        data = Data()
+        wrapper.data = data
+        data.tmp_dir = "."
+        data.mem_limit = mem_limit
+        data.cutoff = cutoff
+
+        wrapper.call_target(target)
+        wrapper.read_runsolver_output()
+
+        self.assertIsNone(wrapper._watcher_file)
+        output = wrapper._solver_file.read().decode("utf8")
+        wrapper._solver_file.close()
+        os.remove(wrapper._solver_file.name)
+        return wrapper.data, output
+
+    def test_success(self):
+        data, output = self.call(functools.partial(print_quality, 0.25))
+
+        self.assertEqual(output.strip(), "0.25")
+        self.assertEqual(data.exit_code, 0)
+        self.assertNotEqual(data.status, "TIMEOUT")
+        self.assertLess(data.time, 10)
+
+    def test_timelimit(self):
+        data, _ = self.call(busy_loop, cutoff=1)
+
+        self.assertEqual(data.status, "TIMEOUT")
+
+    def test_memlimit(self):
+        data, _ = self.call(functools.partial(allocate, 10), mem_limit=200)
+
+        self.assertEqual(data.status, "TIMEOUT")
+        self.assertEqual(data.additional, " memory limit was exceeded")
+
+    def test_exception(self):
+        data, output = self.call(fail)
+
+        self.assertEqual(data.exit_code, 1)
+        self.assertNotEqual(data.status, "TIMEOUT")
+        self.assertIn("ValueError: target failed", output)
+
+    def test_tree_timelimit(self):
+        # each child stays below the cutoff, but not the whole tree
+        busy = "import time\nwhile time.process_time() < 0.8: pass"
+        data, _ = self.call(functools.partial(run_children, busy, 3), cutoff=1, mem_limit=None)
+
+        self.assertEqual(data.status, "TIMEOUT")
+        self.assertGreaterEqual(data.time, 1)
+
+    def test_tree_memlimit(self):
+        allocate = "import time\nblock = bytearray(100 * 1024 ** 2)\ntime.sleep(3)"
+        # the fork inherits the address space of this process
+        with open("/proc/self/statm") as fp:
+            vsize = int(fp.read().split()[0]) * os.sysconf("SC_PAGE_SIZE") // 1024 ** 2
+        data, _ = self.call(functools.partial(run_children, allocate, 3), mem_limit=vsize + 250)
+
+        self.assertEqual(data.status, "TIMEOUT")
+        self.assertEqual(data.additional, " memory limit was exceeded")
@@ -0,0 +1,188 @@
+import unittest
+import os
+import sys
+import signal
+import time
+import tempfile
+import threading
+from unittest import mock
+
+from genericWrapper4AC.generic_wrapper import AbstractWrapper
+from genericWrapper4AC.data.data import Data
+from genericWrapper4AC.limits import cgroup
+from genericWrapper4AC.limits.cgroup import read_keyed_file, delegated_cgroup, CgroupProcess
+from genericWrapper4AC.supervision.supervisor import read_stat
+from test import get_runsolver
+
+
+def cgroup_delegated():
+    try:
+        delegated_cgroup()
+        return True
+    except OSError:
+        return False
+
+
+class TestCgroup(unittest.TestCase):
+
+    def call(self, target_cmd, cutoff, mem_limit):
+        wrapper = AbstractWrapper()
+        data = Data()
+        wrapper.data = data
+        data.tmp_dir = "."
+        data.runsolver = get_runsolver()
+        data.limit_backend = "cgroup"
+        data.mem_limit = mem_limit
+        data.cutoff = cutoff
+
+        wrapper.call_target(target_cmd)
+        wrapper.read_runsolver_output()
+
+        for log_file in [wrapper._watcher_file, wrapper._solver_file]:
+            if log_file:
+                log_file.close()
+                os.remove(log_file.name)
+        return wrapper
+
+    def test_read_keyed_file(self):
+        with tempfile.NamedTemporaryFile(mode="w") as fp:
+            fp.write("usage_usec 1500000\nuser_usec 1000000\nsystem_usec 500000\n")
+            fp.flush()
+            self.assertEqual(read_keyed_file(fp.name),
+                             {"usage_usec": 1500000, "user_usec": 1000000, "system_usec": 500000})
+
+    def test_remove_failure(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # not empty, i.e., cannot be removed
+            open(os.path.join(tmp_dir, "cgroup.procs"), "w").close()
+            process = CgroupProcess.__new__(CgroupProcess)
+            process.path = tmp_dir
+            with self.assertLogs("GenericWrapper", level="WARNING"):
+                process._remove(timeout=0.05)
+            self.assertTrue(os.path.isdir(tmp_dir))
+
+    def test_delegation_failure(self):
+        with tempfile.TemporaryDirectory() as root:
+            # a fake hierarchy: the wrapper's cgroup has the memory controller
+            # but enabling it for the children fails
+            base = os.path.join(root, "wrapper")
+            os.mkdir(base)
+            for name, content in [("cgroup.controllers", "cpu memory\n"),
+                                  ("cgroup.subtree_control", "\n"), ("cgroup.procs", "")]:
+                with open(os.path.join(root, name), "w") as fp:
+                    fp.write(content)
+                with open(os.path.join(base, name), "w") as fp:
+                    fp.write(content)
+
+            def fail_subtree_control(path, mode="r"):
+                if path.endswith("cgroup.subtree_control") and mode == "w":
+                    raise PermissionError("Operation not permitted")
+                if os.path.dirname(path) not in (root, base):
+                    # interface files of the leaf do not prevent its removal
+                    return open(os.devnull, mode)
+                return open(path, mode)
+
+            with mock.patch.object(cgroup, "own_cgroup", return_value=base), \
+                    mock.patch.object(cgroup, "open", side_effect=fail_subtree_control, create=True), \
+                    mock.patch.object(cgroup, "_delegated", None), mock.patch.object(cgroup, "_leaf", None):
+                self.assertRaises(OSError, delegated_cgroup, root=root)
+                self.assertIsNone(cgroup._leaf)
+                self.assertIsNone(cgroup._delegated)
+
+            # the wrapper was moved back and the leaf was removed
+            self.assertEqual(sorted(os.listdir(base)),
+                             ["cgroup.controllers", "cgroup.procs", "cgroup.subtree_control"])
+            with open(os.path.join(base, "cgroup.procs")) as fp:
+                self.assertEqual(fp.read(), str(os.getpid()))
+
+    def interrupt(self, target_cmd):
+        '''
+            starts a cgroup run and interrupts it with SIGTERM
+            as the signal handler of the wrapper does
+        '''
+        wrapper = AbstractWrapper()
+        wrapper.data = Data()
+        wrapper.data.tmp_dir = "."
+        wrapper.data.limit_backend = "cgroup"
+        wrapper._DELAY2KILL = 0.5
+
+        cwd = os.getcwd()
+        tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(tmp_dir.name)
+        self.addCleanup(tmp_dir.cleanup)
+        self.addCleanup(os.chdir, cwd)
+
+        handler = signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(2))
+        self.addCleanup(signal.signal, signal.SIGTERM, handler)
+        threading.Timer(0.5, os.kill, (os.getpid(), signal.SIGTERM)).start()
+        with self.assertRaises(SystemExit):
+            wrapper.call_target(target_cmd)
+        with open(os.path.join(wrapper._target_process.path, "cgroup.procs")) as fp:
+            pids = [int(pid) for pid in fp.read().split()]
+        wrapper.cleanup()
+        return wrapper, pids
+
+    def test_interrupt_fake_cgroup(self):
+        with tempfile.TemporaryDirectory() as parent:
+            rmdir = os.rmdir
+
+            def remove_cgroup(path):
+                # interface files do not prevent the removal of a cgroup
+                for name in os.listdir(path):
+                    os.remove(os.path.join(path, name))
+                rmdir(path)
+
+            with mock.patch.object(cgroup, "delegated_cgroup", return_value=parent), \
+                    mock.patch.object(os, "rmdir", side_effect=remove_cgroup):
+                wrapper, pids = self.interrupt(["sleep", "100"])
+
+            self.assertEqual(os.listdir(parent), [])
+            self.assertEqual(pids, [wrapper._target_process.pid])
+            self.assertIsNotNone(wrapper._target_process.returncode)
+            self.assertEqual(wrapper._subprocesses, [])
+
+    @unittest.skipUnless(cgroup_delegated(), "cgroup v2 is not delegated")
+    def test_interrupt(self):
+        # the child leaves the process group of the target
+        wrapper, pids = self.interrupt(["/bin/sh", "-c", "setsid sleep 100 & sleep 100"])
+
+        self.assertFalse(os.path.exists(wrapper._target_process.path))
+        self.assertEqual(len(pids), 3)
+        time.sleep(0.1)
+        for pid in pids:
+            stat = read_stat(pid)
+            self.assertTrue(stat is None or stat[0] in ("Z", "X"))
+
+    def test_resources(self):
+        process = CgroupProcess.__new__(CgroupProcess)
+        process.wall_time = 2.0
+        process.cpu_stat = {"usage_usec": 1500000, "user_usec": 1000000, "system_usec": 500000}
+        process.memory_peak = 100 * 1024 ** 2
+        process.io_stat = {"rbytes": 4096, "wbytes": 0}
+
+        # memory.peak includes the page cache, i.e., it is not the resident memory
+        self.assertEqual(process.resources, {"wall_time": 2.0, "user_time": 1.0, "system_time": 0.5,
+                                             "peak_memory_mb": 100.0,
+                                             "read_bytes": 4096, "write_bytes": 0})
+
+    @unittest.skipIf(cgroup_delegated(), "cgroup v2 is delegated")
+    def test_fallback(self):
+        wrapper = self.call("python test/test_resources/pi.py", cutoff=1, mem_limit=500)
+
+        # runsolver was used
+        self.assertIsNone(wrapper._target_process)
+        self.assertEqual(wrapper.data.status, "TIMEOUT")
+
+    @unittest.skipUnless(cgroup_delegated(), "cgroup v2 is not delegated")
+    def test_timelimit(self):
+        wrapper = self.call("python test/test_resources/pi.py", cutoff=1, mem_limit=500)
+
+        self.assertEqual(wrapper.data.status, "TIMEOUT")
+        self.assertGreaterEqual(wrapper.data.time, 1)
+
+    @unittest.skipUnless(cgroup_delegated(), "cgroup v2 is not delegated")
+    def test_memlimit(self):
+        wrapper = self.call("python test/test_resources/mem_str.py", cutoff=100000, mem_limit=50)
+
+        self.assertEqual(wrapper.data.status, "TIMEOUT")
+        self.assertEqual(wrapper.data.additional, " memory limit was exceeded")
@@ -0,0 +1,68 @@
+import unittest
+import io
+
+from genericWrapper4AC.parsing.output_parser import OutputParser
+from genericWrapper4AC.domain_specific.satwrapper import SatOutputParser, SatWrapper
+from genericWrapper4AC.data.data import Data
+
+
+class TestOutputParser(unittest.TestCase):
+
+    def lines(self, text):
+        # fails if the parser reads beyond the marker line
+        for line in text.split("\n"):
+            if line == "MUST NOT BE READ":
+                self.fail("parser did not stop early")
+            yield line + "\n"
+
+    def test_registered_patterns(self):
+        parser = OutputParser()
+        found = []
+        parser.register("^c (\\d+)", lambda match, line: found.append(int(match.group(1))))
+        parser.parse(io.BytesIO(b"c 1\nfoo\nc 2\n"))
+        self.assertEqual(found, [1, 2])
+        self.assertFalse(parser.done)
+
+    def test_sat_model_early_stop(self):
+        parser = SatOutputParser()
+        parser.parse(self.lines("c comment\ns SATISFIABLE\nv 1 -2\nv 3 0\nMUST NOT BE READ"))
+        self.assertTrue(parser.done)
+        self.assertEqual(parser.status, "SAT")
+        self.assertEqual(parser.model, [1, -2, 3])
+        self.assertTrue(parser.model_complete)
+
+    def test_unsat_early_stop(self):
+        parser = SatOutputParser()
+        parser.parse(self.lines("s UNSATISFIABLE\nMUST NOT BE READ"))
+        self.assertEqual(parser.status, "UNSAT")
+        self.assertIsNone(parser.model)
+
+    def test_sat_without_model(self):
+        parser = SatOutputParser()
+        parser.parse(self.lines("s UNKNOWN\nSATISFIABLE\nv 1 2"))
+        self.assertEqual(parser.status, "SAT")
+        self.assertEqual(parser.model, [1, 2])
+        self.assertFalse(parser.model_complete)
+
+    def test_malformed_model(self):
+        parser = SatOutputParser()
+        parser.parse(self.lines("s SATISFIABLE\nv 1 -2\nv 3 x4 0\nv 5 0"))
+        self.assertEqual(parser.status, "SAT")
+        self.assertEqual(parser.model_error, "malformed literal 'x4' in the model")
+        self.assertFalse(parser.model_complete)
+        self.assertFalse(parser.done)
+
+    def test_malformed_model_crashed(self):
+        wrapper = SatWrapper()
+        wrapper.args, _ = wrapper.parser.parse_known_args([])
+        wrapper.data = Data()
+        result = wrapper.process_results(io.BytesIO(b"s SATISFIABLE\nv 1 -2 x 0\n"),
+                                         {"exit_code": 10})
+        self.assertEqual(result["status"], "CRASHED")
+        self.assertIn("malformed literal 'x'", result["misc"])
+
+    def test_unknown(self):
+        parser = SatOutputParser()
+        parser.parse(self.lines("INDETERMINATE\ns UNKNOWN"))
+        self.assertEqual(parser.status, "UNKNOWN")
+        self.assertIsNone(SatOutputParser().parse([]).status)
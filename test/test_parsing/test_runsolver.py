@@ -0,0 +1,129 @@
+import unittest
+import os
+
+from genericWrapper4AC.generic_wrapper import AbstractWrapper
+from genericWrapper4AC.data.data import Data
+from genericWrapper4AC.parsing.runsolver import parse_watcher, parse_var_file
+from test import get_runsolver
+
+WATCHER = b"""runsolver version 3.4.0 (svn: 3018) Copyright (C) 2010-2013 Olivier ROUSSEL
+
+solver pid=19355, runsolver pid=19354
+
+[startup+0.100069 s]*
+[pid=19355] ppid=19354 vsize=12532 memory=8720 CPUtime=0.08 cores=0
+Current children cumulated CPU time: 0.08 s
+
+[startup+1.10386 s]
+[pid=19355] ppid=19354 vsize=12532 memory=8748 CPUtime=1.04 cores=0
+
+Maximum CPU time exceeded: sending SIGTERM then SIGKILL
+
+Dumping a history of the last processes samples
+
+[startup+1.10386 s]
+[pid=19355] ppid=19354 vsize=12532 memory=8748 CPUtime=1.04 cores=0
+
+Child ended because it received signal 15 (SIGTERM)
+Real time (s): 1.10491
+CPU time (s): 1.0646
+CPU user time (s): 1.03257
+CPU system time (s): 0.032028
+CPU usage (%): 96.3518
+Max. virtual memory (cumulated for all children) (KiB): 12532
+Max. memory (cumulated for all children) (KiB): 8748
+
+getrusage(RUSAGE_CHILDREN,...) data:
+user time used= 1.03257
+system time used= 0.032028
+maximum resident set size= 9000
+block input operations= 8
+block output operations= 16
+voluntary context switches= 150
+involuntary context switches= 74
+
+# summary of solver processes directly reported to runsolver:
+#   total CPU time (s): 1.0646
+"""
+
+VARS = b"""# WCTIME: wall clock time in seconds
+WCTIME=1.105
+# CPUTIME: CPU time in seconds (USERTIME+SYSTEMTIME)
+CPUTIME=1.065
+USERTIME=1.033
+SYSTEMTIME=0.032
+CPUUSAGE=96.3518
+MAXVM=12600
+TIMEOUT=false
+MEMOUT=false
+"""
+
+
+class TestRunsolverParsing(unittest.TestCase):
+
+    def test_watcher(self):
+        report = parse_watcher(WATCHER)
+
+        self.assertTrue(report.timeout)
+        self.assertFalse(report.memout)
+        self.assertIsNone(report.exit_code)
+        self.assertEqual(report.signal, 15)
+        self.assertEqual(report.wall_time, 1.10491)
+        self.assertEqual(report.cpu_time, 1.0646)
+        self.assertEqual(report.user_time, 1.03257)
+        self.assertEqual(report.system_time, 0.032028)
+        self.assertEqual(report.max_vm, 12532)
+        # larger peak of getrusage
+        self.assertEqual(report.max_rss, 9000)
+        self.assertEqual(report.samples, 2)
+        self.assertEqual(report.block_input, 8)
+        self.assertEqual(report.block_output, 16)
+        self.assertEqual(report.voluntary_context_switches, 150)
+        self.assertEqual(report.involuntary_context_switches, 74)
+
+    def test_var_file(self):
+        report = parse_var_file(VARS, report=parse_watcher(WATCHER))
+
+        self.assertEqual(report.wall_time, 1.105)
+        self.assertEqual(report.cpu_time, 1.065)
+        self.assertEqual(report.user_time, 1.033)
+        self.assertEqual(report.system_time, 0.032)
+        self.assertEqual(report.max_vm, 12600)
+        # only in the watcher file
+        self.assertTrue(report.timeout)
+        self.assertEqual(report.signal, 15)
+        self.assertEqual(report.max_rss, 9000)
+
+    def test_old_format(self):
+        report = parse_watcher(b"runsolver_max_memory_limit_exceeded\n"
+                               b"runsolver_cputime: 2.5\n"
+                               b"Child status: 3\n")
+
+        self.assertTrue(report.memout)
+        self.assertEqual(report.cpu_time, 2.5)
+        self.assertEqual(report.exit_code, 3)
+
+    def test_run_with_var_file(self):
+        wrapper = AbstractWrapper()
+        wrapper.data = Data()
+        wrapper.data.tmp_dir = "."
+        wrapper.data.runsolver = get_runsolver()
+        wrapper.data.cutoff = 10
+        wrapper.data.runsolver_var_file = True
+
+        wrapper.call_target(["python", "-c", "import sys; sys.exit(3)"])
+        wrapper.read_runsolver_output()
+
+        with open(wrapper._var_file.name, "rb") as fp:
+            variables = fp.read()
+        for log_file in [wrapper._watcher_file, wrapper._solver_file, wrapper._var_file]:
+            log_file.close()
+            os.remove(log_file.name)
+
+        self.assertIn(b"\nCPUTIME=", variables)
+        report = wrapper._runsolver_report
+        self.assertEqual(wrapper.data.exit_code, 3)
+        self.assertEqual(wrapper.data.time, report.cpu_time)
+        self.assertFalse(report.timeout)
+        self.assertGreater(report.wall_time, 0)
+        self.assertIsNotNone(report.max_vm)
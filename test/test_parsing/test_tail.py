@@ -0,0 +1,52 @@
+import unittest
+import os
+
+from genericWrapper4AC.generic_wrapper import AbstractWrapper
+from genericWrapper4AC.domain_specific.satwrapper import SatOutputParser
+from genericWrapper4AC.data.data import Data
+from test import get_runsolver
+
+
+class TailWrapper(AbstractWrapper):
+
+    def get_output_parser(self):
+        return SatOutputParser()
+
+
+class TestLogTailer(unittest.TestCase):
+
+    def setUp(self):
+        self.runsolver = get_runsolver()
+
+    def test_parsed_during_run(self):
+
+        wrapper = TailWrapper()
+
+        data = Data()
+
+        wrapper.data = data
+        data.tmp_dir = "."
+        data.runsolver = self.runsolver
+        data.mem_limit = 500  # mb
+        data.cutoff = 5
+        data.tail_output = True
+
+        script = "import time, sys\n" \
+                 "print('s SATISFIABLE', flush=True)\n" \
+                 "time.sleep(0.3)\n" \
+                 "print('v 1 -2')\n" \
+                 "print('v 3 0', end='')\n"
+
+        wrapper.call_target(["python", "-c", script])
+
+        # the output must not be read again
+        parser = wrapper.parse_output(filepointer=None)
+
+        wrapper._watcher_file.close()
+        wrapper._solver_file.close()
+        os.remove(wrapper._watcher_file.name)
+        os.remove(wrapper._solver_file.name)
+
+        self.assertEqual(parser.status, "SAT")
+        self.assertEqual(parser.model, [1, -2, 3])
+        self.assertTrue(parser.done)
@@ -0,0 +1,71 @@
+import unittest
+
+from genericWrapper4AC.generic_wrapper import AbstractWrapper
+from genericWrapper4AC.parsing.output_parser import QualityOutputParser
+from test import get_runsolver
+
+
+class AnytimeWrapper(AbstractWrapper):
+
+    def get_command_line_args(self, runargs, config):
+        # reports an improving quality and gets stuck at 5
+        script = "import time\n" \
+                 "for q in [10, 5] + [5] * 10:\n" \
+                 "    print(q, flush=True)\n" \
+                 "    time.sleep(0.1)\n"
+        return ["python", "-c", script]
+
+    def get_output_parser(self):
+        return QualityOutputParser()
+
+    def process_results(self, filepointer, exit_code):
+        output = self.parse_output(filepointer)
+        return {"status": "SUCCESS", "quality": output.trajectory[-1][1]}
+
+
+class TestTrajectory(unittest.TestCase):
+
+    def setUp(self):
+        self.runsolver = get_runsolver()
+
+    def run_wrapper(self, *options):
+        wrapper = AnytimeWrapper()
+        argv = ["wrapper.py", "--instance", "inst", "--cutoff", "10", "--seed", "1",
+                "--runsolver-path", self.runsolver] + list(options) + ["--config"]
+        return wrapper, wrapper.run(argv)
+
+    def test_stop_if_worse(self):
+        wrapper, data = self.run_wrapper("--stop-if-worse-than", "1@0.5",
+                                         "--stop-if-worse-than", "100@0.2")
+
+        self.assertEqual(data.status, "TIMEOUT")
+        self.assertEqual(data.cost, 5)
+        self.assertIn("stopped early", data.additional)
+        self.assertLess(len(data.trajectory), 12)
+        self.assertEqual(data.trajectory[0][1], 10)
+        self.assertLessEqual(data.trajectory[0][0], data.trajectory[1][0])
+
+        result = wrapper.get_result_dict()
+        self.assertEqual(result["trajectory"][1][1], 5)
+
+    def test_not_dominated(self):
+        wrapper, data = self.run_wrapper("--stop-if-worse-than", "5@0.5")
+
+        self.assertEqual(data.status, "SUCCESS")
+        self.assertEqual(len(data.trajectory), 12)
+
+    def test_untimed(self):
+        wrapper, data = self.run_wrapper()
+
+        self.assertEqual(data.status, "SUCCESS")
+        result = wrapper.get_result_dict()
+        self.assertNotIn("trajectory", result)
+        self.assertEqual(result["qualities"], [10, 5] + [5] * 10)
+
+    def test_timed(self):
+        wrapper, data = self.run_wrapper("--tail-solver-output")
+
+        result = wrapper.get_result_dict()
+        self.assertNotIn("qualities", result)
+        self.assertEqual(len(result["trajectory"]), 12)
+        self.assertTrue(all(t is not None for t, _ in result["trajectory"]))
@@ -0,0 +1,18 @@
+import sys
+
+from genericWrapper4AC.domain_specific.satwrapper import SatWrapper
+
+
+class ModelWrapper(SatWrapper):
+    '''
+        "solver" printing the literals of its configuration as model
+    '''
+
+    def get_command_line_args(self, runargs, config):
+        model = " ".join(config[name] for name in sorted(config))
+        return [sys.executable, "-c", "print('s SATISFIABLE\\nv %s 0')" % (model)]
+
+
+if __name__ == "__main__":
+    wrapper = ModelWrapper()
+    wrapper.main()
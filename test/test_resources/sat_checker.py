@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+# minimal SAT checker: sat_checker.py <instance> <solver output>
+import sys
+
+instance, solver_output = sys.argv[1:3]
+
+with open(solver_output) as fp:
+    model = set(int(lit) for line in fp if line.startswith("v ") for lit in line.split()[1:])
+
+with open(instance) as fp:
+    clauses = [set(map(int, line.split()[:-1])) for line in fp
+               if line.strip() and line[0] not in "cp%"]
+
+if all(clause & model for clause in clauses):
+    print("Solution verified")
+else:
+    print("Wrong solution")
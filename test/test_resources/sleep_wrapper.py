@@ -0,0 +1,22 @@
+import sys
+
+from genericWrapper4AC.generic_wrapper import AbstractWrapper
+
+
+class SleepWrapper(AbstractWrapper):
+    '''
+        "target algorithm" sleeping for -time seconds;
+        creates the file <instance> afterwards
+    '''
+
+    def get_command_line_args(self, runargs, config):
+        return [sys.executable, "-c", "import time; time.sleep(%s); open(%r, 'w').close()" % (
+            config["-time"], runargs["instance"])]
+
+    def process_results(self, filepointer, out_args):
+        return {"status": "SUCCESS"}
+
+
+if __name__ == "__main__":
+    wrapper = SleepWrapper()
+    wrapper.main()
@@ -3,14 +3,13 @@ import os
 
 from genericWrapper4AC.generic_wrapper import AbstractWrapper
 from genericWrapper4AC.data.data import Data
+from test import get_runsolver
 
 
 class TestResourceLimits(unittest.TestCase):
 
     def setUp(self):
-        self.runsolver = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)),
-            "test_binaries", "runsolver")
+        self.runsolver = get_runsolver()
 
     def test_memlimit(self):
 
@@ -93,3 +92,29 @@ class TestResourceLimits(unittest.TestCase):
         wrapper._solver_file.close()
         os.remove(wrapper._watcher_file.name)
         os.remove(wrapper._solver_file.name)
+
+
+    def test_argv_and_shell_cmd(self):
+
+        for target_cmd, expected in [(["python", "-c", "print('a  b')"], "a  b\n"),
+                                     ("python -c \"print('a  b')\"", "a  b\n"),
+                                     # requires the compatibility path via a shell
+                                     ("echo '{a}'", "{a}\n")]:
+            wrapper = AbstractWrapper()
+
+            data = Data()
+
+            wrapper.data = data
+            data.tmp_dir = "."
+            data.runsolver = self.runsolver
+            data.mem_limit = 500  # mb
+            data.cutoff = 5
+
+            wrapper.call_target(target_cmd)
+
+            self.assertEqual(wrapper._solver_file.read().decode("utf8"), expected)
+
+            wrapper._watcher_file.close()
+            wrapper._solver_file.close()
+            os.remove(wrapper._watcher_file.name)
+            os.remove(wrapper._solver_file.name)
@@ -0,0 +1,79 @@
+import unittest
+import os
+import sys
+import functools
+
+from genericWrapper4AC.generic_wrapper import AbstractWrapper
+from genericWrapper4AC.data.data import Data
+from genericWrapper4AC.data.resources import RESOURCE_FIELDS, from_rusage, from_runsolver
+from genericWrapper4AC.parsing.runsolver import parse_watcher
+from test import get_runsolver
+
+
+def allocate(n_mb):
+    block = bytearray(n_mb * 1024 ** 2)
+    print(len(block))
+
+
+class TestResources(unittest.TestCase):
+
+    def call(self, target):
+        wrapper = AbstractWrapper()
+        wrapper.data = Data()
+        wrapper.data.tmp_dir = "."
+        wrapper.data.runsolver = get_runsolver()
+        wrapper.data.cutoff = 10
+        wrapper.data.mem_limit = 500
+        wrapper.args, _ = wrapper.parser.parse_known_args([])
+
+        wrapper.call_target(target)
+        wrapper.read_runsolver_output()
+
+        for log_file in [wrapper._watcher_file, wrapper._solver_file]:
+            if log_file is not None:
+                log_file.close()
+                os.remove(log_file.name)
+        return wrapper
+
+    def test_runsolver(self):
+        wrapper = self.call([sys.executable, "-c", "bytearray(50 * 1024 ** 2)"])
+        resources = wrapper.data.resources
+
+        for name in ["wall_time", "user_time", "system_time", "peak_rss_mb",
+                     "voluntary_context_switches", "involuntary_context_switches",
+                     "read_bytes", "write_bytes"]:
+            self.assertIn(name, resources)
+        self.assertGreaterEqual(resources["peak_rss_mb"], 50)
+
+        result = wrapper.get_result_dict()
+        for name in RESOURCE_FIELDS:
+            if name in result:
+                self.assertIsInstance(result[name], (int, float))
+        self.assertEqual(result["peak_rss_mb"], resources["peak_rss_mb"])
+
+    def test_forked_process(self):
+        wrapper = self.call(functools.partial(allocate, 50))
+        resources = wrapper.data.resources
+
+        self.assertEqual(wrapper.data.exit_code, 0)
+        self.assertGreaterEqual(resources["peak_rss_mb"], 50)
+        self.assertGreater(resources["wall_time"], 0)
+        self.assertIn("voluntary_context_switches", resources)
+
+    def test_unsampled_vsize(self):
+        report = parse_watcher(b"Real time (s): 0.09\n"
+                               b"Max. virtual memory (cumulated for all children) (KiB): 0\n"
+                               b"block input operations= 2\n")
+
+        resources = from_runsolver(report)
+        self.assertEqual(resources, {"wall_time": 0.09, "read_bytes": 1024})
+
+    def test_rusage(self):
+        pid = os.fork()
+        if pid == 0:
+            os._exit(0)
+        _, _, rusage = os.wait4(pid, 0)
+
+        resources = from_rusage(rusage, wall_time=0.5)
+        self.assertEqual(set(resources), set(RESOURCE_FIELDS) - set(["peak_vsize_mb", "peak_memory_mb"]))
+        self.assertEqual(resources["wall_time"], 0.5)
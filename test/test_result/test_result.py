@@ -0,0 +1,71 @@
+import unittest
+import os
+import sys
+import json
+import tempfile
+import subprocess
+
+from genericWrapper4AC.data.data import Data
+from genericWrapper4AC.data.result import Result, encode_result
+from genericWrapper4AC.data.resources import RESOURCE_FIELDS
+from test import get_runsolver
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class TestResult(unittest.TestCase):
+
+    def test_slots(self):
+        result = Result(status="SUCCESS", cost=1.5)
+        with self.assertRaises(AttributeError):
+            result.quality = 1
+        self.assertEqual(result, Result(status="SUCCESS", cost=1.5))
+        self.assertNotEqual(result, Result(status="SUCCESS", cost=2))
+
+    def test_data_properties(self):
+        data = Data()
+        self.assertEqual(data.result, Result())
+
+        data.status = "TIMEOUT"
+        data.time = 3
+        data.additional += "; test"
+        self.assertEqual(data.result, Result(status="TIMEOUT", time=3, additional="; test"))
+
+    def test_encode(self):
+        result = {"status": "SUCCESS", "cost": 1.0, "runtime": 0.5, "misc": ""}
+        self.assertEqual(json.loads(encode_result(result).decode("utf8")), result)
+
+    @unittest.skipIf(msgpack is None, "msgpack is not installed")
+    def test_encode_msgpack(self):
+        result = {"status": "SUCCESS", "cost": 1.0, "runtime": 0.5, "misc": ""}
+        self.assertEqual(msgpack.unpackb(encode_result(result, result_format="msgpack")), result)
+
+    def test_result_file_and_fd(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            result_file = os.path.join(tmp_dir, "result.json")
+            read_fd, write_fd = os.pipe()
+
+            cmd = [sys.executable, "examples/MiniSAT/MiniSATWrapper.py",
+                   "--instance", "examples/MiniSAT/gzip_vc1071.cnf",
+                   "--cutoff", "10", "--seed", "42",
+                   "--runsolver-path", get_runsolver(),
+                   "--result-file", result_file,
+                   "--result-fd", str(write_fd),
+                   "--config", "-rnd-freq", "0"]
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, pass_fds=[write_fd],
+                           env=dict(os.environ, PYTHONPATH="."))
+            os.close(write_fd)
+
+            with os.fdopen(read_fd, "rb") as fp:
+                from_fd = json.loads(fp.read().decode("utf8"))
+            with open(result_file) as fp:
+                from_file = json.load(fp)
+
+        self.assertEqual(from_fd, from_file)
+        self.assertEqual(from_file["status"], "SUCCESS")
+        self.assertEqual(set(from_file) - set(RESOURCE_FIELDS),
+                         set(["status", "cost", "runtime", "misc"]))
+        self.assertIn("peak_rss_mb", from_file)
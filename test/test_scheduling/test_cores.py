@@ -0,0 +1,95 @@
+import unittest
+import os
+import tempfile
+
+from genericWrapper4AC.generic_wrapper import AbstractWrapper
+from genericWrapper4AC.data.data import Data
+from genericWrapper4AC.scheduling.cores import CoreScheduler, parse_cpulist
+
+
+class TestCoreScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.lock_dir = tempfile.TemporaryDirectory()
+        # two NUMA nodes with two cores each
+        self.numa_nodes = {0: 0, 1: 1, 2: 0, 3: 1}
+
+    def tearDown(self):
+        self.lock_dir.cleanup()
+
+    def get_scheduler(self):
+        return CoreScheduler(lock_dir=self.lock_dir.name, cores=[0, 1, 2, 3],
+                             numa_nodes=self.numa_nodes)
+
+    def test_disjoint_numa_local(self):
+        # two independent schedulers emulate two wrapper processes
+        alloc1 = self.get_scheduler().acquire(n_cores=2, timeout=0)
+        alloc2 = self.get_scheduler().acquire(n_cores=2, timeout=0)
+
+        self.assertEqual(alloc1.cores, [0, 2])
+        self.assertEqual(alloc2.cores, [1, 3])
+        self.assertEqual(str(alloc1), "0,2")
+
+        # no free cores left
+        self.assertIsNone(self.get_scheduler().acquire(n_cores=1, timeout=0))
+
+        alloc1.release()
+        alloc3 = self.get_scheduler().acquire(n_cores=1, timeout=0)
+        self.assertEqual(alloc3.cores, [0])
+
+    def test_spread_over_nodes(self):
+        alloc1 = self.get_scheduler().acquire(n_cores=1, timeout=0)
+        alloc2 = self.get_scheduler().acquire(n_cores=1, timeout=0)
+        # 1 free core per node: the 3rd allocation has to span both nodes
+        alloc3 = self.get_scheduler().acquire(n_cores=2, timeout=0)
+
+        self.assertEqual(alloc1.cores, [0])
+        self.assertEqual(alloc2.cores, [2])
+        self.assertEqual(alloc3.cores, [1, 3])
+
+    def test_timeout(self):
+        alloc = self.get_scheduler().acquire(n_cores=4, timeout=0)
+        self.assertIsNone(self.get_scheduler().acquire(n_cores=1, timeout=0.1))
+        alloc.release()
+
+    def test_wrapper_abort(self):
+        # all cores are allocated by other wrappers
+        alloc = CoreScheduler(lock_dir=self.lock_dir.name).acquire(
+            n_cores=len(os.sched_getaffinity(0)), timeout=0)
+
+        wrapper = AbstractWrapper()
+        wrapper.data = Data()
+        wrapper.data.tmp_dir = "."
+        wrapper.data.cores_per_run = 1
+        wrapper.data.core_lock_dir = self.lock_dir.name
+        wrapper.data.core_wait_timeout = 0.1
+        with self.assertRaises(SystemExit):
+            wrapper.call_target(["true"])
+        alloc.release()
+
+        self.assertEqual(wrapper.data.status, "ABORT")
+        self.assertIn("; no 1 free cores within 0.1 seconds", wrapper.data.additional)
+        # no log files were created
+        self.assertIsNone(wrapper._watcher_file)
+
+    def test_too_many_cores(self):
+        self.assertRaises(ValueError, self.get_scheduler().acquire, n_cores=5)
+
+    def test_wrapper_too_many_cores(self):
+        n_cores = len(os.sched_getaffinity(0)) + 1
+
+        wrapper = AbstractWrapper()
+        wrapper.data = Data()
+        wrapper.data.tmp_dir = "."
+        wrapper.data.cores_per_run = n_cores
+        wrapper.data.core_lock_dir = self.lock_dir.name
+        with self.assertRaises(SystemExit):
+            wrapper.call_target(["true"])
+
+        self.assertEqual(wrapper.data.status, "ABORT")
+        self.assertIn("; Cannot allocate %d cores" % (n_cores), wrapper.data.additional)
+        self.assertIsNone(wrapper._watcher_file)
+
+    def test_parse_cpulist(self):
+        self.assertEqual(parse_cpulist("0-3,8,10-11\n".strip()),
+                         [0, 1, 2, 3, 8, 10, 11])
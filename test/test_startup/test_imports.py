@@ -0,0 +1,93 @@
+import unittest
+import os
+import sys
+import tempfile
+import subprocess
+
+# cumulative import time (microseconds) of the wrapper entry point;
+# about 50ms (more than 100ms with eager imports)
+STARTUP_BUDGET = 100000
+
+# modules only needed by optional features
+OPTIONAL_MODULES = ["asyncio", "sqlite3", "ctypes", "socket", "json", "resource",
+                    "concurrent.futures", "genericWrapper4AC.cache.run_cache",
+                    "genericWrapper4AC.limits.cgroup", "genericWrapper4AC.inprocess.forked_process",
+                    "genericWrapper4AC.parsing.tail", "genericWrapper4AC.scheduling.cores",
+                    "genericWrapper4AC.capture.fifo"]
+
+IMPORT = "import genericWrapper4AC.generic_wrapper"
+
+PARSE_OLD = IMPORT + """
+from genericWrapper4AC.argparser.parse import parse
+wrapper = genericWrapper4AC.generic_wrapper.AbstractWrapper()
+parse(["wrapper.py", "instance", "0", "10", "0", "1", "-x", "1"], parser=wrapper.parser)
+"""
+
+PARSE_NEW = IMPORT + """
+from genericWrapper4AC.argparser.parse import parse
+wrapper = genericWrapper4AC.generic_wrapper.AbstractWrapper()
+parse(["wrapper.py", "--instance", "instance", "--cutoff", "10", "--seed", "1",
+       "--config", "-x", "1"], parser=wrapper.parser)
+"""
+
+# SatWrapper: modules only needed to verify the output
+# (bz2, lzma and fcntl are imported by tempfile and subprocess anyway)
+SAT_OPTIONAL_MODULES = ["sqlite3", "mmap", "hashlib",
+                        "genericWrapper4AC.domain_specific.solubility",
+                        "genericWrapper4AC.domain_specific.cnf",
+                        "genericWrapper4AC.domain_specific.cnf_cache"]
+
+SAT_PARSE_NEW = """
+from genericWrapper4AC.domain_specific.satwrapper import SatWrapper
+from genericWrapper4AC.argparser.parse import parse
+wrapper = SatWrapper()
+parse(["wrapper.py", "--instance", "instance", "--cutoff", "10", "--seed", "1",
+       "--config", "-x", "1"], parser=wrapper.parser)
+"""
+
+
+class TestImports(unittest.TestCase):
+
+    def setUp(self):
+        self.env = dict(os.environ, PYTHONPATH=".")
+        self.cwd = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    def loaded_modules(self, code: str):
+        output = subprocess.check_output(
+            [sys.executable, "-c", code + "\nimport sys\nprint(' '.join(sys.modules))"],
+            env=self.env, cwd=self.cwd, universal_newlines=True)
+        return set(output.split())
+
+    def import_time(self, env: dict):
+        stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", IMPORT],
+                                env=env, cwd=self.cwd, stderr=subprocess.PIPE,
+                                universal_newlines=True, check=True).stderr
+        for line in stderr.splitlines():
+            fields = [field.strip() for field in line.split("|")]
+            if fields[-1] == "genericWrapper4AC.generic_wrapper":
+                return int(fields[1])
+        self.fail("no import time reported")
+
+    def test_no_optional_modules(self):
+        for code in [IMPORT, PARSE_OLD, PARSE_NEW]:
+            loaded = self.loaded_modules(code)
+            self.assertIn("genericWrapper4AC.generic_wrapper", loaded)
+            for module in OPTIONAL_MODULES:
+                self.assertNotIn(module, loaded, msg=code)
+
+    def test_sat_wrapper(self):
+        loaded = self.loaded_modules(SAT_PARSE_NEW)
+        self.assertIn("genericWrapper4AC.domain_specific.satwrapper", loaded)
+        for module in OPTIONAL_MODULES + SAT_OPTIONAL_MODULES:
+            self.assertNotIn(module, loaded)
+
+    def test_startup_budget(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # with bytecode cache (as for installed packages);
+            # the first run compiles the modules
+            env = dict(self.env, PYTHONPYCACHEPREFIX=cache_dir)
+            env.pop("PYTHONDONTWRITEBYTECODE", None)
+            self.import_time(env)
+            # minimum of a few runs to be robust against noise
+            import_time = min(self.import_time(env) for _ in range(3))
+        self.assertLess(import_time, STARTUP_BUDGET)
@@ -0,0 +1,95 @@
+import unittest
+import sys
+import time
+import signal
+
+from subprocess import Popen
+
+from genericWrapper4AC.supervision.supervisor import ProcessSupervisor, read_stat
+
+
+def running(pid):
+    stat = read_stat(pid)
+    return stat is not None and stat[0] not in ("Z", "X")
+
+
+class TestSupervisor(unittest.TestCase):
+
+    def start(self, cmd):
+        return ProcessSupervisor(Popen(cmd, start_new_session=True))
+
+    def test_wait_kills_leftovers(self):
+        supervisor = self.start(["/bin/sh", "-c", "sleep 100 & echo $! > /dev/null"])
+
+        self.assertEqual(supervisor.wait(), 0)
+        self.assertIsNotNone(supervisor.rusage)
+        self.assertEqual(supervisor.members(), set())
+
+    def test_terminate_returns_immediately(self):
+        supervisor = self.start(["/bin/sh", "-c", "sleep 100 & sleep 100"])
+        time.sleep(0.2)
+        members = supervisor.members()
+        self.assertEqual(len(members), 3)
+
+        start_time = time.monotonic()
+        supervisor.terminate(grace=5)
+        self.assertLess(time.monotonic() - start_time, 2)
+        supervisor.process.wait()
+        self.assertFalse(any(running(pid) for pid in members))
+
+    def test_terminate_escalates(self):
+        # ignores SIGTERM and starts a child in a new process group
+        code = "import os, signal, subprocess, time; " \
+               "signal.signal(signal.SIGTERM, signal.SIG_IGN); " \
+               "subprocess.Popen(['sleep', '100'], preexec_fn=lambda: os.setpgid(0, 0)); " \
+               "time.sleep(100)"
+        supervisor = self.start([sys.executable, "-c", code])
+        time.sleep(0.5)
+        members = supervisor.members()
+        self.assertEqual(len(members), 2)
+
+        start_time = time.monotonic()
+        supervisor.terminate(grace=0.5)
+        self.assertGreaterEqual(time.monotonic() - start_time, 0.5)
+        self.assertLess(time.monotonic() - start_time, 3)
+        supervisor.process.wait()
+        self.assertFalse(any(running(pid) for pid in members))
+
+    def test_terminate_process_group(self):
+        # the root exits on SIGTERM, its child ignores SIGTERM
+        code = "import signal, subprocess, time; " \
+               "subprocess.Popen(['python', '-c', 'import signal, time; " \
+               "signal.signal(signal.SIGTERM, signal.SIG_IGN); time.sleep(100)']); " \
+               "time.sleep(100)"
+        supervisor = ProcessSupervisor(Popen([sys.executable, "-c", code], start_new_session=True),
+                                       orphans=False)
+        time.sleep(0.5)
+        members = supervisor.members()
+        self.assertEqual(len(members), 2)
+
+        supervisor.terminate(grace=0.5)
+        # the root was reaped (no zombie) and the child was killed
+        self.assertEqual(supervisor.returncode, -signal.SIGTERM)
+        self.assertIsNone(read_stat(supervisor.pid))
+        time.sleep(0.1)
+        self.assertFalse(any(running(pid) for pid in members))
+
+    def test_process_group_only(self):
+        supervisor = ProcessSupervisor(Popen(["/bin/sh", "-c", "sleep 100 & sleep 0.1"],
+                                             start_new_session=True), orphans=False)
+        time.sleep(0.05)
+        members = supervisor.members()
+
+        self.assertEqual(supervisor.wait(), 0)
+        self.assertIsNotNone(supervisor.rusage)
+        time.sleep(0.1)
+        self.assertFalse(any(running(pid) for pid in members))
+
+    def test_recycled_root(self):
+        supervisor = self.start(["sleep", "100"])
+        # as if the pid of the root belonged to another process
+        supervisor._root_start = -1
+
+        self.assertEqual(supervisor.members(), set())
+        supervisor.process.kill()
+        supervisor.process.wait()
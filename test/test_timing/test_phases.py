@@ -0,0 +1,91 @@
+import unittest
+import os
+import sys
+import json
+import time
+import tempfile
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+
+from genericWrapper4AC.timing.phases import PHASES, PhaseTimer, process_age, update_histogram
+from test import get_runsolver
+
+
+def add_run(path):
+    update_histogram(path, {"cleanup": 0.003})
+
+
+class TestPhases(unittest.TestCase):
+
+    def test_nested_phases(self):
+        timer = PhaseTimer()
+        with timer.phase("result_parse"):
+            time.sleep(0.02)
+            with timer.phase("verification"):
+                time.sleep(0.05)
+        with timer.phase("argument_parsing"):
+            pass
+
+        timings = timer.get_timings()
+        self.assertEqual(list(timings), ["argument_parsing", "result_parse", "verification"])
+        self.assertGreaterEqual(timings["verification"], 0.05)
+        # the nested phase is not counted twice
+        self.assertGreaterEqual(timings["result_parse"], 0.02)
+        self.assertLess(timings["result_parse"], 0.05)
+        self.assertLess(timer.timestamps["result_parse"], timer.timestamps["verification"])
+
+    def test_process_age(self):
+        age = process_age()
+        self.assertIsNotNone(age)
+        self.assertGreaterEqual(age, 0)
+
+        child = subprocess.run([sys.executable, "-c",
+                                "from genericWrapper4AC.timing.phases import process_age; "
+                                "print(process_age())"],
+                               stdout=subprocess.PIPE, check=True, env=dict(os.environ, PYTHONPATH="."))
+        self.assertLess(float(child.stdout), 5)
+
+    def test_histogram(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "timings.json")
+            update_histogram(path, {"cleanup": 0.0004, "argument_parsing": 0.01})
+            with ProcessPoolExecutor(max_workers=4) as executor:
+                list(executor.map(add_run, [path] * 8))
+
+            with open(path) as fp:
+                histogram = json.load(fp)
+
+        self.assertEqual(histogram["runs"], 9)
+        cleanup = histogram["phases"]["cleanup"]
+        self.assertEqual(cleanup["count"], 9)
+        self.assertEqual(cleanup["bins"], {"0.0005": 1, "0.005": 8})
+        self.assertEqual(cleanup["min"], 0.0004)
+        self.assertEqual(histogram["phases"]["argument_parsing"]["bins"], {"0.01": 1})
+
+    def test_report_timings(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            result_file = os.path.join(tmp_dir, "result.json")
+            histogram_file = os.path.join(tmp_dir, "timings.json")
+
+            cmd = [sys.executable, "examples/MiniSAT/MiniSATWrapper.py",
+                   "--instance", "examples/MiniSAT/gzip_vc1071.cnf",
+                   "--cutoff", "10", "--seed", "42",
+                   "--runsolver-path", get_runsolver(),
+                   "--temp-file-dir", tmp_dir,
+                   "--result-file", result_file,
+                   "--report-timings",
+                   "--timing-histogram", histogram_file,
+                   "--config", "-rnd-freq", "0"]
+            subprocess.run(cmd, stdout=subprocess.DEVNULL,
+                           env=dict(os.environ, PYTHONPATH="."))
+
+            with open(result_file) as fp:
+                result = json.load(fp)
+            with open(histogram_file) as fp:
+                histogram = json.load(fp)
+
+        self.assertEqual(result["status"], "SUCCESS")
+        self.assertEqual(list(result["timings"]), PHASES)
+        self.assertGreater(result["timings"]["target_exit"], 0)
+        self.assertEqual(histogram["runs"], 1)
+        self.assertEqual(set(histogram["phases"]), set(PHASES))